@@ -7,7 +7,7 @@ from django.contrib import messages
 from rest_framework.authtoken.admin import TokenAdmin
 from rest_framework.authtoken.models import TokenProxy
 
-from firefighter.api.models import APITokenProxy
+from firefighter.api.models import APITokenProxy, APITokenUsage
 from firefighter.firefighter.admin import admin_custom as admin
 from firefighter.incidents.models.user import User
 
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from django.db.models import ForeignKey
     from django.db.models.query import QuerySet
     from django.forms import ModelChoiceField, ModelForm
@@ -29,6 +31,19 @@ class APITokenAdmin(TokenAdmin):
     Add supports for custom permissions.
     """
 
+    list_display = ("key", "user", "created", "last_used_at", "calls")
+    list_select_related = ("user", "usage")
+
+    @admin.display(description="Last used at", ordering="usage__last_used_at")
+    def last_used_at(self, obj: APITokenProxy) -> datetime | None:
+        usage: APITokenUsage | None = getattr(obj, "usage", None)
+        return usage.last_used_at if usage else None
+
+    @admin.display(description="Calls", ordering="usage__calls")
+    def calls(self, obj: APITokenProxy) -> int:
+        usage: APITokenUsage | None = getattr(obj, "usage", None)
+        return usage.calls if usage else 0
+
     def formfield_for_foreignkey(
         self,
         db_field: ForeignKey[Any, Any],
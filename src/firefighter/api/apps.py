@@ -7,3 +7,6 @@ class ApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     label = "api"
     name = "firefighter.api"
+
+    def ready(self) -> None:
+        from firefighter.api import conditional, token_cache
@@ -12,11 +12,15 @@ if TYPE_CHECKING:
     from django.db.models import Model
     from rest_framework.request import Request
 
+    from firefighter.api.models import APIToken
     from firefighter.incidents.models.user import User
 
 
 class BearerTokenAuthentication(TokenAuthentication):
-    """To use `Authorization: Bearer <token>` instead of `Authorization: Token <token>`."""
+    """To use `Authorization: Bearer <token>` instead of `Authorization: Token <token>`.
+
+    Valid tokens are cached, and their usage recorded in batches (see [firefighter.api.token_cache][]).
+    """
 
     keyword = "Bearer"
 
@@ -25,6 +29,24 @@ class BearerTokenAuthentication(TokenAuthentication):
 
         return APIToken
 
+    def authenticate_credentials(self, key: str) -> tuple[User, APIToken]:
+        from firefighter.api.models import APIToken
+        from firefighter.api.token_cache import (
+            cache_token_user,
+            get_cached_token_user,
+            record_token_usage,
+        )
+
+        user = get_cached_token_user(key)
+        if user is None:
+            user, token = super().authenticate_credentials(key)
+            cache_token_user(key, user)
+        else:
+            # Not loaded from the database: only `key` and `user` are set
+            token = APIToken(key=key, user=user)
+        record_token_usage(user.pk)
+        return user, token
+
 
 class JiraHmacWebhookAuthentication(BaseAuthentication):
     """Authenticate Jira webhook callers via the `X-Hub-Signature` header.
@@ -0,0 +1,161 @@
+"""Conditional GET for the read API viewsets, so polling clients don't download the same payload over and over.
+
+Responses of [ConditionalGetMixin][firefighter.api.conditional.ConditionalGetMixin] carry an `ETag`, and `304 Not Modified` is returned,
+without serializing anything, if the client sends it back in `If-None-Match` and the data has not changed:
+
+- lists: the validator is the last `updated_at` and the number of rows of the filtered queryset, computed with one aggregate query.
+- details: the validator is the `updated_at` of the object, also sent as `Last-Modified` (for `If-Modified-Since`).
+
+The validators also hold the representation (URL with its query parameters, and media type), and a global version token
+([get_related_version][firefighter.api.conditional.get_related_version]), renewed when objects nested in the payloads
+but that don't update their parent are saved or deleted (e.g. incident metrics, costs, roles, tags, or a renamed priority).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any, Never
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch.dispatcher import receiver
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+
+from firefighter.incidents.models.environment import Environment
+from firefighter.incidents.models.group import Group
+from firefighter.incidents.models.incident import Incident
+from firefighter.incidents.models.incident_category import IncidentCategory
+from firefighter.incidents.models.incident_cost import IncidentCost
+from firefighter.incidents.models.incident_membership import IncidentRole
+from firefighter.incidents.models.metric_type import IncidentMetric
+from firefighter.incidents.models.priority import Priority
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from django.db.models import QuerySet
+    from rest_framework.request import Request
+
+RELATED_VERSION_CACHE_KEY = "api:conditional:related_version"
+RELATED_VERSION_MAX_AGE = timedelta(days=1)
+"""Bounds the staleness of nested objects without signals (e.g. a renamed user)."""
+
+
+def get_related_version() -> str:
+    """Returns the version token of the objects nested in the API payloads, creating it if needed."""
+    version: str | None = cache.get(RELATED_VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid4().hex
+        # Another request may have created it in the meantime
+        if not cache.add(
+            RELATED_VERSION_CACHE_KEY,
+            version,
+            timeout=int(RELATED_VERSION_MAX_AGE.total_seconds()),
+        ):
+            version = cache.get(RELATED_VERSION_CACHE_KEY, version)
+    return version
+
+
+def invalidate_related_version() -> None:
+    """Renews the version token, now and after the current transaction is committed.
+
+    The second invalidation prevents a concurrent request from tagging data of before the commit with the new version.
+    """
+    cache.delete(RELATED_VERSION_CACHE_KEY)
+    transaction.on_commit(partial(cache.delete, RELATED_VERSION_CACHE_KEY))
+
+
+def make_etag(request: Request, *parts: Any) -> str:
+    """Returns a quoted ETag for a representation (URL and media type) of some data."""
+    digest = hashlib.sha256(
+        "|".join(
+            str(part)
+            for part in (
+                request.get_full_path(),
+                request.accepted_media_type,
+                get_related_version(),
+                *parts,
+            )
+        ).encode()
+    ).hexdigest()
+    return quote_etag(digest[:32])
+
+
+class ConditionalGetMixin[T: Model](GenericAPIView[T]):
+    """Adds conditional GET to the `list` and `retrieve` actions of a viewset. The model must have an `updated_at` field.
+
+    Viewsets that customize the serialization of their list override
+    [list_response][firefighter.api.conditional.ConditionalGetMixin.list_response], not `list`.
+    """
+
+    def list(self, request: Request, *args: Never, **kwargs: Never) -> Response:
+        queryset = self.filter_queryset(self.get_queryset())
+        validators = queryset.order_by().aggregate(
+            last_updated_at=Max("updated_at"), count=Count("pk")
+        )
+        etag = make_etag(request, validators["last_updated_at"], validators["count"])
+        not_modified = self.get_not_modified_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+        response = self.list_response(queryset)
+        response["ETag"] = etag
+        return response
+
+    def list_response(self, queryset: QuerySet[T]) -> Response:
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    def retrieve(self, request: Request, *args: Never, **kwargs: Never) -> Response:
+        instance = self.get_object()
+        updated_at: datetime = instance.updated_at  # type: ignore[attr-defined]
+        etag = make_etag(request, instance.pk, updated_at.isoformat())
+        last_modified = int(updated_at.timestamp())
+        not_modified = self.get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        response = Response(self.get_serializer(instance).data)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    @staticmethod
+    def get_not_modified_response(
+        request: Request, etag: str, last_modified: int | None = None
+    ) -> Response | None:
+        """Returns an empty `304 Not Modified` (or `412 Precondition Failed`) response if the preconditions of the request say so, None otherwise."""
+        conditional_response = get_conditional_response(
+            request._request,  # noqa: SLF001
+            etag=etag,
+            last_modified=last_modified,
+        )
+        if conditional_response is None:
+            return None
+        headers = {"ETag": etag}
+        if last_modified is not None:
+            headers["Last-Modified"] = http_date(last_modified)
+        return Response(status=conditional_response.status_code, headers=headers)
+
+
+@receiver(post_delete, sender=IncidentMetric)
+@receiver(post_save, sender=IncidentMetric)
+@receiver(post_delete, sender=IncidentCost)
+@receiver(post_save, sender=IncidentCost)
+@receiver(post_delete, sender=IncidentRole)
+@receiver(post_save, sender=IncidentRole)
+@receiver(m2m_changed, sender=Incident.tags.through)
+@receiver(post_save, sender=Priority)
+@receiver(post_save, sender=Environment)
+@receiver(post_save, sender=IncidentCategory)
+@receiver(post_save, sender=Group)
+def nested_object_changed(sender: Any, **kwargs: Any) -> None:
+    if kwargs.get("raw"):
+        return
+    invalidate_related_version()
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-18 22:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("authtoken", "0004_alter_tokenproxy_options"),
+        ("api", "0003_alter_apitokenproxy_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="APITokenUsage",
+            fields=[
+                (
+                    "token",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="usage",
+                        serialize=False,
+                        to="authtoken.token",
+                    ),
+                ),
+                ("last_used_at", models.DateTimeField(blank=True, null=True)),
+                ("calls", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "API Token usage",
+                "verbose_name_plural": "API Tokens usage",
+            },
+        ),
+    ]
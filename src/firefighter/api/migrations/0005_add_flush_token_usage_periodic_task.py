@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+def create_flush_token_usage_task(apps, schema_editor):
+    """Create the periodic task writing the API token usage counted in Redis to the database, every minute."""
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    schedule, _ = IntervalSchedule.objects.get_or_create(every=1, period="minutes")
+
+    PeriodicTask.objects.get_or_create(
+        name="Flush API token usage",
+        defaults={
+            "task": "api.flush_token_usage",
+            "interval": schedule,
+            "enabled": True,
+            "description": "Write the last use and number of calls of the API tokens, counted in Redis, to the database",
+        },
+    )
+
+
+def remove_flush_token_usage_task(apps, schema_editor):
+    """Remove the periodic task on migration rollback."""
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    PeriodicTask.objects.filter(task="api.flush_token_usage").delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0004_apitokenusage"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_flush_token_usage_task,
+            reverse_code=remove_flush_token_usage_task,
+        ),
+    ]
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Self, cast
+from typing import TYPE_CHECKING, ClassVar, Self
 
 from django.conf import settings
+from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django_stubs_ext.db.models import TypedModelMeta
 from rest_framework.authtoken.models import Token
@@ -12,6 +13,29 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
 
+class APITokenUsage(models.Model):
+    """Last use and number of calls of an API token.
+
+    Not updated on each call: the calls are counted in Redis, and written in batches by [flush_token_usage][firefighter.api.token_cache.flush_token_usage].
+    """
+
+    token = models.OneToOneField(
+        "authtoken.Token",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="usage",
+    )
+    last_used_at = models.DateTimeField(null=True, blank=True)
+    calls = models.PositiveBigIntegerField(default=0)
+
+    class Meta(TypedModelMeta):
+        verbose_name = _("API Token usage")
+        verbose_name_plural = _("API Tokens usage")
+
+    def __str__(self) -> str:
+        return f"{self.calls} calls, last used at {self.last_used_at}"
+
+
 class APIToken(Token):
     class Meta(TypedModelMeta):
         default_permissions: ClassVar[Sequence[str]] = []
@@ -24,9 +48,10 @@ class APITokenProxy(APIToken):
     Overrides default permissions.
     """
 
-    @property
-    def pk(self: Self) -> uuid.UUID:
-        return cast("uuid.UUID", self.user_id)  # pyright: ignore[reportGeneralTypeIssues]
+    # The reverse relation of APITokenUsage makes the mypy Django plugin type pk and user_id on this class
+    @property  # type: ignore[no-redef]
+    def pk(self: Self) -> uuid.UUID:  # type: ignore[override]
+        return self.user_id  # pyright: ignore[reportGeneralTypeIssues]
 
     class Meta(TypedModelMeta):
         permissions = [
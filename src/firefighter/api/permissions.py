@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from rest_framework.permissions import DjangoModelPermissions
 
+if TYPE_CHECKING:
+    from django.db.models import Model
+
 
 class StrictDjangoModelPermissions(DjangoModelPermissions):
     """Custom class to restrict GET requests."""
@@ -16,3 +21,14 @@ class StrictDjangoModelPermissions(DjangoModelPermissions):
         "PATCH": ["%(app_label)s.change_%(model_name)s"],
         "DELETE": ["%(app_label)s.delete_%(model_name)s"],
     }
+
+
+class IncidentEventPermissions(StrictDjangoModelPermissions):
+    """The incident events expose the incidents: requires the permissions on incidents."""
+
+    def get_required_permissions(
+        self, method: str, _model_cls: type[Model]
+    ) -> list[str]:
+        from firefighter.incidents.models.incident import Incident
+
+        return super().get_required_permissions(method, Incident)
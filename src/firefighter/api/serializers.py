@@ -4,6 +4,7 @@ import logging
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from django.apps import apps
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.validators import EmailValidator
 from django.db import IntegrityError
@@ -23,6 +24,7 @@ from firefighter.incidents.models.incident import Incident
 from firefighter.incidents.models.incident_category import IncidentCategory
 from firefighter.incidents.models.incident_cost import IncidentCost
 from firefighter.incidents.models.incident_cost_type import IncidentCostType
+from firefighter.incidents.models.incident_event import IncidentEvent
 from firefighter.incidents.models.incident_membership import IncidentRole
 from firefighter.incidents.models.metric_type import IncidentMetric, MetricType
 from firefighter.incidents.models.priority import Priority
@@ -274,7 +276,10 @@ class IncidentSerializer(TaggitSerializer, serializers.ModelSerializer[Incident]
     @staticmethod
     def get_postmortem_url(obj: Incident) -> str | None:
         """Return the Confluence post-mortem page URL if it exists."""
-        if hasattr(obj, "postmortem_for"):
+        # The relation is registered even when the Confluence app is not installed
+        if apps.is_installed("firefighter.confluence") and hasattr(
+            obj, "postmortem_for"
+        ):
             return obj.postmortem_for.page_url
         return None
 
@@ -356,3 +361,14 @@ class IncidentSerializer(TaggitSerializer, serializers.ModelSerializer[Incident]
             "ignore",
             "dedup_key",
         ]
+
+
+class IncidentEventSerializer(serializers.ModelSerializer[IncidentEvent]):
+    """Same representation as [IncidentEvent.to_payload][firefighter.incidents.models.incident_event.IncidentEvent.to_payload], sent in the stream."""
+
+    type = serializers.CharField(source="event_type")
+    incident_id = serializers.IntegerField()
+
+    class Meta:
+        model = IncidentEvent
+        fields = ["id", "type", "incident_id", "created_at", "data"]
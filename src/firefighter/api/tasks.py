@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from celery import shared_task
+
+from firefighter.api.token_cache import flush_token_usage as flush_token_usage_to_db
+
+
+@shared_task(name="api.flush_token_usage", ignore_result=True)
+def flush_token_usage() -> int:
+    """Writes the API token calls counted in Redis to the database. Scheduled every minute."""
+    return flush_token_usage_to_db()
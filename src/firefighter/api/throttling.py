@@ -0,0 +1,209 @@
+"""Rate limiting and concurrency lanes of the API, stored in Redis so they are shared by all the web workers.
+
+Each API view belongs to a lane, set with DRF's `throttle_scope` attribute (`default` if not set),
+or per action of a viewset with its `action_throttle_scopes` (e.g. `{"list": "bulk"}`):
+
+- `critical`: incident creation and webhooks (Landbot, Jira). Not rate limited, and never waits for the other lanes.
+- `default`: the other endpoints.
+- `bulk`: large reads and exports, like the incident list.
+
+[SlidingWindowThrottle][firefighter.api.throttling.SlidingWindowThrottle] limits the number of requests of each client (API token, user or IP)
+per view, with a sliding window, at the rate of the lane in `REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]`.
+
+[ApiLaneMiddleware][firefighter.firefighter.middleware.ApiLaneMiddleware] limits the number of requests of a lane processed at the same time,
+for the lanes in `FF_API_LANE_CONCURRENCY`, so bulk reads can't take all the web workers.
+
+Throttled requests get a 429 response with a `Retry-After` header, and are logged to the `firefighter.observability` logger (`ff.metric: api.throttled`).
+If Redis is not available, requests are not throttled.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, cast
+from uuid import uuid4
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+if TYPE_CHECKING:
+    from rest_framework.request import Request
+    from rest_framework.views import APIView
+
+logger = logging.getLogger("firefighter.observability")
+
+DEFAULT_LANE = "default"
+THROTTLE_KEY = "firefighter:api_throttle:{lane}:{view}:{client}"
+LANE_SLOTS_KEY = "firefighter:api_lane:{lane}"
+LANE_SLOT_MAX_AGE = timedelta(minutes=2)
+"""A slot not released after this delay (e.g. the worker was killed) is freed. Longer than the request timeout."""
+
+_DURATIONS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Atomic, so concurrent requests of the same client can't all pass the limit.
+# Returns (allowed, requests in the window, milliseconds before a request is allowed).
+_SLIDING_WINDOW_SCRIPT = """
+local now, window, limit = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return {1, count + 1, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, count, tonumber(oldest[2]) + window - now}
+"""
+
+_ACQUIRE_SLOT_SCRIPT = """
+local now, max_age, limit = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - max_age)
+if redis.call('ZCARD', KEYS[1]) < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], max_age)
+    return 1
+end
+return 0
+"""
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """Parses a DRF rate like `60/min` or `1000/day`.
+
+    Returns:
+        tuple[int, int]: Number of requests, and duration of the window in seconds.
+    """
+    num, period = rate.split("/")
+    return int(num), _DURATIONS[period[0]]
+
+
+def get_lane(view: Any, action: str | None = None) -> str:
+    """Returns the lane of a view (or view class) for an action, from its `action_throttle_scopes` or its `throttle_scope`."""
+    action_scopes: dict[str, str] = getattr(view, "action_throttle_scopes", {})
+    return (
+        action_scopes.get(action or "")
+        or getattr(view, "throttle_scope", None)
+        or DEFAULT_LANE
+    )
+
+
+def log_throttled(lane: str, view: str, reason: str, wait: float) -> None:
+    logger.info(
+        "API request throttled: %s (%s lane, %s)",
+        view,
+        lane,
+        reason,
+        extra={
+            "ff.metric": "api.throttled",
+            "ff.lane": lane,
+            "ff.view": view,
+            "ff.reason": reason,
+            "ff.retry_after": wait,
+        },
+    )
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """Limits the requests of each client per view, at the rate of the lane of the view.
+
+    Clients are identified by their user (there is one API token per user), or their IP if they are not authenticated.
+    Lanes without a rate (e.g. `critical`) are not limited.
+    """
+
+    def __init__(self) -> None:
+        self.retry_after: float | None = None
+
+    def get_client_ident(self, request: Request) -> str:
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        return f"ip:{self.get_ident(request)}"
+
+    def allow_request(self, request: Request, view: APIView) -> bool:
+        lane = get_lane(view, getattr(view, "action", None))
+        rate = cast("str | None", api_settings.DEFAULT_THROTTLE_RATES.get(lane))
+        if rate is None:
+            return True
+        limit, duration = parse_rate(rate)
+        view_name = type(view).__name__
+        key = THROTTLE_KEY.format(
+            lane=lane, view=view_name, client=self.get_client_ident(request)
+        )
+        try:
+            script = get_redis_connection("default").register_script(
+                _SLIDING_WINDOW_SCRIPT
+            )
+            allowed, _count, wait_ms = script(
+                keys=[key], args=[_now_ms(), duration * 1000, limit, uuid4().hex]
+            )
+        except RedisError:
+            logger.warning("Could not check the API rate limit.", exc_info=True)
+            return True
+        if allowed:
+            return True
+        self.retry_after = max(math.ceil(int(wait_ms) / 1000), 1)
+        log_throttled(lane, view_name, "rate", self.retry_after)
+        return False
+
+    def wait(self) -> float | None:
+        return self.retry_after
+
+
+class LaneFullError(Exception):
+    """All the slots of a lane are taken."""
+
+    retry_after = 1
+
+    def __init__(self, lane: str) -> None:
+        self.lane = lane
+        super().__init__(f"All the slots of the {lane} lane are taken.")
+
+
+def acquire_lane_slot(lane: str) -> str | None:
+    """Takes a slot in a lane, if the lane has a concurrency limit in `FF_API_LANE_CONCURRENCY`.
+
+    Returns:
+        str | None: The slot to release with [release_lane_slot][firefighter.api.throttling.release_lane_slot], or None if the lane is not limited.
+
+    Raises:
+        LaneFullError: If all the slots of the lane are taken.
+    """
+    limit: int | None = settings.FF_API_LANE_CONCURRENCY.get(lane)
+    if not limit:
+        return None
+    slot = uuid4().hex
+    try:
+        script = get_redis_connection("default").register_script(
+            _ACQUIRE_SLOT_SCRIPT
+        )
+        acquired = script(
+            keys=[LANE_SLOTS_KEY.format(lane=lane)],
+            args=[
+                _now_ms(),
+                int(LANE_SLOT_MAX_AGE.total_seconds() * 1000),
+                limit,
+                slot,
+            ],
+        )
+    except RedisError:
+        logger.warning("Could not check the API lane concurrency.", exc_info=True)
+        return None
+    if not acquired:
+        raise LaneFullError(lane)
+    return slot
+
+
+def release_lane_slot(lane: str, slot: str) -> None:
+    try:
+        get_redis_connection("default").zrem(LANE_SLOTS_KEY.format(lane=lane), slot)
+    except RedisError:
+        logger.warning("Could not release an API lane slot.", exc_info=True)
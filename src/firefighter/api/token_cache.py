@@ -0,0 +1,223 @@
+"""Cache of the API tokens for [BearerTokenAuthentication][firefighter.api.authentication.BearerTokenAuthentication], and batched recording of their usage.
+
+Integrations poll the API heavily, so the user of a token is cached, instead of querying the token and its user on each call:
+
+- in the cache (Redis), keyed by a SHA-256 digest of the token, so the tokens are not stored in clear.
+  The entry holds the user and a signature of the digest and the user ID: an entry that was not written by us (or for another token) is ignored.
+- in the process memory, for a few seconds ([API_TOKEN_LOCAL_MAX_AGE][firefighter.api.token_cache.API_TOKEN_LOCAL_MAX_AGE]).
+
+The entries are invalidated when a token is deleted (revoked), or when its user is saved (e.g. deactivated).
+The cache and the current process are invalidated right away, the other processes within `API_TOKEN_LOCAL_MAX_AGE`.
+
+If `FF_API_TOKEN_USAGE` is enabled, each call increments a counter in Redis, and [flush_token_usage][firefighter.api.token_cache.flush_token_usage]
+writes the counters to [APITokenUsage][firefighter.api.models.APITokenUsage] periodically (Celery beat), so there is no database write on each call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypedDict
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signing import BadSignature, Signer
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch.dispatcher import receiver
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework.authtoken.models import Token
+
+from firefighter.api.models import APITokenUsage
+from firefighter.incidents.models.user import User
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+API_TOKEN_CACHE_KEY = "api:token:{digest}"  # noqa: S105
+API_TOKEN_LOCAL_MAX_AGE = timedelta(seconds=10)
+"""How long a token is kept in the memory of a process. Other processes see an invalidation after at most this delay."""
+_LOCAL_MAX_SIZE = 1024
+
+API_TOKEN_USAGE_CALLS_KEY = "firefighter:api_token_usage:calls"  # noqa: S105
+"""Redis hash of the number of calls since the last flush, per user ID. Tokens are not stored in clear, and there is one token per user."""
+API_TOKEN_USAGE_LAST_USED_KEY = "firefighter:api_token_usage:last_used"  # noqa: S105
+"""Redis hash of the timestamp of the last call, per user ID."""
+
+_signer = Signer(salt="firefighter.api.token_cache")
+_local_cache: dict[str, tuple[float, User]] = {}
+
+
+class _CachedToken(TypedDict):
+    user: User
+    signature: str
+
+
+def token_digest(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _cache_key(digest: str) -> str:
+    return API_TOKEN_CACHE_KEY.format(digest=digest)
+
+
+def _signed_value(digest: str, user: User) -> str:
+    return f"{digest}:{user.pk}"
+
+
+def get_cached_token_user(key: str) -> User | None:
+    """Returns the user of a token from the cache, or None if it is not cached.
+
+    Args:
+        key (str): The token, as sent by the client.
+    """
+    digest = token_digest(key)
+    now = time.monotonic()
+    local = _local_cache.get(digest)
+    if local is not None and local[0] > now:
+        return local[1]
+
+    entry: _CachedToken | None = cache.get(_cache_key(digest))
+    if entry is None:
+        return None
+    try:
+        signed_value = _signer.unsign(entry["signature"])
+    except (BadSignature, KeyError, TypeError):
+        logger.warning("Ignoring an API token cache entry with an invalid signature.")
+        return None
+    user = entry["user"]
+    if signed_value != _signed_value(digest, user):
+        logger.warning("Ignoring an API token cache entry signed for another token.")
+        return None
+
+    _set_local(digest, user, now)
+    return user
+
+
+def cache_token_user(key: str, user: User) -> None:
+    """Caches the user of a valid token."""
+    digest = token_digest(key)
+    entry = _CachedToken(
+        user=user, signature=_signer.sign(_signed_value(digest, user))
+    )
+    cache.set(_cache_key(digest), entry, timeout=settings.FF_API_TOKEN_CACHE_TTL)
+    _set_local(digest, user, time.monotonic())
+
+
+def _set_local(digest: str, user: User, now: float) -> None:
+    if len(_local_cache) >= _LOCAL_MAX_SIZE:
+        _local_cache.clear()
+    _local_cache[digest] = (now + API_TOKEN_LOCAL_MAX_AGE.total_seconds(), user)
+
+
+def invalidate_tokens(*keys: str) -> None:
+    """Invalidates some tokens, now and after the current transaction is committed.
+
+    The second invalidation prevents a concurrent call from caching a token of before the commit.
+    """
+    digests = [token_digest(key) for key in keys]
+    if not digests:
+        return
+    for digest in digests:
+        _local_cache.pop(digest, None)
+    cache_keys = [_cache_key(digest) for digest in digests]
+    cache.delete_many(cache_keys)
+    transaction.on_commit(partial(cache.delete_many, cache_keys))
+
+
+def record_token_usage(user_id: UUID) -> None:
+    """Counts a call with the token of a user, in Redis. Does nothing if `FF_API_TOKEN_USAGE` is disabled.
+
+    Errors are logged: the usage is not worth failing an API call.
+    """
+    if not settings.FF_API_TOKEN_USAGE:
+        return
+    try:
+        pipeline = get_redis_connection("default").pipeline(transaction=True)
+        pipeline.hincrby(API_TOKEN_USAGE_CALLS_KEY, str(user_id), 1)
+        pipeline.hset(API_TOKEN_USAGE_LAST_USED_KEY, str(user_id), int(time.time()))
+        pipeline.execute()
+    except (RedisError, NotImplementedError):
+        logger.warning("Could not record the usage of an API token.", exc_info=True)
+
+
+def flush_token_usage() -> int:
+    """Writes the calls counted in Redis since the last flush to [APITokenUsage][firefighter.api.models.APITokenUsage].
+
+    The counters are renamed before being read, so the calls made during the flush are counted for the next one.
+
+    Returns:
+        int: Number of tokens updated.
+    """
+    redis = get_redis_connection("default")
+    if not redis.exists(API_TOKEN_USAGE_CALLS_KEY):
+        return 0
+    suffix = uuid4().hex
+    calls_key = f"{API_TOKEN_USAGE_CALLS_KEY}:{suffix}"
+    last_used_key = f"{API_TOKEN_USAGE_LAST_USED_KEY}:{suffix}"
+    pipeline = redis.pipeline(transaction=True)
+    pipeline.rename(API_TOKEN_USAGE_CALLS_KEY, calls_key)
+    pipeline.rename(API_TOKEN_USAGE_LAST_USED_KEY, last_used_key)
+    pipeline.hgetall(calls_key)
+    pipeline.hgetall(last_used_key)
+    pipeline.delete(calls_key, last_used_key)
+    _, _, raw_calls, raw_last_used, _ = pipeline.execute()
+
+    calls: dict[str, int] = {
+        user_id.decode(): int(count) for user_id, count in raw_calls.items()
+    }
+    last_used: dict[str, datetime] = {
+        user_id.decode(): datetime.fromtimestamp(int(timestamp), tz=UTC)
+        for user_id, timestamp in raw_last_used.items()
+    }
+    token_keys: dict[str, str] = {
+        str(user_id): key
+        for user_id, key in Token.objects.filter(user_id__in=calls).values_list(
+            "user_id", "key"
+        )
+    }
+
+    with transaction.atomic():
+        usages = APITokenUsage.objects.select_for_update().in_bulk(
+            token_keys.values()
+        )
+        to_create: list[APITokenUsage] = []
+        for user_id, key in token_keys.items():
+            usage = usages.get(key)
+            if usage is None:
+                usage = APITokenUsage(token_id=key)
+                to_create.append(usage)
+            usage.calls += calls[user_id]
+            if user_id in last_used and (
+                usage.last_used_at is None or usage.last_used_at < last_used[user_id]
+            ):
+                usage.last_used_at = last_used[user_id]
+        APITokenUsage.objects.bulk_update(usages.values(), ["calls", "last_used_at"])
+        APITokenUsage.objects.bulk_create(to_create)
+    logger.debug("Flushed the usage of %s API tokens.", len(token_keys))
+    return len(token_keys)
+
+
+@receiver(post_delete)
+@receiver(post_save)
+def token_changed(sender: Any, instance: Any, **kwargs: Any) -> None:
+    # Tokens are deleted through the proxy models (API and admin), so the sender is not always Token
+    if isinstance(instance, Token):
+        invalidate_tokens(instance.key)
+
+
+@receiver(post_save, sender=User)
+def token_user_changed(sender: Any, instance: User, **kwargs: Any) -> None:
+    # The user may have been deactivated, or their permissions changed
+    if kwargs.get("raw"):
+        return
+    invalidate_tokens(
+        *Token.objects.filter(user_id=instance.pk).values_list("key", flat=True)
+    )
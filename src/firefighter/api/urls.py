@@ -45,6 +45,11 @@ router.register(
     views.components.IncidentCategoryViewSet,
     basename="incident-categories",
 )
+router.register(
+    r"events",
+    views.events.IncidentEventViewSet,
+    basename="events",
+)
 router.register(
     r"groups",
     views.groups.GroupViewSet,
@@ -58,6 +63,7 @@ router.register(
 
 
 urlpatterns: list[URLPattern | URLResolver] = [
+    path("events/stream", views.events.incident_events_stream, name="events-stream"),
     path("", include(router.urls)),
     path(
         "incidents",
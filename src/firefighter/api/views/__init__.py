@@ -5,6 +5,7 @@ from django.conf import settings
 from firefighter.api.views import (
     components,
     environments,
+    events,
     groups,
     incident_cost_types,
     incident_costs,
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from firefighter.api.conditional import ConditionalGetMixin
 from firefighter.api.serializers import EnvironmentSerializer
 from firefighter.api.views._base import ReadOnlyModelViewSet
 from firefighter.incidents.models.environment import Environment
 
 
-class EnvironmentViewSet(ReadOnlyModelViewSet[Environment]):
+class EnvironmentViewSet(
+    ConditionalGetMixin[Environment], ReadOnlyModelViewSet[Environment]
+):
     queryset = Environment.objects.all()
     serializer_class = EnvironmentSerializer
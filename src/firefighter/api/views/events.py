@@ -0,0 +1,218 @@
+"""Change feed of the incidents (see [firefighter.incidents.change_feed][]), for dashboards and bots that follow the incidents.
+
+- `GET /events?after=<id>`: the events after a cursor (the ID of the last event received), oldest first.
+- `GET /events/stream`: a Server-Sent Events stream of the events, as they are recorded.
+  Resumes after the `Last-Event-ID` header (sent by `EventSource` when reconnecting) or the `after` query parameter.
+
+The stream only runs on the ASGI server: each client holds a connection, that must not take a WSGI worker.
+Each stream subscribes to the events published in Redis, so idle clients don't query the database.
+Streams are closed after [STREAM_MAX_DURATION][firefighter.api.views.events.STREAM_MAX_DURATION], and clients reconnect from their last event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Never
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from redis.asyncio import Redis
+from rest_framework import mixins, viewsets
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from firefighter.api.authentication import BearerTokenAuthentication
+from firefighter.api.permissions import IncidentEventPermissions
+from firefighter.api.serializers import IncidentEventSerializer
+from firefighter.incidents.change_feed import CHANGE_FEED_CHANNEL
+from firefighter.incidents.models.incident_event import IncidentEvent
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from django.http import HttpRequest, HttpResponseBase
+
+    from firefighter.incidents.models.user import User
+
+EVENTS_DEFAULT_LIMIT = 100
+EVENTS_MAX_LIMIT = 1000
+STREAM_MAX_DURATION = timedelta(minutes=5)
+STREAM_HEARTBEAT = timedelta(seconds=15)
+"""A comment is sent when there is no event for this long, so proxies don't close the connection."""
+STREAM_RETRY = timedelta(seconds=2)
+"""Delay before the client reconnects, sent to `EventSource`."""
+
+
+def _parse_cursor(value: str | None, name: str) -> int:
+    if not value:
+        return 0
+    try:
+        cursor = int(value)
+    except ValueError:
+        cursor = -1
+    if cursor < 0:
+        raise ValidationError({name: ["Enter the ID of an event."]})
+    return cursor
+
+
+def events_after(after: int, limit: int = EVENTS_MAX_LIMIT) -> list[dict[str, Any]]:
+    return [
+        event.to_payload()
+        for event in IncidentEvent.objects.filter(id__gt=after).order_by("id")[:limit]
+    ]
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="after",
+            type=int,
+            location=OpenApiParameter.QUERY,
+            description="Only return the events after this one. Pass the ID of the last event you received.",
+            default=0,
+        ),
+        OpenApiParameter(
+            name="limit",
+            type=int,
+            location=OpenApiParameter.QUERY,
+            description=f"Maximum number of events to return, up to {EVENTS_MAX_LIMIT}.",
+            default=EVENTS_DEFAULT_LIMIT,
+        ),
+    ],
+)
+class IncidentEventViewSet(
+    mixins.ListModelMixin, viewsets.GenericViewSet[IncidentEvent]
+):
+    queryset = IncidentEvent.objects.all()
+    serializer_class = IncidentEventSerializer
+    permission_classes = [IncidentEventPermissions]
+    renderer_classes = [JSONRenderer]
+    filter_backends = []
+
+    def list(self, request: Request, *args: Never, **kwargs: Never) -> Response:
+        """List the incident events (created, updated, closed) after a cursor, oldest first.
+
+        To follow the incidents, call it again with the ID of the last event received as `after`, or use the Server-Sent Events stream `/events/stream`.
+        """
+        after = _parse_cursor(request.query_params.get("after"), "after")
+        limit = min(
+            _parse_cursor(request.query_params.get("limit"), "limit")
+            or EVENTS_DEFAULT_LIMIT,
+            EVENTS_MAX_LIMIT,
+        )
+        events = self.get_queryset().filter(id__gt=after).order_by("id")[:limit]
+        return Response(self.get_serializer(events, many=True).data)
+
+
+def _error_response(status: int, code: str, detail: str) -> JsonResponse:
+    """Error in the format of the API (drf-standardized-errors), for this non-DRF view."""
+    return JsonResponse(
+        {
+            "type": "client_error" if status < 500 else "server_error",
+            "errors": [{"code": code, "detail": detail, "attr": None}],
+        },
+        status=status,
+    )
+
+
+def _authenticate(request: HttpRequest) -> User | None:
+    try:
+        authenticated = BearerTokenAuthentication().authenticate(Request(request))
+    except AuthenticationFailed:
+        return None
+    if authenticated is not None:
+        return authenticated[0]
+    user: User = request.user  # type: ignore[assignment]
+    return user if user.is_authenticated else None
+
+
+def _format_event(payload: dict[str, Any]) -> str:
+    data = json.dumps(payload)
+    return f"id: {payload['id']}\nevent: {payload['type']}\ndata: {data}\n\n"
+
+
+async def stream_events(after: int) -> AsyncIterator[str]:
+    """Yields the events after `after` from the database, then the events published in Redis, as Server-Sent Events."""
+    redis = Redis.from_url(str(settings.CACHES["default"]["LOCATION"]))
+    pubsub = redis.pubsub()
+    try:
+        # Subscribe before reading the database, so no event is missed in between
+        await pubsub.subscribe(CHANGE_FEED_CHANNEL)
+        yield f"retry: {int(STREAM_RETRY.total_seconds() * 1000)}\n\n"
+
+        last_id = after
+        catch_up = True
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + STREAM_MAX_DURATION.total_seconds()
+        while loop.time() < deadline:
+            # From the database: on connection, and when an event may have been missed
+            while catch_up and (
+                events := await sync_to_async(events_after)(last_id)
+            ):
+                for payload in events:
+                    yield _format_event(payload)
+                last_id = events[-1]["id"]
+            catch_up = False
+
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=STREAM_HEARTBEAT.total_seconds(),
+            )
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            payload = json.loads(message["data"])
+            if payload["id"] <= last_id:
+                continue
+            if payload["id"] != last_id + 1:
+                # Usually a gap in the IDs (rolled back insert), or not published yet
+                catch_up = True
+                continue
+            yield _format_event(payload)
+            last_id = payload["id"]
+    finally:
+        # aclose() is missing from the types-redis stubs
+        await pubsub.aclose()  # type: ignore[attr-defined]
+        await redis.aclose()  # type: ignore[attr-defined]
+
+
+async def incident_events_stream(request: HttpRequest) -> HttpResponseBase:
+    """Server-Sent Events stream of the incident events. Requires the permission to view incidents."""
+    user = await sync_to_async(_authenticate)(request)
+    if user is None:
+        return _error_response(
+            401, "not_authenticated", "Authentication credentials were not provided."
+        )
+    if not await sync_to_async(user.has_perm)("incidents.view_incident"):
+        return _error_response(
+            403,
+            "permission_denied",
+            "You do not have permission to perform this action.",
+        )
+    if not isinstance(request, ASGIRequest):
+        return _error_response(
+            501,
+            "not_implemented",
+            "The event stream is only served by the ASGI server.",
+        )
+    try:
+        after = _parse_cursor(
+            request.headers.get("Last-Event-ID") or request.GET.get("after"), "after"
+        )
+    except ValidationError:
+        return _error_response(400, "invalid", "Enter the ID of an event.")
+
+    response = StreamingHttpResponse(
+        stream_events(after), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    # Don't buffer the events in nginx
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -3,11 +3,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Never
 
 from django.db.models import Prefetch, QuerySet
+from django.utils.dateparse import parse_datetime
+from django.utils.timezone import is_naive, make_aware
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
 from rest_framework import mixins, status, viewsets
+from rest_framework.exceptions import ValidationError
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
+from firefighter.api.conditional import ConditionalGetMixin
 from firefighter.api.serializers import IncidentSerializer
 from firefighter.api.views._base import AdvancedGenericViewSet
 from firefighter.incidents.models.incident import Incident, IncidentFilterSet
@@ -62,9 +67,23 @@ class ProcessAfterResponse(Response):
             default=False,
             examples=[OpenApiExample(name="Show tags", value=True, request_only=True)],
         ),
+        OpenApiParameter(
+            name="since",
+            type=OpenApiTypes.DATETIME,
+            location=OpenApiParameter.QUERY,
+            description="Only return the incidents updated after this date (ISO 8601). To poll for changes, pass the last `updated_at` you received. URL-encode the `+` of a UTC offset (`%2B`), or use `Z` for UTC.",
+            examples=[
+                OpenApiExample(
+                    name="Updated since",
+                    value="2024-01-31T12:00:00Z",
+                    request_only=True,
+                )
+            ],
+        ),
     ],
 )
 class IncidentViewSet(
+    ConditionalGetMixin[Incident],
     mixins.RetrieveModelMixin,
     mixins.ListModelMixin,
     AdvancedGenericViewSet[Incident],
@@ -107,6 +126,9 @@ class IncidentViewSet(
     serializer_class = IncidentSerializer
     serializer_context = {"remove_fields": ["tags"]}
     filterset_class = IncidentFilterSet
+    # Exports of all the incidents: rate and concurrency limited, see firefighter.api.throttling.
+    # Reading a single incident stays in the default lane.
+    action_throttle_scopes = {"list": "bulk"}
     fields = [
         "id",
         "status",
@@ -138,10 +160,15 @@ class IncidentViewSet(
         50, "Post-mortem"
         60, "Closed"
         ```
+
+        `since` only returns the incidents updated after an ISO 8601 date. The `+` of a UTC offset must be URL-encoded:
+        `?since=2024-01-31T12:00:00Z` or `?since=2024-01-31T14:00:00%2B02:00`.
         """
-        queryset = self.filter_queryset(self.get_queryset())
+        return super().list(request, *args, **kwargs)
+
+    def list_response(self, queryset: QuerySet[Incident]) -> Response:
         serializer: BaseSerializer[Incident]
-        if request.query_params.get("show_tags") == "true":
+        if self.request.query_params.get("show_tags") == "true":
             serializer = IncidentSerializer(
                 queryset, many=True, context={"remove_fields": []}
             )
@@ -151,6 +178,22 @@ class IncidentViewSet(
             )
         return Response(serializer.data)
 
+    def get_queryset(self) -> QuerySet[Incident]:
+        queryset = super().get_queryset()
+        since = self.request.query_params.get("since")
+        if since is None or self.action != "list":
+            return queryset
+        try:
+            since_datetime = parse_datetime(since)
+        except ValueError:
+            # Well formatted, but not a valid date (e.g. `2024-02-30T12:00:00`)
+            since_datetime = None
+        if since_datetime is None:
+            raise ValidationError({"since": ["Enter a valid ISO 8601 date and time."]})
+        if is_naive(since_datetime):
+            since_datetime = make_aware(since_datetime)
+        return queryset.filter(updated_at__gt=since_datetime)
+
 
 @extend_schema(
     examples=[
@@ -253,6 +296,7 @@ class CreateIncidentViewSet(
     serializer_class = IncidentSerializer
     filterset_class = IncidentFilterSet
     renderer_classes = [JSONRenderer]
+    throttle_scope = "critical"
 
     def create(self, request: Request, *args: Never, **kwargs: Never) -> Response:
         """Allow to create an incident.
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
+import httpx
+
 from firefighter.firefighter.http_client import HttpClient
 from firefighter.firefighter.utils import get_in
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
-    import httpx
-
     from firefighter.confluence.utils import ConfluencePage, ConfluencePageId
 
+logger = logging.getLogger(__name__)
+
+MAX_RETRIES_ON_RATE_LIMIT = 5
+MAX_RETRY_DELAY = 60
+
 
 class ConfluenceClient(HttpClient):
     """Helper methods for Confluence API.
@@ -28,6 +36,33 @@ class ConfluenceClient(HttpClient):
         self.base_url = self.base_url_api.removesuffix("/rest/api")
         """Confluence base URL. (with `/wiki`, without `/rest/api`)"""
 
+    def call(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Perform the request, retrying when Confluence rate limits us (HTTP 429).
+
+        Waits for the `Retry-After` delay if provided, or an exponential backoff otherwise.
+        """
+        for attempt in range(MAX_RETRIES_ON_RATE_LIMIT + 1):
+            res = super().call(method, url, **kwargs)
+            if (
+                res.status_code != httpx.codes.TOO_MANY_REQUESTS
+                or attempt == MAX_RETRIES_ON_RATE_LIMIT
+            ):
+                break
+            retry_after = res.headers.get("Retry-After", "")
+            delay = (
+                min(float(retry_after), MAX_RETRY_DELAY)
+                if retry_after.isdigit()
+                else 2**attempt
+            )
+            logger.warning(
+                "Rate limited by Confluence on %s %s, retrying in %ss",
+                method.upper(),
+                url,
+                delay,
+            )
+            time.sleep(delay)
+        return res
+
     def _get_paged(
         self,
         url: str,
@@ -35,30 +70,37 @@ class ConfluenceClient(HttpClient):
         """From https://github.com/atlassian-api/atlassian-python-api/blob/master/atlassian/confluence.py
         Apache License 2.0.
 
+        The next page is requested in the background while the results of the current page are consumed.
+
         Args:
             url (str): The url to retrieve
 
         Yields:
             ConfluencePage: A generator object for the data elements
         """
-        while True:
-            response = self.get(
-                url,
-            ).json()
-            if "results" not in response:
-                return
-
-            yield from response.get("results", [])
-
-            # According to Cloud and Server documentation the links are returned the same way:
-            # https://developer.atlassian.com/cloud/confluence/rest/api-group-content/#api-wiki-rest-api-content-get
-            # https://developer.atlassian.com/server/confluence/pagination-in-the-rest-api/
-            url_new = response.get("_links", {}).get("next")
-            if url_new is None:
-                break
-            url = f"{self.base_url}{url_new}"
-
-        return
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            next_response: Future[httpx.Response] | None = executor.submit(
+                self.get, url
+            )
+            while next_response is not None:
+                response = next_response.result().json()
+                if "results" not in response:
+                    return
+
+                # According to Cloud and Server documentation the links are returned the same way:
+                # https://developer.atlassian.com/cloud/confluence/rest/api-group-content/#api-wiki-rest-api-content-get
+                # https://developer.atlassian.com/server/confluence/pagination-in-the-rest-api/
+                url_new = response.get("_links", {}).get("next")
+                next_response = (
+                    executor.submit(self.get, f"{self.base_url}{url_new}")
+                    if url_new is not None
+                    else None
+                )
+
+                yield from response.get("results", [])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def get_page(
         self, page_id: str | int, expand: str = "body.storage,version"
@@ -74,6 +116,27 @@ class ConfluenceClient(HttpClient):
         url = f"{self.base_url_api}/content/{page_id}/child/page?expand={expand}&limit={limit}"
         return self._get_paged(url)
 
+    def search_content(
+        self,
+        cql: str,
+        expand: str = "version",
+        limit: int = 200,
+    ) -> Generator[ConfluencePage, None, None]:
+        """Search content with a [CQL](https://developer.atlassian.com/cloud/confluence/advanced-searching-using-cql/) query.
+
+        Args:
+            cql (str): The CQL query.
+            expand (str, optional): Properties to expand. Defaults to "version".
+            limit (int, optional): Page size. Defaults to 200.
+        """
+        url = str(
+            httpx.URL(
+                f"{self.base_url_api}/content/search",
+                params={"cql": cql, "expand": expand, "limit": limit},
+            )
+        )
+        return self._get_paged(url)
+
     def get_page_body_and_version(
         self,
         page_id: str | int,
@@ -105,10 +168,9 @@ class ConfluenceClient(HttpClient):
 
     def get_page_descendant_pages(
         self, page_id: ConfluencePageId, expand: str = "", limit: int = 500
-    ) -> httpx.Response:
-        return self.get(
-            f"{self.base_url_api}/content/{page_id}/descendant/page?expand={expand}&limit={limit}"
-        )
+    ) -> Generator[ConfluencePage, None, None]:
+        url = f"{self.base_url_api}/content/{page_id}/descendant/page?expand={expand}&limit={limit}"
+        return self._get_paged(url)
 
     def get_page_history(
         self,
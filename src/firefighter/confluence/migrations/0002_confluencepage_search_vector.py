@@ -0,0 +1,36 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("confluence", "0001_initial_oss"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="confluencepage",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text search vector of the title and body. Updated when the content is synced.",
+                null=True,
+            ),
+        ),
+        # Same expression as `firefighter.confluence.models.update_search_vector`
+        migrations.RunSQL(
+            sql="""
+            UPDATE confluence_confluencepage SET search_vector =
+                setweight(to_tsvector('english'::regconfig, COALESCE(name, '')), 'A')
+                || setweight(to_tsvector('english'::regconfig, regexp_replace(COALESCE(body_storage, ''), '<[^>]+>', ' ', 'g')), 'C');
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="confluencepage",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="confluence_page_search_idx"
+            ),
+        ),
+    ]
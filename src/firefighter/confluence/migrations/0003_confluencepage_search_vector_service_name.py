@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("confluence", "0002_confluencepage_search_vector"),
+    ]
+
+    operations = [
+        # Same expression as `firefighter.confluence.models.update_search_vector`
+        migrations.RunSQL(
+            sql="""
+            UPDATE confluence_confluencepage SET search_vector =
+                setweight(to_tsvector('english'::regconfig, COALESCE(name, '')), 'A')
+                || setweight(to_tsvector('english'::regconfig, COALESCE((
+                    SELECT service_name FROM confluence_runbook
+                    WHERE confluence_runbook.confluencepage_ptr_id = confluence_confluencepage.id
+                ), '')), 'B')
+                || setweight(to_tsvector('english'::regconfig, regexp_replace(COALESCE(body_storage, ''), '<[^>]+>', ' ', 'g')), 'C');
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
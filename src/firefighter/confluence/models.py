@@ -7,16 +7,30 @@ from typing import TYPE_CHECKING, ClassVar
 
 import django_filters
 from django.conf import settings
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.urls import reverse
 from django_filters.filters import AllValuesMultipleFilter
 
+from firefighter.confluence.utils import (
+    SEARCH_SNIPPET_START_SEL,
+    SEARCH_SNIPPET_STOP_SEL,
+)
 from firefighter.firefighter.fields_forms_widgets import CustomCheckboxSelectMultiple
 from firefighter.incidents.models.incident import Incident
 from firefighter.incidents.signals import postmortem_created
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.db.models import QuerySet
 
     from firefighter.jira_app.models import JiraPostMortem
@@ -142,6 +156,68 @@ class PostMortemManager(models.Manager["PostMortem"]):
         return pm_page
 
 
+def _stripped_body() -> models.Func:
+    """Storage body of the page, without its XHTML tags."""
+    return models.Func(
+        Coalesce("body_storage", models.Value("")),
+        models.Value("<[^>]+>"),
+        models.Value(" "),
+        models.Value("g"),
+        function="regexp_replace",
+        output_field=models.TextField(),
+    )
+
+
+def update_search_vector(page_ids: Iterable[uuid.UUID] | None = None) -> int:
+    """Recompute the full-text search vector of Confluence pages, from their title, service name (for runbooks) and stripped body.
+
+    Args:
+        page_ids (Iterable[uuid.UUID] | None, optional): IDs of the pages to update. If None, all pages are updated.
+
+    Returns:
+        int: Number of pages updated.
+    """
+    queryset = ConfluencePage.objects.all()
+    if page_ids is not None:
+        queryset = queryset.filter(id__in=page_ids)
+    service_name = models.Subquery(
+        Runbook.objects.filter(pk=models.OuterRef("pk")).values("service_name")[:1]
+    )
+    return queryset.update(
+        search_vector=SearchVector("name", config="english", weight="A")
+        + SearchVector(service_name, config="english", weight="B")
+        + SearchVector(_stripped_body(), config="english", weight="C")
+    )
+
+
+def search_confluence_pages[T: ConfluencePage](
+    queryset: QuerySet[T], search_term: str
+) -> QuerySet[T]:
+    """Full-text search on the indexed title and body of Confluence pages.
+
+    Results are ordered by relevance, and annotated with `search_rank` and a `search_snippet` of the matching body,
+    where matches are surrounded by [SEARCH_SNIPPET_START_SEL][firefighter.confluence.utils.SEARCH_SNIPPET_START_SEL] and [SEARCH_SNIPPET_STOP_SEL][firefighter.confluence.utils.SEARCH_SNIPPET_STOP_SEL].
+    """
+    query = SearchQuery(search_term, config="english", search_type="websearch")
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(
+            search_rank=SearchRank(models.F("search_vector"), query),
+            search_snippet=SearchHeadline(
+                _stripped_body(),
+                query,
+                config="english",
+                start_sel=SEARCH_SNIPPET_START_SEL,
+                stop_sel=SEARCH_SNIPPET_STOP_SEL,
+                max_fragments=2,
+                max_words=20,
+                min_words=8,
+            ),
+        )
+        .order_by("-search_rank")
+    )
+
+
 class ConfluencePage(models.Model):
     """Represents a Confluence page."""
 
@@ -169,8 +245,17 @@ class ConfluencePage(models.Model):
 
     version = models.JSONField(default=dict)  # We need a callable
 
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text search vector of the title and body. Updated when the content is synced.",
+    )
+
     class Meta:
         app_label = "confluence"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="confluence_page_search_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -211,20 +296,7 @@ class RunbookManager(models.Manager["Runbook"]):
         if search_term is None or search_term.strip() == "":
             return queryset, False
 
-        # XXX Improve search performance and relevance
-        vector = (
-            SearchVector("name", config="english", weight="A")
-            + SearchVector("service_name", config="english", weight="B")
-            + SearchVector("body_storage", config="english", weight="C")
-        )
-        query = SearchQuery(search_term, config="english", search_type="websearch")
-        queryset = (
-            queryset.annotate(rank=SearchRank(vector, query))
-            .filter(rank__gte=0.05)
-            .order_by("-rank")
-        )
-
-        return queryset, False
+        return search_confluence_pages(queryset, search_term), False
 
 
 class Runbook(ConfluencePage):
@@ -244,17 +316,10 @@ class Runbook(ConfluencePage):
         return reverse("confluence:runbook_details", kwargs={"runbook_id": self.id})
 
 
-class RunbookFilterSet(django_filters.FilterSet):
-    """Set of filters for Runbooks."""
+class BaseRunbookFilterSet(django_filters.FilterSet):
+    """Filters of the Runbooks shared by the web pages and the API."""
 
     id = django_filters.CharFilter(lookup_expr="iexact")
-    service_type = AllValuesMultipleFilter(
-        label="Service Type",
-        field_name="service_type",
-        widget=CustomCheckboxSelectMultiple,
-        null_value="All Types",
-    )
-
     search = django_filters.CharFilter(
         field_name="search", method="runbook_search", label="Search"
     )
@@ -264,3 +329,32 @@ class RunbookFilterSet(django_filters.FilterSet):
         queryset: QuerySet[Runbook], _name: str, value: str
     ) -> QuerySet[Runbook]:
         return Runbook.objects.search(queryset=queryset, search_term=value)[0]
+
+
+class RunbookFilterSet(BaseRunbookFilterSet):
+    """Set of filters for Runbooks."""
+
+    service_type = AllValuesMultipleFilter(
+        label="Service Type",
+        field_name="service_type",
+        widget=CustomCheckboxSelectMultiple,
+        null_value="All Types",
+    )
+
+
+class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    """Filter on any of comma-separated values."""
+
+
+class RunbookAPIFilterSet(BaseRunbookFilterSet):
+    """Set of filters for the Runbooks API.
+
+    The service types are not listed from the database, so that nothing is queried when the OpenAPI schema is built.
+    """
+
+    service_type = CharInFilter(
+        label="Service Type",
+        field_name="service_type",
+        lookup_expr="in",
+        help_text="Comma-separated service types.",
+    )
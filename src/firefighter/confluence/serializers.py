@@ -6,6 +6,15 @@ from firefighter.confluence.models import Runbook
 
 
 class RunbookSerializer(serializers.ModelSerializer[Runbook]):
+    search_rank = serializers.FloatField(
+        read_only=True, allow_null=True, help_text="Relevance, when searching."
+    )
+    search_snippet = serializers.CharField(
+        read_only=True,
+        allow_null=True,
+        help_text="Extract of the body matching the search, when searching. Matches are surrounded by `\\x02` and `\\x03`.",
+    )
+
     class Meta:
         model = Runbook
-        fields = "__all__"
+        exclude = ["search_vector"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from functools import cache, cached_property
 from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import urljoin
@@ -11,12 +12,16 @@ from django.urls import reverse
 from firefighter.firefighter.utils import get_in
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from firefighter.confluence.client import ConfluenceClient
     from firefighter.confluence.utils import ConfluencePage, ConfluencePageId, PageInfo
     from firefighter.incidents.models.user import User
 
 logger = logging.getLogger(__name__)
 
+MOVE_PAGES_MAX_WORKERS = 8
+
 
 @cache
 def get_confluence_client() -> type[ConfluenceClient]:
@@ -192,13 +197,28 @@ class ConfluenceService:
         Returns:
             list[ConfluencePage]: list of children pages.
         """
-        return list(self.client.get_page_children_pages(page_id, *args, **kwargs))
+        return list(self.iter_page_children_pages(page_id, *args, **kwargs))
+
+    def iter_page_children_pages(
+        self, page_id: ConfluencePageId, *args: Any, **kwargs: Any
+    ) -> Iterator[ConfluencePage]:
+        """Iterate over the children pages of a given page, fetching the next page of results in the background.
+
+        Args:
+            page_id (ConfluencePageId): ID of the page to get children pages from.
+            *args: Arguments to pass to Confluence.
+            **kwargs: Keyword arguments to pass to Confluence.
+
+        Returns:
+            Iterator[ConfluencePage]: children pages.
+        """
+        return self.client.get_page_children_pages(page_id, *args, **kwargs)
 
     def get_page_descendant_pages(
         self, page_id: ConfluencePageId, *args: Any, **kwargs: Any
     ) -> list[ConfluencePage]:
         """Get all descendant (nested children) pages of a given page.
-        TODO: Pagination support and testing.
+        TODO: testing.
 
         Args:
             page_id (ConfluencePageId): ID of the page to get children pages from.
@@ -208,9 +228,22 @@ class ConfluenceService:
         Returns:
             list[ConfluencePage]: list of children pages.
         """
-        return self.client.get_page_descendant_pages(page_id, *args, **kwargs).json()[
-            "results"
-        ]
+        return list(self.iter_page_descendant_pages(page_id, *args, **kwargs))
+
+    def iter_page_descendant_pages(
+        self, page_id: ConfluencePageId, *args: Any, **kwargs: Any
+    ) -> Iterator[ConfluencePage]:
+        """Iterate over the descendant (nested children) pages of a given page, fetching the next page of results in the background.
+
+        Args:
+            page_id (ConfluencePageId): ID of the page to get children pages from.
+            *args: Arguments to pass to Confluence.
+            **kwargs: Keyword arguments to pass to Confluence.
+
+        Returns:
+            Iterator[ConfluencePage]: descendant pages.
+        """
+        return self.client.get_page_descendant_pages(page_id, *args, **kwargs)
 
     def get_page(self, page_id: ConfluencePageId) -> ConfluencePage:
         """TODO: Errors.
@@ -228,6 +261,31 @@ class ConfluenceService:
     ) -> ConfluencePage:
         return self.client.get_page_body_and_version(page_id).json()
 
+    def get_pages_version_numbers(
+        self, page_ids: Iterable[ConfluencePageId], batch_size: int = 100
+    ) -> dict[int, int]:
+        """Get the current version number of many pages, with one CQL search per batch of pages.
+
+        Pages that are not returned (deleted, restricted...) are missing from the result.
+
+        Args:
+            page_ids (Iterable[ConfluencePageId]): IDs of the pages.
+            batch_size (int, optional): Number of page IDs per CQL query. Defaults to 100.
+
+        Returns:
+            dict[int, int]: Mapping of page ID to its version number.
+        """
+        page_ids = list(page_ids)
+        versions: dict[int, int] = {}
+        for i in range(0, len(page_ids), batch_size):
+            batch = page_ids[i : i + batch_size]
+            cql = f"type=page and id in ({','.join(str(page_id) for page_id in batch)})"
+            for page in self.client.search_content(cql, expand="version"):
+                version_number = get_in(page, "version.number")
+                if version_number is not None:
+                    versions[int(page["id"])] = int(version_number)
+        return versions
+
     def create_page(
         self,
         title: str,
@@ -282,6 +340,44 @@ class ConfluenceService:
         logger.error(f"Error moving page {page_id} {res.status_code} {res.text}")
         return None
 
+    def move_pages(
+        self,
+        moves: list[
+            tuple[
+                ConfluencePageId,
+                ConfluencePageId,
+                Literal["before", "after", "append"],
+            ]
+        ],
+        *,
+        dry_run: bool = False,
+        max_workers: int = MOVE_PAGES_MAX_WORKERS,
+    ) -> list[ConfluencePage | None]:
+        """Perform independent page moves concurrently, with a bounded number of workers.
+
+        Rate limited requests are retried by the client.
+        **Be careful**: the moves must not depend on each other, as their order is not guaranteed. Use [sort_pages][firefighter.confluence.service.ConfluenceService.sort_pages] to move pages in relation to each other.
+
+        Args:
+            moves (list[tuple[ConfluencePageId, ConfluencePageId, Literal["before", "after", "append"]]]): List of (page ID, target page ID, position).
+            dry_run (bool, optional): If True, will log instead of moving. Defaults to False.
+            max_workers (int, optional): Maximum number of concurrent moves. Defaults to MOVE_PAGES_MAX_WORKERS.
+
+        Returns:
+            list[ConfluencePage | None]: The moved pages, or None for the moves that failed, in the same order as `moves`.
+        """
+        if not moves:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda move: self.move_page(
+                        move[0], move[1], position=move[2], dry_run=dry_run
+                    ),
+                    moves,
+                )
+            )
+
     def sort_pages(
         self,
         page_ids: list[tuple[ConfluencePageId, ConfluencePage]],
@@ -4,8 +4,8 @@ import logging
 from typing import TYPE_CHECKING, Any, Never
 
 from django.apps import apps
-from django.dispatch.dispatcher import receiver
 
+from firefighter.incidents.signal_bus import lifecycle_receiver
 from firefighter.incidents.signals import incident_updated
 
 if TYPE_CHECKING:
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@receiver(signal=incident_updated)
+@lifecycle_receiver(incident_updated, mode="async")
 def incident_updated_handler(
     sender: Any,
     incident: Incident,
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import django_tables2 as tables
 
 from firefighter.confluence.models import Runbook
+from firefighter.confluence.utils import highlight_search_snippet
 from firefighter.firefighter.tables_utils import BASE_TABLE_ATTRS
 
+if TYPE_CHECKING:
+    from django.utils.safestring import SafeString
+
 
 class RunbookTable(tables.Table):
     class Meta:
@@ -20,3 +26,13 @@ class RunbookTable(tables.Table):
     name = tables.TemplateColumn(
         '<a href="{{record.page_url}}" class="text-primary hover:text-indigo-900 dark:text-indigo-400 dark:hover:text-indigo-200">{{record.name}}</a>'
     )
+
+    search_snippet = tables.Column(
+        verbose_name="Matches",
+        orderable=False,
+        attrs={"td": {"class": "px-3 py-4 text-left"}},
+    )
+
+    @staticmethod
+    def render_search_snippet(value: str) -> SafeString:
+        return highlight_search_snippet(value)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import operator
+from typing import Literal
 
 from celery import shared_task
 from django.utils.timezone import (  # type: ignore[attr-defined]
@@ -10,12 +11,12 @@ from django.utils.timezone import (  # type: ignore[attr-defined]
     timedelta,
 )
 
-from firefighter.confluence.service import confluence_service
 from firefighter.confluence.utils import (
     CONFLUENCE_PM_ARCHIVE_TITLE_REGEX,
     CONFLUENCE_PM_TITLE_REGEX,
     ConfluencePage,
     ConfluencePageId,
+    get_confluence_service,
     parse_postmortem_title,
 )
 from firefighter.firefighter.utils import get_in
@@ -41,7 +42,7 @@ def archive_and_sort_postmortems(*, dry_run: bool = True) -> None:
 
     # 1. Get top level pages
     pm_to_sort, quarter_bins = _get_top_level_pages(
-        confluence_service.POSTMORTEM_FOLDER_ID
+        get_confluence_service().POSTMORTEM_FOLDER_ID
     )
 
     # 2. Create current quarter folder if it does not exist
@@ -63,7 +64,7 @@ def _get_top_level_pages(
     """Get all top level pages in the postmortem folder."""
     pm_to_sort: list[ConfluencePage] = []
     quarter_bins: dict[str, int] = {}
-    children_pages = confluence_service.get_page_children_pages(root_page_id)
+    children_pages = get_confluence_service().iter_page_children_pages(root_page_id)
 
     for page in children_pages:
         title: str = page["title"]
@@ -100,11 +101,16 @@ def _archive_postmortems(
 ) -> None:
     """Move postmortems to their quarter bin, if they have a related incident in FireFighter that is closed for more than 7 days.
 
+    The postmortems to move are collected first, then moved concurrently.
+
     Args:
         pm_to_sort (list[ConfluencePage]): Confluence pages to sort. Not Django models, but the JSON response from the API.
         quarter_bins (dict[str, int]): Mapping of quarter/year to Confluence page ID.
         dry_run (bool, optional): Defaults to False.
     """
+    moves: list[
+        tuple[ConfluencePageId, ConfluencePageId, Literal["before", "after", "append"]]
+    ] = []
     for pm in pm_to_sort:
         if not pm["title"].startswith("#"):
             logger.debug(f"Skipping {pm['title']} because it does not look like a PM")
@@ -145,7 +151,10 @@ def _archive_postmortems(
             )
             continue
 
-        confluence_service.move_page(pm["id"], quarter_bins[fmt], dry_run=dry_run)
+        moves.append((pm["id"], quarter_bins[fmt], "append"))
+
+    logger.info(f"Archiving {len(moves)} postmortems")
+    get_confluence_service().move_pages(moves, dry_run=dry_run)
 
 
 def create_current_bin_if_needed(
@@ -170,13 +179,13 @@ def create_current_bin(
     *,
     dry_run: bool = False,
 ) -> int:
-    res = confluence_service.create_page(
+    res = get_confluence_service().create_page(
         f"Q{current_quarter} {current_year} Postmortems",
-        confluence_service.POSTMORTEM_FOLDER_ID,
+        get_confluence_service().POSTMORTEM_FOLDER_ID,
         body="",
     )
     page_id = int(get_in(res, "id"))
-    confluence_service.move_page(
+    get_confluence_service().move_page(
         page_id,
         next(iter(quarter_bins.keys())),
         position="before",
@@ -197,8 +206,8 @@ def sort_postmortems_in_bins(
     """
     for quarter, quarter_page_id in quarter_bins.items():
         # Get children per archive page
-        children: list[ConfluencePage] = confluence_service.get_page_children_pages(
-            quarter_page_id, expand=""
+        children: list[ConfluencePage] = (
+            get_confluence_service().get_page_children_pages(quarter_page_id, expand="")
         )
         logger.info(f"Found {len(children)} postmortems in {quarter}")
         quarter_children: list[tuple[int, datetime, ConfluencePage]] = []
@@ -223,6 +232,6 @@ def sort_postmortems_in_bins(
             (x[0], x[2]) for x in sorted_children
         ]
 
-        confluence_service.sort_pages(clean_sorted, dry_run=dry_run)
+        get_confluence_service().sort_pages(clean_sorted, dry_run=dry_run)
 
         logger.info(f"Fetched {len(quarter_children)} postmortems")
@@ -4,10 +4,10 @@ import logging
 
 from celery import shared_task
 
-from firefighter.confluence.service import confluence_service
 from firefighter.confluence.utils import (
     ConfluencePage,
     ConfluencePageId,
+    get_confluence_service,
     parse_runbook_title,
 )
 
@@ -24,7 +24,7 @@ def sort_runbooks(*, dry_run: bool = False) -> None:
     logger.info(f"Running in {'dry run' if dry_run else 'real'} mode")
 
     # 1. Get top level pages
-    folders = _get_top_level_pages(confluence_service.RUNBOOKS_FOLDER_ID)
+    folders = _get_top_level_pages(get_confluence_service().RUNBOOKS_FOLDER_ID)
 
     # 2. Sort runbooks in each folder
     sort_runbooks_in_folders(folders, dry_run=dry_run)
@@ -35,7 +35,7 @@ def _get_top_level_pages(
 ) -> list[ConfluencePageId]:
     """Get all top level pages in the runbooks folder."""
     folders: list[ConfluencePageId] = []
-    children_pages = confluence_service.get_page_children_pages(root_page_id)
+    children_pages = get_confluence_service().get_page_children_pages(root_page_id)
 
     for page in children_pages:
         title: str = page["title"]
@@ -59,8 +59,8 @@ def sort_runbooks_in_folders(
     """
     for folder_page_id in folders:
         # Get children per archive page
-        children: list[ConfluencePage] = confluence_service.get_page_children_pages(
-            folder_page_id, expand=""
+        children: list[ConfluencePage] = (
+            get_confluence_service().get_page_children_pages(folder_page_id, expand="")
         )
 
         folder_children: list[tuple[ConfluencePageId, str, ConfluencePage]] = []
@@ -82,4 +82,4 @@ def sort_runbooks_in_folders(
             (x[0], x[2]) for x in sorted_children
         ]
         logger.info(f"Folder {folder_page_id} is not sorted. Sorting")
-        confluence_service.sort_pages(clean_sorted_children, dry_run=dry_run)
+        get_confluence_service().sort_pages(clean_sorted_children, dry_run=dry_run)
@@ -1,34 +1,92 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from celery import shared_task
+from django.utils import timezone
 
-from firefighter.confluence.models import ConfluencePage
-from firefighter.confluence.service import confluence_service
+from firefighter.confluence.models import ConfluencePage, update_search_vector
+from firefighter.confluence.utils import get_confluence_service
 from firefighter.firefighter.utils import get_in
 
+if TYPE_CHECKING:
+    from firefighter.confluence.utils import ConfluencePage as ConfluencePageData
+
 logger = logging.getLogger(__name__)
 
+MAX_WORKERS = 8
+"""Maximum number of concurrent requests to fetch pages bodies."""
+BODY_FIELDS = ["body_export_view", "body_storage", "body_view", "version", "updated_at"]
+
 
 @shared_task(
     name="confluence.sync_pages_content", soft_time_limit=60 * 5, time_limit=60 * 7
 )
-def sync_pages_content() -> None:
-    for runbook in ConfluencePage.objects.all():
-        res = confluence_service.get_page_with_body_and_version(runbook.page_id)
-        # Check if the page still exists, if not, delete it
-        if res.get("statusCode", None) == 404 and get_in(res, ["data", "authorized"]):
-            logger.info(f"Page {runbook.page_id} {runbook} not found, deleting it")
-            runbook.delete()
-            continue
-
-        body = res.get("body", None)
-        if body is None:
-            logger.warning("No body found for page %s", runbook)
-            continue
-        runbook.body_export_view = get_in(res, ["body", "export_view", "value"])
-        runbook.body_storage = get_in(res, ["body", "storage", "value"])
-        runbook.body_view = get_in(res, ["body", "view", "value"])
-        runbook.version = get_in(res, ["version"], {})
-        runbook.save()
+def sync_pages_content(*, full: bool = False) -> None:
+    """Sync the body of Confluence pages (runbooks and postmortems).
+
+    By default, the version of all pages is listed in bulk, and only the pages with a different version than the one saved are fetched.
+
+    Args:
+        full (bool, optional): Fetch the body of every page, regardless of its version. Defaults to False.
+    """
+    pages = list(ConfluencePage.objects.only("id", "name", "page_id", "version"))
+    if full:
+        pages_to_fetch = pages
+    else:
+        remote_versions = get_confluence_service().get_pages_version_numbers(
+            page.page_id for page in pages
+        )
+        # Pages missing from the search are fetched too, to delete them if they don't exist anymore
+        pages_to_fetch = [
+            page
+            for page in pages
+            if page.page_id not in remote_versions
+            or get_in(page.version, "number") != remote_versions[page.page_id]
+        ]
+    logger.info(
+        f"Fetching content of {len(pages_to_fetch)} out of {len(pages)} Confluence pages"
+    )
+    if not pages_to_fetch:
+        return
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(
+            get_confluence_service().get_page_with_body_and_version,
+            [page.page_id for page in pages_to_fetch],
+        )
+        pages_updated = [
+            page
+            for page, res in zip(pages_to_fetch, results, strict=True)
+            if _update_page_content(page, res)
+        ]
+
+    ConfluencePage.objects.bulk_update(pages_updated, BODY_FIELDS, batch_size=100)
+    update_search_vector([page.id for page in pages_updated])
+    logger.info(f"Updated content of {len(pages_updated)} Confluence pages")
+
+
+def _update_page_content(page: ConfluencePage, res: ConfluencePageData) -> bool:
+    """Set the body and version on the page from the API response. Deletes the page if it does not exist anymore.
+
+    Returns:
+        bool: Whether the page needs to be saved.
+    """
+    # Check if the page still exists, if not, delete it
+    if res.get("statusCode", None) == 404 and get_in(res, ["data", "authorized"]):
+        logger.info(f"Page {page.page_id} {page} not found, deleting it")
+        page.delete()
+        return False
+
+    body = res.get("body", None)
+    if body is None:
+        logger.warning("No body found for page %s", page)
+        return False
+    page.body_export_view = get_in(res, ["body", "export_view", "value"])
+    page.body_storage = get_in(res, ["body", "storage", "value"])
+    page.body_view = get_in(res, ["body", "view", "value"])
+    page.version = get_in(res, ["version"], {})
+    page.updated_at = timezone.now()
+    return True
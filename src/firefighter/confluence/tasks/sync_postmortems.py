@@ -6,10 +6,10 @@ from typing import cast
 from celery import shared_task
 from django.db.utils import IntegrityError
 
-from firefighter.confluence.models import PostMortem
-from firefighter.confluence.service import confluence_service
+from firefighter.confluence.models import PostMortem, update_search_vector
 from firefighter.confluence.utils import (
     CONFLUENCE_PM_TITLE_REGEX,
+    get_confluence_service,
     parse_postmortem_archive_title,
 )
 from firefighter.incidents.models.incident import Incident
@@ -19,14 +19,17 @@ logger = logging.getLogger(__name__)
 
 @shared_task(name="confluence.sync_postmortems")
 def sync_postmortems() -> None:
-    all_pm = confluence_service.get_page_descendant_pages(
-        confluence_service.POSTMORTEM_FOLDER_ID
+    all_pm = get_confluence_service().iter_page_descendant_pages(
+        get_confluence_service().POSTMORTEM_FOLDER_ID
     )
     pm_missing_incident = []
     pm_no_match = []
+    # Titles of the known postmortems, to refresh the search vector of the new or renamed ones
+    indexed_names = dict(PostMortem.objects.values_list("page_id", "name"))
+    pm_to_index: list[PostMortem] = []
 
     for pm in all_pm:
-        data = confluence_service.parse_confluence_page(pm)
+        data = get_confluence_service().parse_confluence_page(pm)
 
         if "name" not in data or data["name"] is None or data["name"] == "":
             logger.error(f"PostMortem {pm['id']} has no name")
@@ -58,7 +61,7 @@ def sync_postmortems() -> None:
             continue
         data_editable = cast("dict[str, str]", data)
         try:
-            PostMortem.objects.update_or_create(
+            postmortem, _ = PostMortem.objects.update_or_create(
                 page_id=int(data_editable.pop("page_id")),
                 defaults=data_editable
                 | {
@@ -67,5 +70,9 @@ def sync_postmortems() -> None:
             )
         except IntegrityError:
             logger.exception(f"IntegrityError for {data} {pm}")
+            continue
+        if indexed_names.get(postmortem.page_id) != postmortem.name:
+            pm_to_index.append(postmortem)
+    update_search_vector([postmortem.id for postmortem in pm_to_index])
     logger.info(pm_missing_incident)
     logger.info(pm_no_match)
@@ -7,8 +7,8 @@ from typing import TYPE_CHECKING, cast
 from celery import shared_task
 from django.db.utils import IntegrityError
 
-from firefighter.confluence.models import Runbook
-from firefighter.confluence.service import confluence_service
+from firefighter.confluence.models import Runbook, update_search_vector
+from firefighter.confluence.utils import get_confluence_service
 
 if TYPE_CHECKING:
     from firefighter.confluence.utils import ConfluencePageId
@@ -35,14 +35,22 @@ ALLOWED_TYPES = {
 @shared_task(name="confluence.sync_runbooks")
 def sync_runbooks() -> None:
     all_fetched_ids: set[ConfluencePageId] = set()
-    folders = confluence_service.get_page_children_pages(
-        confluence_service.RUNBOOKS_FOLDER_ID
+    # Indexed fields of the known runbooks, to refresh the search vector of the new or renamed ones
+    indexed_fields = {
+        page_id: (name, service_name)
+        for page_id, name, service_name in Runbook.objects.values_list(
+            "page_id", "name", "service_name"
+        )
+    }
+    runbooks_to_index: list[Runbook] = []
+    folders = get_confluence_service().get_page_children_pages(
+        get_confluence_service().RUNBOOKS_FOLDER_ID
     )
 
     for folder in folders:
-        runbooks_pages = confluence_service.get_page_children_pages(folder["id"])
+        runbooks_pages = get_confluence_service().iter_page_children_pages(folder["id"])
         for page in runbooks_pages:
-            data = confluence_service.parse_confluence_page(page)
+            data = get_confluence_service().parse_confluence_page(page)
             page_id = data["page_id"]
             all_fetched_ids.add(page_id)
             data["name"] = data["name"].removesuffix("[RUNBOOK]").strip()
@@ -65,11 +73,18 @@ def sync_runbooks() -> None:
             if data_editable["service_type"] not in ALLOWED_TYPES:
                 data_editable["service_type"] = "other"
             try:
-                Runbook.objects.update_or_create(
+                runbook, _ = Runbook.objects.update_or_create(
                     page_id=int(data_editable.pop("page_id")), defaults=data_editable
                 )
             except IntegrityError:
                 logger.exception(f"IntegrityError for {data} {data}")
+                continue
+            if indexed_fields.get(runbook.page_id) != (
+                runbook.name,
+                runbook.service_name,
+            ):
+                runbooks_to_index.append(runbook)
+    update_search_vector([runbook.id for runbook in runbooks_to_index])
     # Print all runbooks that are not in the folder anymore
     missing_runbooks = Runbook.objects.exclude(page_id__in=all_fetched_ids)
     if not missing_runbooks:
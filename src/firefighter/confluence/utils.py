@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import re
-from typing import TypedDict
+from html import unescape
+from typing import TYPE_CHECKING, TypedDict
 
+from django.utils.html import escape
+from django.utils.safestring import SafeString, mark_safe
 from django.utils.timezone import (  # type: ignore[attr-defined]
     datetime,
     get_current_timezone,
@@ -10,10 +13,20 @@ from django.utils.timezone import (  # type: ignore[attr-defined]
 
 from firefighter.incidents.views.date_utils import get_quarter_from_week
 
+if TYPE_CHECKING:
+    from firefighter.confluence.service import ConfluenceService
+
 type ConfluencePageId = int | str
 """Alias of `int | str`"""
 
 
+def get_confluence_service() -> ConfluenceService:
+    """The [ConfluenceService][firefighter.confluence.service.ConfluenceService] instance, imported on first use so the tasks don't load it at startup."""
+    from firefighter.confluence.service import confluence_service
+
+    return confluence_service
+
+
 class ConfluenceContentVersionData(TypedDict, total=False):
     when: datetime | None
     friendlyWhen: str | None
@@ -58,6 +71,11 @@ CONFLUENCE_PM_TITLE_REGEX = re.compile(CONFLUENCE_TITLE)
 CONFLUENCE_PM_ARCHIVE_TITLE = r"^(?:\[Archive\] )?Q([1-4]) (\d{4})"
 CONFLUENCE_PM_ARCHIVE_TITLE_REGEX = re.compile(CONFLUENCE_PM_ARCHIVE_TITLE)
 
+SEARCH_SNIPPET_START_SEL = "\x02"
+"""Marks the start of a match in search snippets. A control character, so it can't be confused with the page content."""
+SEARCH_SNIPPET_STOP_SEL = "\x03"
+"""Marks the end of a match in search snippets."""
+
 
 def parse_postmortem_title(title: str) -> tuple[datetime, str] | tuple[None, None]:
     """Parse postmortem title and return the date and quarter associated to this date, in the format YYYYQX.
@@ -104,3 +122,20 @@ def parse_runbook_title(title: str) -> str | None:
     # Remove leading text in brackets
     title = re.sub(r"^\[.*\] ", "", title)
     return title.strip()
+
+
+def highlight_search_snippet(snippet: str) -> SafeString:
+    """Escape a search snippet and highlight its matches with `<mark>` tags.
+
+    Args:
+        snippet (str): Snippet from the full-text search, with matches surrounded by [SEARCH_SNIPPET_START_SEL][firefighter.confluence.utils.SEARCH_SNIPPET_START_SEL] and [SEARCH_SNIPPET_STOP_SEL][firefighter.confluence.utils.SEARCH_SNIPPET_STOP_SEL].
+
+    Returns:
+        SafeString: HTML snippet, safe to render.
+    """
+    escaped = escape(unescape(snippet))
+    return mark_safe(  # noqa: S308
+        escaped.replace(SEARCH_SNIPPET_START_SEL, "<mark>").replace(
+            SEARCH_SNIPPET_STOP_SEL, "</mark>"
+        )
+    )
@@ -10,6 +10,8 @@ from firefighter.confluence.models import Runbook, RunbookFilterSet
 from firefighter.confluence.tables import RunbookTable
 
 if TYPE_CHECKING:
+    from django_tables2 import Table
+
     from firefighter.firefighter.utils import HtmxHttpRequest
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,13 @@ class RunbooksViewList(SingleTableMixin, FilterView):
     paginate_by = 150
     paginate_orphans = 20
 
+    def get_table(self, **kwargs: Any) -> Table:
+        table = super().get_table(**kwargs)
+        # Search snippets are only computed when searching
+        if not self.request.GET.get("search"):
+            table.exclude = ("search_snippet",)
+        return table
+
     def get_template_names(self) -> list[str]:
         request = cast("HtmxHttpRequest", self.request)
         if request.htmx and not request.htmx.boosted:
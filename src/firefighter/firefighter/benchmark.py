@@ -0,0 +1,416 @@
+"""Benchmark the hot paths of FireFighter on a synthetic dataset, to compare their performance between commits.
+
+The dataset is generated with [generate_dataset][firefighter.firefighter.benchmark.generate_dataset], with a configurable size and a fixed seed,
+so two runs with the same [DatasetSize][firefighter.firefighter.benchmark.DatasetSize] measure the same workload.
+
+Results are plain dicts, saved as JSON by the `benchmark` management command, and compared with a previous run with
+[compare_results][firefighter.firefighter.benchmark.compare_results].
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import statistics
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.apps import apps
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from firefighter.firefighter.query_budget import record_queries
+from firefighter.incidents.enums import IncidentStatus
+from firefighter.incidents.models import (
+    Environment,
+    Incident,
+    IncidentCategory,
+    IncidentUpdate,
+    Priority,
+    User,
+)
+from firefighter.incidents.models.metric_type import IncidentMetric
+from firefighter.slack.models import SlackUser
+from firefighter.slack.models.user_group import UserGroup
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from django.http.response import HttpResponseBase
+
+logger = logging.getLogger(__name__)
+
+WORDS = (
+    "api",
+    "checkout",
+    "payment",
+    "database",
+    "latency",
+    "outage",
+    "timeout",
+    "search",
+    "login",
+    "cart",
+    "infrastructure",
+    "network",
+    "dns",
+    "certificate",
+    "kafka",
+    "queue",
+    "worker",
+    "deployment",
+    "rollback",
+    "memory",
+    "disk",
+    "cpu",
+    "cache",
+    "redis",
+    "elasticsearch",
+    "mobile",
+    "android",
+    "ios",
+)
+"""Vocabulary of the synthetic incident titles and descriptions."""
+
+SEARCH_TERMS = ("checkout", "database latency", "infra")
+
+
+class BenchmarkError(Exception):
+    """Raised when a benchmarked path fails, as its timing would be meaningless."""
+
+
+@dataclass
+class DatasetSize:
+    """Size of the synthetic dataset."""
+
+    incidents: int = 1000
+    users: int = 200
+    usergroups: int = 20
+    """Slack user groups, linked to the incident categories, used to build the invite lists."""
+    escalation_policies: int = 10
+    """PagerDuty escalation policies, with two on-calls each. Ignored if PagerDuty is disabled."""
+    days: int = 365
+    """Incidents are created over this number of days, until now."""
+    seed: int = 42
+
+
+@dataclass
+class Dataset:
+    """Objects created by [generate_dataset][firefighter.firefighter.benchmark.generate_dataset]."""
+
+    size: DatasetSize
+    superuser: User
+    incidents: list[Incident]
+    counts: dict[str, int] = field(default_factory=dict)
+    """Number of rows created, per model."""
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def generate_dataset(size: DatasetSize) -> Dataset:
+    """Create a synthetic dataset with bulk inserts: users, Slack user groups, incidents with their milestones and metrics, and PagerDuty on-calls.
+
+    Incident categories, priorities and environments are not generated: the fixtures must be loaded.
+    The dataset is added to the existing data, run it in a transaction to discard it.
+
+    Args:
+        size (DatasetSize): Size of the dataset.
+
+    Returns:
+        Dataset: The created objects.
+
+    Raises:
+        BenchmarkError: If the fixtures are not loaded.
+    """
+    rng = random.Random(size.seed)  # noqa: S311
+    # Unique fields must not clash with a previous dataset that was kept
+    run_id = uuid.uuid4().hex[:8]
+    now = timezone.now()
+
+    categories = list(IncidentCategory.objects.order_by("id"))
+    priorities = list(Priority.objects.order_by("value"))
+    environments = list(Environment.objects.order_by("order"))
+    if not (categories and priorities and environments):
+        msg = "Incident categories, priorities and environments are required, load the fixtures first."
+        raise BenchmarkError(msg)
+
+    superuser = User.objects.create_superuser(
+        username=f"benchmark_{run_id}", email=f"benchmark_{run_id}@example.com"
+    )
+    users = User.objects.bulk_create(
+        User(
+            username=f"benchmark_{run_id}_{i}",
+            email=f"benchmark_{run_id}_{i}@example.com",
+            name=f"Benchmark User {i}",
+        )
+        for i in range(size.users)
+    )
+    SlackUser.objects.bulk_create(
+        SlackUser(user=user, slack_id=f"UB{run_id}{i}".upper())
+        for i, user in enumerate(users)
+    )
+    usergroups = UserGroup.objects.bulk_create(
+        UserGroup(name=f"Benchmark group {i}", handle=f"benchmark-{run_id}-{i}")
+        for i in range(size.usergroups)
+    )
+    for usergroup in usergroups:
+        usergroup.members.set(rng.sample(users, min(len(users), 10)))
+        usergroup.incident_categories.set(
+            rng.sample(categories, min(len(categories), 3))
+        )
+
+    incidents = Incident.objects.bulk_create(
+        Incident(
+            title=_text(rng, 5).capitalize(),
+            description=_text(rng, 30),
+            _status=rng.choice(IncidentStatus.values),
+            priority=rng.choice(priorities),
+            incident_category=rng.choice(categories),
+            environment=rng.choice(environments),
+            created_by=rng.choice(users),
+        )
+        for _ in range(size.incidents)
+    )
+    # created_at is set on insert (auto_now_add), spread the incidents over the period afterwards
+    for incident in incidents:
+        incident.created_at = now - timedelta(
+            seconds=rng.randint(0, size.days * 24 * 3600)
+        )
+    Incident.objects.bulk_update(incidents, ["created_at"], batch_size=1000)
+
+    milestones: list[IncidentUpdate] = []
+    for incident in incidents:
+        event_ts = incident.created_at
+        for event_type in ("detected", "declared", "mitigated", "recovered"):
+            milestones.append(
+                IncidentUpdate(
+                    incident=incident,
+                    created_by=incident.created_by,
+                    event_type=event_type,
+                    event_ts=event_ts,
+                )
+            )
+            event_ts += timedelta(minutes=rng.randint(1, 240))
+        if incident.status == IncidentStatus.CLOSED:
+            milestones.append(
+                IncidentUpdate(
+                    incident=incident,
+                    created_by=incident.created_by,
+                    event_type="resolved",
+                    event_ts=event_ts,
+                )
+            )
+    IncidentUpdate.objects.bulk_create(milestones, batch_size=1000)
+    metrics, _ = IncidentMetric.objects.compute_for_incidents(
+        [incident.id for incident in incidents]
+    )
+
+    counts = {
+        "users": len(users),
+        "usergroups": len(usergroups),
+        "incidents": len(incidents),
+        "milestones": len(milestones),
+        "metrics": metrics,
+    }
+    if apps.is_installed("firefighter.pagerduty"):
+        counts["oncalls"] = _generate_oncalls(
+            users, size.escalation_policies, run_id, now
+        )
+
+    # Up-to-date planner statistics, as in production, or the first queries on the new rows get poor plans
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    return Dataset(size=size, superuser=superuser, incidents=incidents, counts=counts)
+
+
+def _generate_oncalls(
+    users: list[User], escalation_policies: int, run_id: str, now: datetime
+) -> int:
+    from firefighter.pagerduty.models import (
+        PagerDutyEscalationPolicy,
+        PagerDutyOncall,
+        PagerDutyUser,
+    )
+
+    pagerduty_users = PagerDutyUser.objects.bulk_create(
+        PagerDutyUser(user=user, name=user.name, pagerduty_id=f"PB{run_id}{i}")
+        for i, user in enumerate(users[: escalation_policies * 2])
+    )
+    policies = PagerDutyEscalationPolicy.objects.bulk_create(
+        PagerDutyEscalationPolicy(
+            name=f"Benchmark policy {run_id} {i}", pagerduty_id=f"PEB{run_id}{i}"
+        )
+        for i in range(escalation_policies)
+    )
+    oncalls = PagerDutyOncall.objects.bulk_create(
+        PagerDutyOncall(
+            escalation_policy=policy,
+            pagerduty_user=pagerduty_users[(2 * i + level) % len(pagerduty_users)],
+            escalation_level=level + 1,
+            start=now - timedelta(days=1),
+            end=now + timedelta(days=1),
+        )
+        for i, policy in enumerate(policies)
+        for level in range(2)
+    )
+    return len(oncalls)
+
+
+def _get(client: Client, path: str, **params: str) -> HttpResponseBase:
+    response = client.get(path, params)
+    if response.status_code != 200:
+        msg = f"GET {path} returned HTTP {response.status_code}"
+        raise BenchmarkError(msg)
+    return response
+
+
+def get_benchmarks(dataset: Dataset) -> dict[str, Callable[[], object]]:
+    """Hot paths to benchmark, by name. Each callable runs the path once.
+
+    Views are requested with the Django test client, logged in as the dataset superuser.
+    """
+    from firefighter.slack.views.modals.update_status import (
+        modal_update_status,
+    )
+
+    client = Client()
+    client.force_login(dataset.superuser)
+    incident_ids = [incident.id for incident in dataset.incidents]
+    # Sample of incidents, for the per-incident paths
+    sample = dataset.incidents[:: max(1, len(dataset.incidents) // 20)][:20]
+    now = timezone.now()
+    api_path = reverse("api:incidents-list")
+
+    benchmarks: dict[str, Callable[[], object]] = {
+        "incident_list": lambda: _get(client, reverse("incidents:incident-list")),
+        "incident_search": lambda: [
+            _get(client, reverse("incidents:incident-list"), search=term)
+            for term in SEARCH_TERMS
+        ],
+        "incident_statistics": lambda: _get(
+            client, reverse("incidents:incident-statistics")
+        ),
+        "api_export_json": lambda: _get(client, api_path, format="json"),
+        "api_export_csv": lambda: _get(client, api_path, format="csv"),
+        "mtbf": lambda: list(
+            IncidentCategory.objects.queryset_with_mtbf(
+                now - timedelta(days=dataset.size.days), now
+            )
+        ),
+        "compute_metrics": lambda: IncidentMetric.objects.compute_for_incidents(
+            incident_ids
+        ),
+        "build_invite_list": lambda: [
+            incident.build_invite_list() for incident in sample
+        ],
+        "modal_rendering": lambda: [
+            modal_update_status.build_modal_fn(incident).to_dict()
+            for incident in sample
+        ],
+    }
+    if apps.is_installed("firefighter.pagerduty"):
+        from firefighter.pagerduty.models import PagerDutyOncall
+
+        benchmarks["oncall_lookup"] = (
+            PagerDutyOncall.objects.get_current_oncalls_per_escalation_policy
+        )
+    return benchmarks
+
+
+def run_benchmark(func: Callable[[], object], rounds: int = 5) -> dict[str, Any]:
+    """Time a callable, after a warmup run.
+
+    Args:
+        func (Callable[[], object]): The benchmarked path.
+        rounds (int, optional): Number of timed runs. Defaults to 5.
+
+    Returns:
+        dict[str, Any]: Timings in milliseconds (min, median, mean, standard deviation) and the number of database queries of one run.
+    """
+    func()
+    timings: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    # Queries are counted on a separate run, as recording them has an overhead
+    with record_queries() as stats:
+        func()
+    return {
+        "rounds": rounds,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "mean_ms": round(statistics.mean(timings), 3),
+        "stdev_ms": round(statistics.stdev(timings), 3) if rounds > 1 else 0.0,
+        "queries": stats.count,
+    }
+
+
+def run_benchmarks(
+    dataset: Dataset, rounds: int = 5, only: list[str] | None = None
+) -> dict[str, Any]:
+    """Run the benchmarks on a dataset.
+
+    Args:
+        dataset (Dataset): The dataset, from [generate_dataset][firefighter.firefighter.benchmark.generate_dataset].
+        rounds (int, optional): Number of timed runs per benchmark. Defaults to 5.
+        only (list[str] | None, optional): Names of the benchmarks to run. Defaults to all of them.
+
+    Returns:
+        dict[str, Any]: The results, with the dataset size and counts, serializable as JSON.
+
+    Raises:
+        BenchmarkError: If a benchmark name is unknown or a benchmarked view does not return HTTP 200.
+    """
+    benchmarks = get_benchmarks(dataset)
+    if only:
+        unknown = set(only) - set(benchmarks)
+        if unknown:
+            msg = f"Unknown benchmarks: {', '.join(sorted(unknown))}. Available: {', '.join(benchmarks)}"
+            raise BenchmarkError(msg)
+        benchmarks = {name: benchmarks[name] for name in only}
+
+    results: dict[str, dict[str, Any]] = {}
+    for name, func in benchmarks.items():
+        logger.info("Running benchmark %s", name)
+        results[name] = run_benchmark(func, rounds)
+    return {
+        "dataset": {**asdict(dataset.size), "counts": dataset.counts},
+        "results": results,
+    }
+
+
+def compare_results(
+    previous: dict[str, Any], current: dict[str, Any], threshold: float = 0.2
+) -> dict[str, dict[str, Any]]:
+    """Compare the median timings of two runs.
+
+    Args:
+        previous (dict[str, Any]): Results of the reference run.
+        current (dict[str, Any]): Results of the new run.
+        threshold (float, optional): Relative slowdown above which a benchmark is a regression. Defaults to 0.2 (20%).
+
+    Returns:
+        dict[str, dict[str, Any]]: For each benchmark in both runs, the `ratio` of the medians (current / previous), and whether it is a `regression`.
+    """
+    comparison: dict[str, dict[str, Any]] = {}
+    for name, result in current["results"].items():
+        reference = previous["results"].get(name)
+        if not reference or not reference["median_ms"]:
+            continue
+        ratio = result["median_ms"] / reference["median_ms"]
+        comparison[name] = {
+            "ratio": round(ratio, 3),
+            "queries": result["queries"] - reference["queries"],
+            "regression": ratio > 1 + threshold,
+        }
+    return comparison
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import platform
+from pathlib import Path
+from typing import Any
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.utils import timezone
+
+from firefighter.firefighter.benchmark import (
+    BenchmarkError,
+    DatasetSize,
+    compare_results,
+    generate_dataset,
+    run_benchmarks,
+)
+from firefighter.firefighter.settings.settings_utils import FF_VERSION
+
+
+class Command(BaseCommand):
+    help = "Benchmark the hot paths (incident list, search, statistics, API export, MTBF, metrics, invite list, on-call lookup, modals) on a synthetic dataset, and save the results as JSON. Run it against a local database with DEBUG=False."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        defaults = DatasetSize()
+        parser.add_argument(
+            "--incidents",
+            type=int,
+            default=defaults.incidents,
+            help=f"Number of incidents generated (default: {defaults.incidents})",
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=defaults.users,
+            help=f"Number of users generated (default: {defaults.users})",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=defaults.seed,
+            help=f"Seed of the dataset generator (default: {defaults.seed})",
+        )
+        parser.add_argument(
+            "-r",
+            "--rounds",
+            type=int,
+            default=5,
+            help="Timed runs per benchmark, after a warmup run (default: 5)",
+        )
+        parser.add_argument(
+            "-k",
+            "--only",
+            action="append",
+            help="Only run this benchmark (can be repeated)",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            type=Path,
+            help="Save the results to this JSON file",
+        )
+        parser.add_argument(
+            "--label",
+            default="",
+            help="Label of the run, saved with the results (e.g. the commit hash)",
+        )
+        parser.add_argument(
+            "--compare",
+            type=Path,
+            help="Compare with the results of a previous run, and fail on regressions",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Relative slowdown of the median considered a regression (default: 0.2)",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the generated dataset, instead of rolling it back",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        size = DatasetSize(
+            incidents=options["incidents"], users=options["users"], seed=options["seed"]
+        )
+        try:
+            with transaction.atomic():
+                dataset = generate_dataset(size)
+                self.stdout.write(f"Generated dataset: {dataset.counts}")
+                report = run_benchmarks(
+                    dataset, rounds=options["rounds"], only=options["only"]
+                )
+                transaction.set_rollback(not options["keep"])
+        except BenchmarkError as e:
+            raise CommandError(str(e)) from e
+
+        report = {
+            "label": options["label"],
+            "version": str(FF_VERSION),
+            "created_at": timezone.now().isoformat(),
+            "debug": settings.DEBUG,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            **report,
+        }
+        for name, result in report["results"].items():
+            self.stdout.write(
+                f"{name:<22} median {result['median_ms']:>10.2f}ms  min {result['min_ms']:>10.2f}ms  {result['queries']:>4} queries"
+            )
+        if options["output"]:
+            options["output"].write_text(json.dumps(report, indent=2))
+            self.stdout.write(f"Results saved to {options['output']}")
+
+        if options["compare"]:
+            previous = json.loads(options["compare"].read_text())
+            comparison = compare_results(previous, report, options["threshold"])
+            for name, diff in comparison.items():
+                line = (
+                    f"{name:<22} {diff['ratio']:>6.2f}x  {diff['queries']:+d} queries"
+                )
+                self.stdout.write(
+                    self.style.ERROR(line) if diff["regression"] else line
+                )
+            regressions = [
+                name for name, diff in comparison.items() if diff["regression"]
+            ]
+            if regressions:
+                msg = f"Performance regressions: {', '.join(regressions)}"
+                raise CommandError(msg)
+            self.stdout.write(self.style.SUCCESS("No performance regression"))
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import logging
+import sys
+import timeit
+from functools import partial
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from firefighter.firefighter.settings.components.logging import get_json_formatter
+
+GUNICORN_ACCESS_ARGS: dict[str, Any] = {
+    "h": "10.0.0.1",
+    "r": "GET /api/v2/firefighter/incidents HTTP/1.1",
+    "s": 200,
+    "{raw_uri}e": "/api/v2/firefighter/incidents",
+    "{request_method}e": "GET",
+    "{server_protocol}e": "HTTP/1.1",
+    "{wsgi.url_scheme}e": "https",
+    "{wsgi.multithread}e": False,
+    "{accept}i": "application/json",
+    "{accept-encoding}i": "gzip, deflate, br",
+    "{user-agent}i": "Mozilla/5.0",
+    "{x-forwarded-for}i": "10.0.0.2",
+    "{x-request-id}i": "4c6a8d9e",
+    "{sec-fetch-mode}i": "cors",
+    "{content-type}o": "application/json",
+}
+
+
+def make_records() -> dict[str, logging.LogRecord]:
+    """Sample records representative of the production logs."""
+    try:
+        raise ValueError("Invalid value: 42")  # noqa: TRY301
+    except ValueError:
+        exc_info = sys.exc_info()
+    return {
+        "app": logging.LogRecord(
+            "firefighter.incidents",
+            logging.INFO,
+            __file__,
+            1,
+            "Incident %s opened",
+            ("#42",),
+            None,
+        ),
+        "exception": logging.LogRecord(
+            "django.request",
+            logging.ERROR,
+            __file__,
+            1,
+            "Internal Server Error",
+            None,
+            exc_info,
+        ),
+        "gunicorn": logging.LogRecord(
+            "gunicorn.access",
+            logging.INFO,
+            __file__,
+            1,
+            '%(h)s "%(r)s" %(s)s',
+            GUNICORN_ACCESS_ARGS,
+            None,
+        ),
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare the throughput of the JSON log formatters."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "-n", "--number", type=int, default=20000, help="Records formatted per run."
+        )
+        parser.add_argument(
+            "-r",
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of runs, the best one is kept.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        number: int = options["number"]
+        repeat: int = options["repeat"]
+        formatters: dict[str, logging.Formatter] = {}
+        for name, fast in (("legacy", False), ("fast", True)):
+            config: dict[str, Any] = get_json_formatter(fast=fast)
+            factory = config.pop("()")
+            formatters[name] = factory(**config)
+
+        for record_name, record in make_records().items():
+            results: dict[str, float] = {}
+            for name, formatter in formatters.items():
+                best = min(
+                    timeit.repeat(
+                        partial(formatter.format, record),
+                        number=number,
+                        repeat=repeat,
+                    )
+                )
+                results[name] = number / best
+                self.stdout.write(
+                    f"{record_name:<10} {name:<7} {results[name]:>12,.0f} records/s"
+                )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{record_name:<10} speedup {results['fast'] / results['legacy']:.2f}x"
+                )
+            )
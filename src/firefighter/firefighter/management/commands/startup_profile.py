@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from firefighter.firefighter.startup_profile import import_times_by_package
+
+PHASES = ("import_ms", "models_ms", "ready_ms")
+PROFILE_CODE = "import time; start = time.perf_counter(); from firefighter.firefighter.startup_profile import main; main(start)"
+
+
+class Command(BaseCommand):
+    help = "Profile the cold start of a process (settings, each Django app, URLconf) in fresh interpreters, and report the median timings."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "-n",
+            "--runs",
+            type=int,
+            default=3,
+            help="Number of fresh processes to profile (default: 3)",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=15,
+            help="Number of apps and packages to display, the slowest first (default: 15)",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            type=Path,
+            help="Save the median timings to this JSON file",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        profiles = [self._run_profile() for _ in range(options["runs"])]
+        report = self._median_profile(profiles)
+
+        self.stdout.write(
+            f"Total {report['total_ms']:.0f}ms: settings {report['settings_ms']:.0f}ms, django.setup() {report['setup_ms']:.0f}ms, URLconf {report['urlconf_ms']:.0f}ms"
+        )
+        self.stdout.write(
+            f"{'app':<28} {'total':>9} {'import':>9} {'models':>9} {'ready':>9}"
+        )
+        apps = sorted(
+            report["apps"].items(),
+            key=lambda item: sum(item[1].values()),
+            reverse=True,
+        )
+        for label, timings in apps[: options["top"]]:
+            self.stdout.write(
+                f"{label:<28} {sum(timings.values()):>7.1f}ms"
+                + "".join(f" {timings[phase]:>7.1f}ms" for phase in PHASES)
+            )
+        self.stdout.write(f"{'package (self import time)':<28} {'total':>9}")
+        for package, import_ms in list(report["packages"].items())[: options["top"]]:
+            self.stdout.write(f"{package:<28} {import_ms:>7.1f}ms")
+        if options["output"]:
+            options["output"].write_text(json.dumps(report, indent=2))
+            self.stdout.write(f"Results saved to {options['output']}")
+
+    @staticmethod
+    def _run_profile() -> dict[str, Any]:
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", PROFILE_CODE],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            msg = f"Startup profile failed:\n{result.stderr}"
+            raise CommandError(msg)
+        # Settings or apps may print on stdout: the report is the last line
+        profile: dict[str, Any] = json.loads(result.stdout.strip().splitlines()[-1])
+        profile["packages"] = import_times_by_package(result.stderr)
+        return profile
+
+    @staticmethod
+    def _median_profile(profiles: list[dict[str, Any]]) -> dict[str, Any]:
+        def median(values: list[float]) -> float:
+            return round(statistics.median(values), 3)
+
+        labels = profiles[0]["apps"]
+        # A package may only be imported in some runs (e.g. lazily, by a thread)
+        packages = {
+            package: median(
+                [profile["packages"].get(package, 0.0) for profile in profiles]
+            )
+            for package in {
+                package for profile in profiles for package in profile["packages"]
+            }
+        }
+        return {
+            "runs": len(profiles),
+            **{
+                key: median([profile[key] for profile in profiles])
+                for key in ("settings_ms", "setup_ms", "urlconf_ms", "total_ms")
+            },
+            "apps": {
+                label: {
+                    phase: median(
+                        [profile["apps"][label][phase] for profile in profiles]
+                    )
+                    for phase in PHASES
+                }
+                for label in labels
+            },
+            "packages": dict(sorted(packages.items(), key=lambda item: -item[1])),
+        }
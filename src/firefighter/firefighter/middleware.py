@@ -3,11 +3,23 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import JsonResponse
+
+from firefighter.api.throttling import (
+    LaneFullError,
+    acquire_lane_slot,
+    get_lane,
+    log_throttled,
+    release_lane_slot,
+)
+from firefighter.firefighter.query_budget import check_query_budget, record_queries
 
 FF_USER_ID_HEADER: str = settings.FF_USER_ID_HEADER
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from typing import Any
 
     from django.http import HttpRequest, HttpResponse
 
@@ -33,3 +45,84 @@ class HeaderUser:
             response.headers[FF_USER_ID_HEADER] = str(request_user_id)
 
         return response
+
+
+class QueryBudgetMiddleware:
+    """Records the database queries of each request, and checks them against the query budget of the route.
+
+    See [firefighter.firefighter.query_budget][]. Only enabled if `FF_QUERY_BUDGET_ENABLED` is set.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.FF_QUERY_BUDGET_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with record_queries() as stats:
+            response: HttpResponse = self.get_response(request)
+
+        route = (
+            request.resolver_match.view_name
+            if request.resolver_match
+            else request.path_info
+        )
+        check_query_budget(route, stats)
+        return response
+
+
+class ApiLaneMiddleware:
+    """Limits the number of API requests of a lane processed at the same time, so bulk reads can't take all the web workers.
+
+    The lane of a view is its `throttle_scope`, or the one of the action in its `action_throttle_scopes`, see [firefighter.api.throttling][].
+    It is checked once the view is resolved, after the request phase of all the middlewares. Only enabled if `FF_API_LANE_CONCURRENCY` is set.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.FF_API_LANE_CONCURRENCY:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        try:
+            return self.get_response(request)
+        finally:
+            lane_slot: tuple[str, str] | None = getattr(request, "_api_lane_slot", None)
+            if lane_slot is not None:
+                release_lane_slot(*lane_slot)
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable[..., Any],
+        _view_args: Any,
+        _view_kwargs: Any,
+    ) -> HttpResponse | None:
+        # DRF views keep their class on the view function
+        view_class = getattr(view_func, "cls", None)
+        if view_class is None:
+            return None
+        # Viewsets keep the action of each HTTP method on the view function
+        actions: dict[str, str] = getattr(view_func, "actions", None) or {}
+        lane = get_lane(view_class, actions.get((request.method or "").lower()))
+        try:
+            slot = acquire_lane_slot(lane)
+        except LaneFullError as exc:
+            log_throttled(lane, view_class.__name__, "concurrency", exc.retry_after)
+            return JsonResponse(
+                {
+                    "type": "client_error",
+                    "errors": [
+                        {
+                            "code": "throttled",
+                            "detail": "Too many requests are being processed, please retry later.",
+                            "attr": None,
+                        }
+                    ],
+                },
+                status=429,
+                headers={"Retry-After": str(exc.retry_after)},
+            )
+        if slot is not None:
+            request._api_lane_slot = (lane, slot)  # type: ignore[attr-defined]  # noqa: SLF001
+        return None
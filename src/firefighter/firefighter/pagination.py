@@ -0,0 +1,101 @@
+"""Counting and paginating large querysets.
+
+An exact `COUNT(*)` scans all the matching rows, so it gets slower as the tables grow.
+[fast_count][firefighter.firefighter.pagination.fast_count] asks PostgreSQL for an estimate first (table statistics, or the query plan),
+and only runs the exact count when the estimate is small, so the count is cheap.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+logger = logging.getLogger(__name__)
+
+
+def get_table_row_estimate(model: type[Model], using: str = "default") -> int | None:
+    """Returns the number of rows of the table of a model, from the PostgreSQL statistics (`pg_class.reltuples`).
+
+    Returns:
+        int | None: Estimated number of rows, or None if the table was never analyzed.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+            [model._meta.db_table],  # noqa: SLF001
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def get_query_row_estimate(queryset: QuerySet[Any]) -> int:
+    """Returns the number of rows of a queryset, estimated by the PostgreSQL planner (`EXPLAIN`)."""
+    plan = json.loads(queryset.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def fast_count(
+    queryset: QuerySet[Any], exact_threshold: int | None = None
+) -> tuple[int, bool]:
+    """Counts the objects of a queryset, exactly if it is cheap, or returns an estimate.
+
+    Unfiltered querysets are estimated with the table statistics, filtered querysets with the query plan.
+    If the estimate is under `exact_threshold`, the objects are counted.
+
+    Args:
+        queryset (QuerySet[Any]): The queryset to count.
+        exact_threshold (int | None, optional): Maximum estimate to run an exact count. Defaults to `settings.FF_EXACT_COUNT_THRESHOLD`.
+
+    Returns:
+        tuple[int, bool]: The count, and whether it is exact.
+    """
+    if exact_threshold is None:
+        exact_threshold = settings.FF_EXACT_COUNT_THRESHOLD
+    if queryset.query.is_empty():
+        return 0, True
+    if connections[queryset.db].vendor != "postgresql":
+        return queryset.count(), True
+
+    estimate: int | None
+    if not queryset.query.where and not queryset.query.distinct:
+        estimate = get_table_row_estimate(queryset.model, using=queryset.db)
+    else:
+        estimate = get_query_row_estimate(queryset)
+    if estimate is None or estimate <= exact_threshold:
+        return queryset.count(), True
+    logger.debug("Estimated count of %s: %s", queryset.model.__name__, estimate)
+    return estimate, False
+
+
+class EstimatedCountPaginator(Paginator[Any]):
+    """Paginator counting the objects with [fast_count][firefighter.firefighter.pagination.fast_count].
+
+    When the count is an estimate, `count_is_exact` is False and the last pages may be incomplete or empty.
+    Works with querysets, and with django-tables2 rows of a queryset.
+    """
+
+    count_is_exact = True
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        # django-tables2 paginates its rows, which wrap the queryset
+        table_data = getattr(queryset, "data", None)
+        if table_data is not None:
+            queryset = getattr(table_data, "data", queryset)
+        if not isinstance(queryset, QuerySet):
+            return super().count
+        count, self.count_is_exact = fast_count(queryset)
+        return count
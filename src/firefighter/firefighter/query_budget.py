@@ -0,0 +1,134 @@
+"""Record the database queries executed while handling a request or a Slack event, and check them against a budget.
+
+The number of queries, their total duration and the queries executed many times (likely N+1) are logged to the
+`firefighter.observability` logger, as structured attributes. When a route exceeds its budget, a warning is logged instead,
+or [QueryBudgetExceededError][firefighter.firefighter.query_budget.QueryBudgetExceededError] is raised if `FF_QUERY_BUDGET_RAISE` is set (e.g. in tests).
+
+The Django middleware is [QueryBudgetMiddleware][firefighter.firefighter.middleware.QueryBudgetMiddleware], and Slack listeners are instrumented in [firefighter.slack.query_budget][].
+
+Budgets are configured per route in `FF_QUERY_BUDGETS`, with the URL name for Django views (e.g. `incidents:incident-detail`)
+and `slack:<command, action_id, callback_id or event type>` for Slack events (e.g. `slack:/incident`).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.db import connections
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+logger = logging.getLogger("firefighter.observability")
+
+_IN_LIST_RE = re.compile(r"\bIN \((?:%s, )*%s\)")
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class QueryBudgetExceededError(Exception):
+    """Raised when a route exceeds its query budget, if `FF_QUERY_BUDGET_RAISE` is set."""
+
+
+def fingerprint(sql: str) -> str:
+    """Normalize a SQL query, so that the same query with different parameters has the same fingerprint."""
+    sql = _LITERAL_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("IN (...)", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+@dataclass
+class QueryStats:
+    """Queries executed, on all databases."""
+
+    count: int = 0
+    duration: float = 0.0
+    """Total duration, in seconds."""
+    fingerprints: Counter[str] = field(default_factory=Counter)
+
+    def duplicates(self, threshold: int = 2) -> dict[str, int]:
+        """Fingerprints of the queries executed at least `threshold` times, most executed first."""
+        return {
+            sql: count
+            for sql, count in self.fingerprints.most_common()
+            if count >= threshold
+        }
+
+    def record(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        """Database execute wrapper, see [Database instrumentation](https://docs.djangoproject.com/en/4.2/topics/db/instrumentation/)."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryStats]:
+    """Record the queries executed in the current thread, on all databases."""
+    stats = QueryStats()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats.record))
+        yield stats
+
+
+def check_query_budget(route: str, stats: QueryStats) -> None:
+    """Log the queries of a route, and warn (or raise) if its budget is exceeded or if a query is repeated too many times.
+
+    Args:
+        route (str): Name of the route, used to find its budget in `FF_QUERY_BUDGETS`.
+        stats (QueryStats): Queries executed for the route.
+
+    Raises:
+        QueryBudgetExceededError: If the budget is exceeded and `FF_QUERY_BUDGET_RAISE` is set.
+    """
+    budget: int | None = settings.FF_QUERY_BUDGETS.get(route)
+    if budget is None:
+        budget = settings.FF_QUERY_BUDGET_DEFAULT or None
+    duplicates = stats.duplicates(settings.FF_QUERY_BUDGET_DUPLICATES)
+    extra = {
+        "ff.metric": "db.queries",
+        "ff.route": route,
+        "ff.db.query_count": stats.count,
+        "ff.db.duration_ms": round(stats.duration * 1000, 3),
+        "ff.db.duplicate_queries": duplicates,
+        "ff.db.query_budget": budget,
+    }
+    problems = []
+    if budget is not None and stats.count > budget:
+        problems.append(f"{stats.count} queries, over its budget of {budget}")
+    if duplicates:
+        problems.append(
+            f"{len(duplicates)} queries executed at least {settings.FF_QUERY_BUDGET_DUPLICATES} times (possible N+1)"
+        )
+    if not problems:
+        logger.info(
+            "%s: %s queries in %.1fms",
+            route,
+            stats.count,
+            stats.duration * 1000,
+            extra=extra,
+        )
+        return
+
+    message = f"Query budget exceeded for {route}: {', '.join(problems)}"
+    if settings.FF_QUERY_BUDGET_RAISE:
+        raise QueryBudgetExceededError(message)
+    logger.warning(message, extra=extra)
@@ -5,6 +5,7 @@ from firefighter.firefighter.settings.settings_utils import (
     APP_DISPLAY_NAME,
     BASE_URL,
     FF_VERSION,
+    config,
 )
 
 # DRF - Django REST Framework settings
@@ -26,6 +27,13 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_standardized_errors.openapi.AutoSchema",
     "EXCEPTION_HANDLER": "drf_standardized_errors.handler.exception_handler",
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
+    # Per client and view, by lane (`throttle_scope` of the views). See firefighter.api.throttling
+    "DEFAULT_THROTTLE_CLASSES": ["firefighter.api.throttling.SlidingWindowThrottle"],
+    "DEFAULT_THROTTLE_RATES": {
+        "critical": None,
+        "default": config("FF_API_THROTTLE_RATE", default="600/min"),
+        "bulk": config("FF_API_THROTTLE_RATE_BULK", default="60/min"),
+    },
 }
 
 
@@ -82,6 +90,13 @@ Mixing different ways to request a format may lead to unexpected results and err
 
 Endpoints are not yet paginated, but it will be in the future.
 
+### Conditional requests
+
+Read endpoints of incidents, incident categories, priorities, environments and groups return an `ETag` header.
+Send it back in the `If-None-Match` header: if the data has not changed, the response is an empty `304 Not Modified`.
+
+To poll the incidents, use the `since` query parameter to only get the incidents updated after your last call.
+
 ### Errors
 
 Errors format are standardized, and are documented in the OpenAPI schema.
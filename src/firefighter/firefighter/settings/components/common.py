@@ -67,6 +67,10 @@ MIDDLEWARE: tuple[str, ...] = (
     "django.middleware.security.SecurityMiddleware",
     # Whitenoise (serves assets) must come first, but after django.middleware.security.SecurityMiddleware
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Before the others, to also count the queries of the session and authentication
+    "firefighter.firefighter.middleware.QueryBudgetMiddleware",
+    # Wraps the others, so its lane slot is released after their response. The lane is checked once the view is resolved
+    "firefighter.firefighter.middleware.ApiLaneMiddleware",
     # Django:
     "django.middleware.common.CommonMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -80,6 +84,26 @@ MIDDLEWARE: tuple[str, ...] = (
     "django.contrib.messages.middleware.MessageMiddleware",
 )
 
+FF_QUERY_BUDGET_ENABLED: bool = config(
+    "FF_QUERY_BUDGET_ENABLED", default=False, cast=bool
+)
+"""Record the database queries of each request and Slack listener, and log them to the `firefighter.observability` logger."""
+FF_QUERY_BUDGET_DEFAULT: int = config("FF_QUERY_BUDGET_DEFAULT", default=0, cast=int)
+"""Maximum number of queries of a route without its own budget in `FF_QUERY_BUDGETS`. 0 means no limit."""
+FF_QUERY_BUDGETS: dict[str, int] = {
+    "incidents:incident-detail": 15,
+    "incidents:user-detail": 10,
+    "slack:/incident": 15,
+    "slack:app_home_opened": 5,
+}
+"""Maximum number of queries per route, by URL name (e.g. `incidents:incident-detail`) or Slack route (e.g. `slack:/incident`). Override it in `FF_ADDITIONAL_SETTINGS_MODULE`."""
+FF_QUERY_BUDGET_DUPLICATES: int = config(
+    "FF_QUERY_BUDGET_DUPLICATES", default=10, cast=int
+)
+"""Number of executions of the same query in a route above which a possible N+1 is reported."""
+FF_QUERY_BUDGET_RAISE: bool = config("FF_QUERY_BUDGET_RAISE", default=False, cast=bool)
+"""Raise an exception instead of logging a warning when a budget is exceeded. Useful in tests."""
+
 ROOT_URLCONF = "firefighter.firefighter.urls"
 
 WSGI_APPLICATION = "firefighter.firefighter.wsgi.application"
@@ -311,3 +335,27 @@ FF_SKIP_SECRET_KEY_CHECK: bool = config(
 
 FF_EXPOSE_API_DOCS: bool = config("FF_EXPOSE_API_DOCS", default=False, cast=bool)
 "Expose the API documentation. Useful for debugging. Can be a security issue."
+
+FF_SIGNALS_ASYNC: bool = config("FF_SIGNALS_ASYNC", default=True, cast=bool)
+"Run the `async` receivers of the incident lifecycle signals (Slack, Jira, Confluence...) in Celery after commit. If disabled, they run inline, when the signal is sent."
+
+FF_EXACT_COUNT_THRESHOLD: int = config(
+    "FF_EXACT_COUNT_THRESHOLD", default=10000, cast=int
+)
+"Lists with more results than this (estimated by PostgreSQL) show an estimated count instead of running an exact `COUNT(*)`."
+
+FF_API_TOKEN_CACHE_TTL: int = config("FF_API_TOKEN_CACHE_TTL", default=300, cast=int)
+"Seconds an authenticated API token is cached, to not query the database on each API call. Deleted tokens and deactivated users are invalidated right away."
+
+FF_API_TOKEN_USAGE: bool = config("FF_API_TOKEN_USAGE", default=True, cast=bool)
+"Record the last use and the number of calls of the API tokens. Calls are counted in Redis, and written to the database every minute by Celery beat."
+
+FF_API_LANE_CONCURRENCY: dict[str, int] = {
+    "bulk": config("FF_API_BULK_CONCURRENCY", default=2, cast=int)
+}
+"""Maximum number of API requests processed at the same time, per lane (see [firefighter.api.throttling][]). Lanes not listed, like `critical`, are not limited."""
+
+FF_INCIDENT_EVENTS_RETENTION_DAYS: int = config(
+    "FF_INCIDENT_EVENTS_RETENTION_DAYS", default=90, cast=int
+)
+"Days the incident events of the change feed (see [firefighter.incidents.change_feed][]) are kept. Consumers can't resume from older events."
@@ -20,6 +20,15 @@ if ENABLE_JIRA:
         RAID_JIRA_API_URL = f"https://{RAID_JIRA_API_URL}"
     RAID_JIRA_API_URL = RAID_JIRA_API_URL.rstrip("/")
 
+    JIRA_USER_NOT_FOUND_CACHE_TTL: int = config(
+        "JIRA_USER_NOT_FOUND_CACHE_TTL", default=86400, cast=int
+    )
+    """Seconds during which a user or an account not found in Jira is not searched again."""
+    JIRA_ACCOUNT_CACHE_TTL: int = config(
+        "JIRA_ACCOUNT_CACHE_TTL", default=86400, cast=int
+    )
+    """Seconds a Jira account ID is cached with its user, for the webhooks and the watchers of the tickets."""
+
     # Jira Post-mortem Configuration
     ENABLE_JIRA_POSTMORTEM: bool = config(
         "ENABLE_JIRA_POSTMORTEM", cast=bool, default=False
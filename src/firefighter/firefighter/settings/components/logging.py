@@ -7,6 +7,7 @@ from firefighter.firefighter.settings.settings_utils import ENV, config
 from firefighter.logging.custom_json_formatter import (
     CustomJsonEncoder,
     CustomJsonFormatter,
+    FastJsonFormatter,
 )
 from firefighter.logging.pretty_formatter import PrettyFormatter
 
@@ -32,11 +33,11 @@ class AccessLogFilter(Filter):
         return True
 
 
-def get_json_formatter() -> dict[str, type[Formatter] | Any]:
+def get_json_formatter(*, fast: bool = False) -> dict[str, type[Formatter] | Any]:
     attr_whitelist = {"name", "levelname", "pathname", "lineno", "funcName"}
     attrs = [x for x in CustomJsonFormatter.RESERVED_ATTRS if x not in attr_whitelist]
     return {
-        "()": CustomJsonFormatter,
+        "()": FastJsonFormatter if fast else CustomJsonFormatter,
         "json_indent": None,
         "json_encoder": CustomJsonEncoder,
         "reserved_attrs": attrs,
@@ -49,8 +50,25 @@ base_level_override = config("LOG_LEVEL", cast=str, default="")
 if base_level_override and base_level_override != "":
     base_level = base_level_override.upper()
 
+LOG_JSON_FAST: bool = config("LOG_JSON_FAST", cast=bool, default=False)
+"""Use the optimized JSON formatter (and orjson, if installed)."""
+LOG_QUEUE: bool = config("LOG_QUEUE", cast=bool, default=False)
+"""Format and write logs in a background thread, instead of the thread emitting them."""
+
 formatter: dict[str, type[Formatter] | Any]
-formatter = {"()": PrettyFormatter} if ENV == "dev" else get_json_formatter()
+formatter = (
+    {"()": PrettyFormatter} if ENV == "dev" else get_json_formatter(fast=LOG_JSON_FAST)
+)
+handlers: dict[str, dict[str, Any]] = {
+    "console": {"class": "logging.StreamHandler", "formatter": "dynamicfmt"},
+}
+if LOG_QUEUE:
+    handlers["queue"] = {
+        "class": "firefighter.logging.queue_handler.DeferredFormattingQueueHandler",
+        "handlers": ["console"],
+        "respect_handler_level": True,
+    }
+handler = "queue" if LOG_QUEUE else "console"
 
 # NOTE: ERROR-level logs from this service are monitored by a Datadog log alert
 # defined in infra/spinak/main.ts (web-error-rate-monitor).
@@ -61,31 +79,29 @@ FF_LOGGING = {
     "formatters": {
         "dynamicfmt": formatter,
     },
-    "handlers": {
-        "console": {"class": "logging.StreamHandler", "formatter": "dynamicfmt"},
-    },
+    "handlers": handlers,
     "loggers": {
         "django": {
-            "handlers": ["console"],
+            "handlers": [handler],
             "propagate": False,
         },
         "watchfiles.main": {"level": "INFO"},
         "django.utils.autoreload": {"level": "INFO"},
-        "django.request": {"handlers": ["console"], "propagate": False},
-        "django.server": {"handlers": ["console"], "propagate": False},
-        "django.template": {"handlers": ["console"], "propagate": False},
+        "django.request": {"handlers": [handler], "propagate": False},
+        "django.server": {"handlers": [handler], "propagate": False},
+        "django.template": {"handlers": [handler], "propagate": False},
         "django.db.backends": {
-            "handlers": ["console"],
+            "handlers": [handler],
             "propagate": False,
             "level": base_level,
         },
-        "django.db.backends.schema": {"handlers": ["console"], "propagate": False},
+        "django.db.backends.schema": {"handlers": [handler], "propagate": False},
         "gunicorn.access": {
-            "handlers": ["console"],
+            "handlers": [handler],
             "filters": ["accessfilter"],
             "propagate": False,
         },
-        "gunicorn.error": {"handlers": ["console"], "propagate": False},
+        "gunicorn.error": {"handlers": [handler], "propagate": False},
         "faker.factory": {
             "level": "INFO",
         },
@@ -95,7 +111,7 @@ FF_LOGGING = {
     },
     "filters": {"accessfilter": {"()": AccessLogFilter}},
     "root": {
-        "handlers": ["console"],
+        "handlers": [handler],
         "level": base_level,
         "propagate": False,
     },
@@ -51,6 +51,10 @@ FF_SLACK_SKIP_CHECKS: bool = config(
     "FF_SLACK_SKIP_CHECKS", cast=bool, default=_is_default_skip_check_cmd
 )
 """Skip Slack checks. Only use for testing or demo."""
+FF_SLACK_APP_DETAILS_CACHE_TTL: int = config(
+    "FF_SLACK_APP_DETAILS_CACHE_TTL", cast=int, default=86400
+)
+"""Seconds to cache the bot and workspace details (from Slack `auth.test`), shared by all processes. They are fetched on first use, not at startup."""
 
 ENABLE_DUST: bool = config("ENABLE_DUST", cast=bool, default=False)
 """Enable the 'Generate post-mortem with Dust' button in incident Slack messages."""
@@ -0,0 +1,141 @@
+"""Profile the start of a FireFighter process: settings, Django apps and URLconf.
+
+Modules are only imported once per process, so the profile must run in a fresh interpreter.
+Use the `startup_profile` management command to run it several times and display a summary.
+
+The command also runs the interpreter with `-X importtime`, to find which packages are the slowest to import
+(see [import_times_by_package][firefighter.firefighter.startup_profile.import_times_by_package]).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from collections import defaultdict
+from typing import Any, TypedDict
+
+from django.apps.config import AppConfig
+
+
+class AppTimings(TypedDict):
+    import_ms: float
+    """Import of the app module and its AppConfig."""
+    models_ms: float
+    """Import of the app models."""
+    ready_ms: float
+    """`AppConfig.ready()`, usually importing signals, tasks and views."""
+
+
+class StartupProfile(TypedDict):
+    settings_ms: float
+    """Import of the settings and the Celery app, by the `firefighter.firefighter` package."""
+    setup_ms: float
+    """Total of `django.setup()`, including the apps."""
+    urlconf_ms: float
+    total_ms: float
+    apps: dict[str, AppTimings]
+
+
+IMPORT_TIME_LINE = re.compile(
+    r"^import time:\s+(?P<self_us>\d+) \|\s+\d+ \|\s+(?P<module>[\w.]+)$"
+)
+
+
+def _ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+def profile_startup(start: float) -> StartupProfile:
+    """Set up Django and load the URLconf, timing each step and each app.
+
+    Must be called in a process where Django is not set up yet.
+
+    Args:
+        start (float): `time.perf_counter()` at the start of the process, before importing FireFighter.
+    """
+    import django
+    from django.conf import settings
+    from django.urls import get_resolver
+
+    apps: defaultdict[str, AppTimings] = defaultdict(
+        lambda: AppTimings(import_ms=0.0, models_ms=0.0, ready_ms=0.0)
+    )
+    original_create = AppConfig.create
+    original_import_models = AppConfig.import_models
+
+    def create(entry: str) -> AppConfig:
+        create_start = time.perf_counter()
+        app_config = original_create(entry)
+        apps[app_config.label]["import_ms"] = _ms(create_start)
+        original_ready = app_config.ready
+
+        def ready() -> None:
+            ready_start = time.perf_counter()
+            original_ready()
+            apps[app_config.label]["ready_ms"] = _ms(ready_start)
+
+        app_config.ready = ready  # type: ignore[method-assign]
+        return app_config
+
+    def import_models(self: AppConfig) -> None:
+        models_start = time.perf_counter()
+        original_import_models(self)
+        apps[self.label]["models_ms"] = _ms(models_start)
+
+    AppConfig.create = staticmethod(create)  # type: ignore[method-assign]
+    AppConfig.import_models = import_models  # type: ignore[method-assign]
+    try:
+        _ = settings.INSTALLED_APPS
+        settings_ms = _ms(start)
+
+        setup_start = time.perf_counter()
+        django.setup()
+        setup_ms = _ms(setup_start)
+    finally:
+        AppConfig.create = original_create  # type: ignore[method-assign]
+        AppConfig.import_models = original_import_models  # type: ignore[method-assign]
+
+    urlconf_start = time.perf_counter()
+    _ = get_resolver().url_patterns
+    urlconf_ms = _ms(urlconf_start)
+
+    return StartupProfile(
+        settings_ms=settings_ms,
+        setup_ms=setup_ms,
+        urlconf_ms=urlconf_ms,
+        total_ms=_ms(start),
+        apps=dict(apps),
+    )
+
+
+def import_times_by_package(importtime_output: str) -> dict[str, float]:
+    """Sums the import time of the modules of each package, from the output of `python -X importtime`.
+
+    Third-party modules are grouped by top-level package (e.g. `jira`), FireFighter modules by app (e.g. `firefighter.slack`).
+    The self time is used, so a package importing another one is not charged for it.
+
+    Args:
+        importtime_output (str): stderr of the interpreter. Other lines are ignored.
+
+    Returns:
+        dict[str, float]: Import time in milliseconds, per package, the slowest first.
+    """
+    packages: defaultdict[str, float] = defaultdict(float)
+    for line in importtime_output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        parts = match["module"].split(".")
+        package = ".".join(parts[:2] if parts[0] == "firefighter" else parts[:1])
+        packages[package] += int(match["self_us"]) / 1000
+    return {
+        package: round(ms, 3)
+        for package, ms in sorted(packages.items(), key=lambda item: -item[1])
+    }
+
+
+def main(start: float) -> None:
+    """Print the startup profile as JSON on stdout."""
+    profile: dict[str, Any] = dict(profile_startup(start))
+    print(json.dumps(profile))  # noqa: T201
@@ -13,6 +13,8 @@ from django.contrib.admin.decorators import action
 from django.contrib.admin.utils import model_ngettext
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.messages import constants
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.template.response import TemplateResponse
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
@@ -54,7 +56,9 @@ if TYPE_CHECKING:
         _ActionCallable,
         _FieldsetSpec,
     )
+    from django.db.models import ForeignKey
     from django.db.models.query import QuerySet
+    from django.forms import ModelChoiceField
     from django.http.request import HttpRequest
     from django.utils.datastructures import _ListOrTuple
 
@@ -67,6 +71,12 @@ user_inlines: list[type[InlineModelAdmin[Any, User]]] = []
 incident_category_inlines: list[type[InlineModelAdmin[Any, IncidentCategory]]] = []
 
 
+def _count_subquery(queryset: QuerySet[Any], group_by: str) -> Coalesce:
+    """Counts the rows of a queryset filtered on an `OuterRef`, in a subquery."""
+    counts = queryset.order_by().values(group_by).annotate(count=Count("*"))
+    return Coalesce(Subquery(counts.values("count"), output_field=IntegerField()), 0)
+
+
 class IncidentCostInline(admin.TabularInline[IncidentCost, Incident]):
     model = IncidentCost
     extra = 1
@@ -132,6 +142,19 @@ class IncidentCategoryAdmin(admin.ModelAdmin[IncidentCategory]):
         ),
     )
 
+    def formfield_for_foreignkey(
+        self, db_field: ForeignKey[Any, Any], request: HttpRequest, **kwargs: Any
+    ) -> ModelChoiceField[Any] | None:
+        formfield = super().formfield_for_foreignkey(db_field, request, **kwargs)
+        if formfield is not None and db_field.name == "group":
+            # The group is editable in the list: fetch its choices once, not once per row
+            choices = getattr(request, "_incident_category_group_choices", None)
+            if choices is None:
+                choices = list(formfield.iterator(formfield))
+                request._incident_category_group_choices = choices  # type: ignore[attr-defined]  # noqa: SLF001
+            formfield.choices = choices
+        return formfield
+
 
 class IncidentCategoryInline(admin.StackedInline[IncidentCategory, IncidentCategory]):
     model = IncidentCategory
@@ -260,8 +283,9 @@ class IncidentAdmin(admin.ModelAdmin[Incident]):
     def compute_metrics(
         self, request: HttpRequest, queryset: QuerySet[Incident]
     ) -> None:
-        for incident in queryset:
-            incident.compute_metrics()
+        IncidentMetric.objects.compute_for_incidents(
+            queryset.values_list("id", flat=True)
+        )
         self.message_user(
             request,
             ngettext(
@@ -278,8 +302,9 @@ class IncidentAdmin(admin.ModelAdmin[Incident]):
         self, request: HttpRequest, queryset: QuerySet[Incident]
     ) -> None:
         """Will compute metrics for selected incidents and delete metrics that can no longer be computed."""
-        for incident in queryset:
-            incident.compute_metrics(purge=True)
+        IncidentMetric.objects.compute_for_incidents(
+            queryset.values_list("id", flat=True), purge=True
+        )
         self.message_user(
             request,
             ngettext(
@@ -571,17 +596,35 @@ class UserAdmin(BaseUserAdmin):  # type: ignore[type-arg]
         self.fieldsets[2][1]["fields"] = ("bot", *self.fieldsets[2][1]["fields"])  # type: ignore
         self.fieldsets[1][1]["fields"] = (*self.fieldsets[1][1]["fields"], "avatar")  # type: ignore
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet[User]:
+        roles = IncidentRole.objects.filter(user=OuterRef("pk"))
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                commander_count=_count_subquery(
+                    roles.filter(role_type__slug="commander"), "user"
+                ),
+                communication_lead_count=_count_subquery(
+                    roles.filter(role_type__slug="communication_lead"), "user"
+                ),
+                incidents_opened_count=_count_subquery(
+                    Incident.objects.filter(created_by=OuterRef("pk")), "created_by"
+                ),
+            )
+        )
+
     @staticmethod
     def commander_count(obj: User) -> int:
-        return obj.roles_set.filter(role_type__slug="commander").count()
+        return int(getattr(obj, "commander_count", 0))
 
     @staticmethod
     def communication_lead_count(obj: User) -> int:
-        return obj.roles_set.filter(role_type__slug="communication_lead").count()
+        return int(getattr(obj, "communication_lead_count", 0))
 
     @staticmethod
     def incidents_opened_count(obj: User) -> int:
-        return obj.incidents_created_by.count()
+        return int(getattr(obj, "incidents_opened_count", 0))
 
     def get_fieldsets(
         self,
@@ -9,5 +9,11 @@ class IncidentsConfig(AppConfig):
     label = "incidents"
 
     def ready(self) -> None:
-        from firefighter.incidents import observability, tasks
+        from firefighter.incidents import (
+            change_feed,
+            fragment_cache,
+            observability,
+            tasks,
+            user_stats,
+        )
         from firefighter.incidents.models.incident_update import set_event_ts
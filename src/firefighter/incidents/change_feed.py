@@ -0,0 +1,140 @@
+"""Change feed of the incidents: an [IncidentEvent][firefighter.incidents.models.incident_event.IncidentEvent] is recorded for each incident lifecycle signal,
+so consumers (dashboards, bots) can follow the incidents without polling the incident list.
+
+- Events are written after the transaction of the change is committed, with a snapshot of the incident at the time of the signal.
+  They are inserted one at a time (Postgres advisory lock), so they are committed in the order of their ID:
+  a consumer reading the events after the last ID it got never misses one.
+- Each event is then published to the [CHANGE_FEED_CHANNEL][firefighter.incidents.change_feed.CHANGE_FEED_CHANNEL] Redis channel,
+  fanned out to the clients of the Server-Sent Events stream of the API.
+- Events older than `FF_INCIDENT_EVENTS_RETENTION_DAYS` are purged daily (Celery beat).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from firefighter.incidents.models.incident_event import (
+    IncidentEvent,
+    IncidentEventType,
+)
+from firefighter.incidents.signal_bus import lifecycle_receiver
+from firefighter.incidents.signals import (
+    incident_closed,
+    incident_created,
+    incident_updated,
+)
+
+if TYPE_CHECKING:
+    from firefighter.incidents.models.incident import Incident
+
+logger = logging.getLogger(__name__)
+
+CHANGE_FEED_CHANNEL = "firefighter:incident_events"
+_CHANGE_FEED_LOCK_ID = int.from_bytes(b"ffevents")
+"""Key of the Postgres advisory lock serializing the inserts of events."""
+
+
+def incident_snapshot(incident: Incident) -> dict[str, Any]:
+    return {
+        "status": incident.status.label,
+        "priority": incident.priority.value,
+        "environment": incident.environment.value,
+        "incident_category": incident.incident_category.name,
+        "title": incident.title,
+    }
+
+
+def record_incident_event(
+    event_type: IncidentEventType, incident: Incident, data: dict[str, Any]
+) -> None:
+    """Records an event of an incident once the current transaction is committed (or now, outside of a transaction).
+
+    The change is already committed: errors are logged, and never raised to the caller.
+    """
+    transaction.on_commit(
+        partial(_create_incident_event, event_type, incident.id, data)
+    )
+
+
+def _create_incident_event(
+    event_type: IncidentEventType, incident_id: int, data: dict[str, Any]
+) -> None:
+    try:
+        with transaction.atomic():
+            # The ID is taken while holding the lock, which is released at commit
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(%s)", [_CHANGE_FEED_LOCK_ID]
+                )
+            event = IncidentEvent.objects.create(
+                incident_id=incident_id, event_type=event_type, data=data
+            )
+    except DatabaseError:
+        logger.exception(
+            "Could not record %s event of incident #%s.", event_type, incident_id
+        )
+        return
+    publish_incident_event(event)
+
+
+def publish_incident_event(event: IncidentEvent) -> None:
+    """Publishes an event to the clients of the stream. Errors are logged: they can catch up from the database."""
+    try:
+        get_redis_connection("default").publish(
+            CHANGE_FEED_CHANNEL, json.dumps(event.to_payload(), cls=DjangoJSONEncoder)
+        )
+    except RedisError:
+        logger.warning("Could not publish incident event %s.", event.id, exc_info=True)
+
+
+def purge_incident_events() -> int:
+    """Deletes the events older than `FF_INCIDENT_EVENTS_RETENTION_DAYS`.
+
+    Returns:
+        int: Number of events deleted.
+    """
+    deleted, _ = IncidentEvent.objects.filter(
+        created_at__lt=timezone.now()
+        - timedelta(days=settings.FF_INCIDENT_EVENTS_RETENTION_DAYS)
+    ).delete()
+    logger.info("Purged %s incident events.", deleted)
+    return deleted
+
+
+@lifecycle_receiver(incident_created)
+def incident_created_event(sender: Any, incident: Incident, **kwargs: Any) -> None:
+    record_incident_event(
+        IncidentEventType.CREATED, incident, incident_snapshot(incident)
+    )
+
+
+@lifecycle_receiver(incident_updated)
+def incident_updated_event(sender: Any, incident: Incident, **kwargs: Any) -> None:
+    incident_update = kwargs.get("incident_update")
+    record_incident_event(
+        IncidentEventType.UPDATED,
+        incident,
+        {
+            **incident_snapshot(incident),
+            "updated_fields": kwargs.get("updated_fields", []),
+            "incident_update_id": str(incident_update.id) if incident_update else None,
+        },
+    )
+
+
+@lifecycle_receiver(incident_closed)
+def incident_closed_event(sender: Any, incident: Incident, **kwargs: Any) -> None:
+    record_incident_event(
+        IncidentEventType.CLOSED, incident, incident_snapshot(incident)
+    )
@@ -102,12 +102,11 @@ class IncidentUpdateKeyEventsForm(forms.Form):
         self,
         milestones_definitions: Iterable[MilestoneType],
     ) -> list[MilestoneTypeData]:
-        """Get each [firefighter.incidents.models.milestone_type.MilestoneType][] with its `event_ts` from the IncidentUpdate."""
-        milestones_objects = self.incident.latest_updates_by_type
+        """Get each [firefighter.incidents.models.milestone_type.MilestoneType][] with its latest `event_ts`, from the timeline of the incident."""
+        latest_milestones = self.incident.latest_milestones
         ass = []
         for milestone_def in milestones_definitions:
-            event = milestones_objects.get(milestone_def.event_type)
-            event_ts = event.event_ts if event and event.event_ts else None
+            event_ts = latest_milestones.get(milestone_def.event_type)
             association = MilestoneTypeData(
                 milestone_type=milestone_def, data=MilestoneData(event_ts)
             )
@@ -0,0 +1,117 @@
+"""Cache of the rendered HTML fragments of incidents: rows of the incident list, and timeline, metrics and impacts of the incident page.
+
+Fragments are cached with Django's `{% cache %}` template tag, keyed on the incident ID and `updated_at`.
+The fragment name carries the template version (e.g. `incident_row_v1`): bump it when the cached markup changes.
+
+The incident page sections also depend on objects that don't update the incident (incident updates, metrics, impacts),
+so they are also keyed on a per-incident version token ([get_fragment_version][firefighter.incidents.fragment_cache.get_fragment_version]),
+renewed by the incident lifecycle signals and when these objects are saved or deleted.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from functools import partial
+from typing import Any
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch.dispatcher import receiver
+
+from firefighter.incidents.models.impact import Impact, IncidentImpact
+from firefighter.incidents.models.incident_update import IncidentUpdate
+from firefighter.incidents.models.metric_type import IncidentMetric
+from firefighter.incidents.signal_bus import lifecycle_receiver
+from firefighter.incidents.signals import (
+    incident_closed,
+    incident_created,
+    incident_updated,
+)
+
+logger = logging.getLogger(__name__)
+
+FRAGMENT_VERSION_CACHE_KEY = "incidents:fragments:{incident_id}"
+FRAGMENT_MAX_AGE = timedelta(days=1)
+"""Also the timeout of the `{% cache %}` tags. Bounds the staleness of related objects without signals (e.g. a renamed priority or user)."""
+
+
+def _version_key(incident_id: int) -> str:
+    return FRAGMENT_VERSION_CACHE_KEY.format(incident_id=incident_id)
+
+
+def get_fragment_version(incident_id: int) -> str:
+    """Returns the version token of the cached fragments of an incident, creating it if needed."""
+    key = _version_key(incident_id)
+    version: str | None = cache.get(key)
+    if version is None:
+        version = uuid4().hex
+        # Another request may have created it in the meantime
+        if not cache.add(key, version, timeout=int(FRAGMENT_MAX_AGE.total_seconds())):
+            version = cache.get(key, version)
+    return version
+
+
+def invalidate_incident_fragments(*incident_ids: int | None) -> None:
+    """Invalidates the cached fragments of some incidents, now and after the current transaction is committed. `None` values are ignored.
+
+    The second invalidation prevents a concurrent request from caching fragments of before the commit.
+    """
+    keys = [
+        _version_key(incident_id)
+        for incident_id in incident_ids
+        if incident_id is not None
+    ]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(partial(cache.delete_many, keys))
+
+
+@lifecycle_receiver(incident_created)
+@lifecycle_receiver(incident_updated)
+@lifecycle_receiver(incident_closed)
+def incident_lifecycle_changed(sender: Any, incident: Any, **kwargs: Any) -> None:
+    invalidate_incident_fragments(incident.id)
+
+
+@receiver(post_save, sender=IncidentUpdate)
+@receiver(post_delete, sender=IncidentUpdate)
+@receiver(post_save, sender=IncidentMetric)
+@receiver(post_delete, sender=IncidentMetric)
+@receiver(post_save, sender=IncidentImpact)
+@receiver(post_delete, sender=IncidentImpact)
+def incident_section_changed(
+    sender: Any,
+    instance: IncidentUpdate | IncidentMetric | IncidentImpact,
+    **kwargs: Any,
+) -> None:
+    invalidate_incident_fragments(instance.incident_id)
+
+
+@receiver(m2m_changed, sender=IncidentImpact)
+def incident_impacts_changed(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_incident_fragments(instance.id)
+    elif pk_set:
+        invalidate_incident_fragments(*pk_set)
+
+
+@receiver(post_save, sender=Impact)
+def impact_changed(sender: Any, instance: Impact, **kwargs: Any) -> None:
+    invalidate_incident_fragments(
+        *IncidentImpact.objects.filter(impact=instance).values_list(
+            "incident_id", flat=True
+        )
+    )
@@ -0,0 +1,71 @@
+"""Django management command to recompute the metrics of many incidents at once."""
+
+from __future__ import annotations
+
+import time
+from datetime import date
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from firefighter.incidents.models.incident import Incident
+from firefighter.incidents.models.metric_type import IncidentMetric
+
+
+class Command(BaseCommand):
+    """Recompute incident metrics (time to fix, ...) from milestones, in bulk."""
+
+    help = "Recompute the metrics of incidents created in a date range, in chunks"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--since",
+            type=date.fromisoformat,
+            help="Only incidents created on or after this date (YYYY-MM-DD)",
+        )
+        parser.add_argument(
+            "--until",
+            type=date.fromisoformat,
+            help="Only incidents created before this date (YYYY-MM-DD)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of incidents computed per chunk (default: 2000)",
+        )
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help="Delete the metrics that can no longer be computed",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        chunk_size: int = options["chunk_size"]
+        queryset = Incident.objects.all()
+        if options["since"]:
+            queryset = queryset.filter(created_at__date__gte=options["since"])
+        if options["until"]:
+            queryset = queryset.filter(created_at__date__lt=options["until"])
+        incident_ids = list(queryset.order_by("id").values_list("id", flat=True))
+
+        start = time.perf_counter()
+        computed = deleted = 0
+        for i in range(0, len(incident_ids), chunk_size):
+            chunk = incident_ids[i : i + chunk_size]
+            chunk_computed, chunk_deleted = (
+                IncidentMetric.objects.compute_for_incidents(
+                    chunk, purge=options["purge"]
+                )
+            )
+            computed += chunk_computed
+            deleted += chunk_deleted
+            self.stdout.write(
+                f"Incidents #{chunk[0]} to #{chunk[-1]}: {chunk_computed} metrics computed, {chunk_deleted} deleted"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Computed {computed} metrics and deleted {deleted} for {len(incident_ids)} incidents in {time.perf_counter() - start:.2f}s"
+            )
+        )
@@ -0,0 +1,61 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0034_add_incident_dedup_key"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="incident",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text search vector of the title and description. Maintained by a database trigger.",
+                null=True,
+            ),
+        ),
+        # Django 4.2 has no generated fields, and a Postgres generated column can't be written by the ORM:
+        # the vector is maintained by a trigger instead, so it is also up-to-date after `update()` and `bulk_update()`.
+        migrations.RunSQL(
+            sql="""
+            CREATE FUNCTION incidents_incident_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('english'::regconfig, COALESCE(NEW.title, '')), 'A')
+                    || setweight(to_tsvector('english'::regconfig, COALESCE(NEW.description, '')), 'B');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER incidents_incident_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF title, description, search_vector ON incidents_incident
+            FOR EACH ROW EXECUTE FUNCTION incidents_incident_search_vector_update();
+
+            UPDATE incidents_incident SET search_vector = NULL;
+            """,
+            reverse_sql="""
+            DROP TRIGGER incidents_incident_search_vector_trigger ON incidents_incident;
+            DROP FUNCTION incidents_incident_search_vector_update();
+            """,
+        ),
+        migrations.AddIndex(
+            model_name="incident",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="incident_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="incident",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["title"],
+                name="incident_title_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
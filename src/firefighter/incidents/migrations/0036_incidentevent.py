@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0035_incident_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IncidentEvent",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "event_type",
+                    models.CharField(
+                        choices=[
+                            ("incident_created", "Incident created"),
+                            ("incident_updated", "Incident updated"),
+                            ("incident_closed", "Incident closed"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "data",
+                    models.JSONField(
+                        default=dict,
+                        help_text="State of the incident after the event, and the updated fields",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                (
+                    "incident",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="events",
+                        to="incidents.incident",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Incident event",
+                "verbose_name_plural": "Incident events",
+                "ordering": ["id"],
+            },
+        ),
+    ]
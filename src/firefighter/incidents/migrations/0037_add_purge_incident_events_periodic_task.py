@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+def create_purge_incident_events_task(apps, schema_editor):
+    """Create the periodic task deleting the incident events older than the retention of the change feed, every day."""
+    IntervalSchedule = apps.get_model("django_celery_beat", "IntervalSchedule")
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    schedule, _ = IntervalSchedule.objects.get_or_create(every=1, period="days")
+
+    PeriodicTask.objects.get_or_create(
+        name="Purge incident events",
+        defaults={
+            "task": "incidents.purge_incident_events",
+            "interval": schedule,
+            "enabled": True,
+            "description": "Delete the incident events of the API change feed older than FF_INCIDENT_EVENTS_RETENTION_DAYS",
+        },
+    )
+
+
+def remove_purge_incident_events_task(apps, schema_editor):
+    """Remove the periodic task on migration rollback."""
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+
+    PeriodicTask.objects.filter(task="incidents.purge_incident_events").delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0036_incidentevent"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_purge_incident_events_task,
+            reverse_code=remove_purge_incident_events_task,
+        ),
+    ]
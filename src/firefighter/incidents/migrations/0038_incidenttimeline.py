@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0037_add_purge_incident_events_periodic_task"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IncidentTimeline",
+            fields=[
+                (
+                    "incident",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="timeline",
+                        serialize=False,
+                        to="incidents.incident",
+                    ),
+                ),
+                (
+                    "data",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Latest milestones, role holders, status history and time spent in each status",
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Incident timeline",
+                "verbose_name_plural": "Incident timelines",
+            },
+        ),
+    ]
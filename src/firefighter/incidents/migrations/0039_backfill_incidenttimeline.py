@@ -0,0 +1,63 @@
+from django.db import migrations, models
+
+from firefighter.incidents.models.incident_timeline import build_timeline_data
+
+BATCH_SIZE = 500
+
+
+def backfill_incident_timelines(apps, schema_editor):
+    """Build the timeline snapshot of the incidents created before the snapshots, from their updates and roles."""
+    Incident = apps.get_model("incidents", "Incident")
+    IncidentRole = apps.get_model("incidents", "IncidentRole")
+    IncidentTimeline = apps.get_model("incidents", "IncidentTimeline")
+    IncidentUpdate = apps.get_model("incidents", "IncidentUpdate")
+
+    incident_ids = list(
+        Incident.objects.filter(timeline__isnull=True)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+    for start in range(0, len(incident_ids), BATCH_SIZE):
+        batch = incident_ids[start : start + BATCH_SIZE]
+        updates = {incident_id: [] for incident_id in batch}
+        for incident_id, update_id, status, event_type, event_ts in (
+            IncidentUpdate.objects.filter(incident_id__in=batch)
+            .filter(
+                models.Q(_status__isnull=False) | models.Q(event_type__isnull=False)
+            )
+            .order_by("event_ts", "created_at")
+            .values_list("incident_id", "id", "_status", "event_type", "event_ts")
+        ):
+            updates[incident_id].append((update_id, status, event_type, event_ts))
+        roles = {}
+        for incident_id, role_slug, user_id in (
+            IncidentRole.objects.filter(incident_id__in=batch)
+            .order_by("role_type__order", "created_at")
+            .values_list("incident_id", "role_type__slug", "user_id")
+        ):
+            roles.setdefault(incident_id, []).append((role_slug, user_id))
+        IncidentTimeline.objects.bulk_create(
+            [
+                IncidentTimeline(
+                    incident_id=incident_id,
+                    data=build_timeline_data(
+                        incident_updates, roles.get(incident_id, [])
+                    ),
+                )
+                for incident_id, incident_updates in updates.items()
+            ],
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0038_incidenttimeline"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_incident_timelines,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -7,7 +7,9 @@ from firefighter.incidents.models.incident import Incident
 from firefighter.incidents.models.incident_category import IncidentCategory
 from firefighter.incidents.models.incident_cost import IncidentCost
 from firefighter.incidents.models.incident_cost_type import IncidentCostType
+from firefighter.incidents.models.incident_event import IncidentEvent
 from firefighter.incidents.models.incident_role_type import IncidentRoleType
+from firefighter.incidents.models.incident_timeline import IncidentTimeline
 from firefighter.incidents.models.incident_update import IncidentUpdate
 from firefighter.incidents.models.milestone_type import MilestoneType
 from firefighter.incidents.models.priority import Priority
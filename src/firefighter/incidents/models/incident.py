@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import logging
 import re
-from copy import deepcopy
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 import django_filters
 from django.apps import apps
 from django.conf import settings
-from django.contrib.postgres.aggregates import ArrayAgg
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVectorField,
+    TrigramWordSimilarity,
+)
 from django.db import models, transaction
 from django.urls import reverse
 from django.utils.text import Truncator
@@ -38,6 +41,7 @@ from firefighter.incidents.models.incident_membership import (
     IncidentRole,
 )
 from firefighter.incidents.models.incident_role_type import IncidentRoleType
+from firefighter.incidents.models.incident_timeline import IncidentTimeline
 from firefighter.incidents.models.incident_update import IncidentUpdate
 from firefighter.incidents.models.metric_type import IncidentMetric, MetricType
 from firefighter.incidents.models.milestone_type import MilestoneType
@@ -54,6 +58,7 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence  # noqa: F401
+    from datetime import datetime
     from decimal import Decimal
     from uuid import UUID
 
@@ -75,8 +80,6 @@ if TYPE_CHECKING:
 
 NON_ALPHANUMERIC_CHARACTERS = re.compile(r"[^\da-zA-Z]+")
 
-TD0 = timedelta(0)
-
 
 class IncidentManager(models.Manager["Incident"]):
     def get_or_none(self, **kwargs: Any) -> Incident | None:
@@ -154,33 +157,31 @@ class IncidentManager(models.Manager["Incident"]):
         if search_term is None or search_term.strip() == "":
             return queryset, False
 
-        queryset_search_id = None
-
-        # If the search is just an int, search for this ID + regular search
-        try:
-            search_term_as_int = int(search_term)
-        except ValueError:
-            pass
-        else:
-            queryset_search_id = deepcopy(queryset)
-            queryset_search_id = queryset_search_id.filter(id=search_term_as_int)
-
-        # Postgres search on title + description
-        # XXX Improve search performance and relevance
-        vector = SearchVector("title", config="english", weight="A") + SearchVector(
-            "description", config="english", weight="B"
-        )
+        search_term = search_term.strip()
         query = SearchQuery(search_term, config="english", search_type="websearch")
-        queryset = (
-            queryset.annotate(rank=SearchRank(vector, query))
-            .filter(rank__gte=0.1)
-            .order_by("-rank")
+        # Full-text search on the stored vector (title + description), with a trigram fallback on the title for partial words and typos.
+        # Both conditions can use an index.
+        condition = models.Q(search_vector=query) | models.Q(
+            title__trigram_word_similar=search_term
+        )
+        rank = SearchRank(models.F("search_vector"), query) + TrigramWordSimilarity(
+            search_term, "title"
         )
 
-        # Add the search by id to the search by text if needed
-        if queryset_search_id:
-            queryset |= queryset_search_id  # type: ignore[operator]
+        ordering: list[Any] = ["-rank"]
+
+        # If the search is just an int, also search for this ID, and show it first
+        # (ASCII only: `isdecimal` alone accepts other scripts' digits, which `int` would convert)
+        if search_term.isascii() and search_term.isdecimal():
+            condition |= models.Q(id=int(search_term))
+            ordering.insert(
+                0,
+                models.ExpressionWrapper(
+                    models.Q(id=int(search_term)), output_field=models.BooleanField()
+                ).desc(),
+            )
 
+        queryset = queryset.filter(condition).annotate(rank=rank).order_by(*ordering)
         return queryset, False
 
 
@@ -266,6 +267,11 @@ class Incident(models.Model):
         help_text="A private incident is not communicated in #tech-incidents, and its created conversation is private. In the future, we may restrict the visibility to incident members only.",
     )
     tags = TaggableManager(blank=True)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text search vector of the title and description. Maintained by a database trigger.",
+    )
 
     members = models.ManyToManyField["User", "IncidentMembership"](
         User,
@@ -288,6 +294,14 @@ class Incident(models.Model):
         roles_set: RelatedManager[IncidentRole]
 
     class Meta(TypedModelMeta):
+        indexes = [
+            GinIndex(fields=["search_vector"], name="incident_search_idx"),
+            GinIndex(
+                fields=["title"],
+                name="incident_title_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
         constraints = [
             models.CheckConstraint(
                 name="%(app_label)s_%(class)s__status_valid",
@@ -489,34 +503,35 @@ class Incident(models.Model):
         if self.ignore:
             return []
 
-        # We get a list of all event_type of IncidentUpdates...
-        milestones_list = (
-            IncidentUpdate.objects.filter(
-                incident_id=self.id,
-                event_ts__isnull=False,
-                event_type__isnull=False,
-            )
-            .aggregate(milestone_list=ArrayAgg("event_type", distinct=True, default=[]))
-            .get("milestone_list", [])
-        )
-
-        incident_milestones: set[str] = set(cast('list["str"]', milestones_list))
+        incident_milestones = IncidentTimeline.objects.get_for_incident(
+            self.id
+        ).latest_milestones.keys()
         required_milestone_types = set(
             MilestoneType.objects.filter(required=True).values_list(
                 "event_type", flat=True
             )
         )
-        # And we make the differences of the sets
         return list(required_milestone_types - incident_milestones)
 
+    @property
+    def latest_milestones(self) -> dict[str, datetime]:
+        """`event_ts` of the latest update of each event type, from the [IncidentTimeline][firefighter.incidents.models.incident_timeline.IncidentTimeline] snapshot."""
+        return IncidentTimeline.objects.get_for_incident(self.id).latest_milestones
+
     @property
     def latest_updates_by_type(self) -> dict[str, IncidentUpdate]:
-        qs = (
-            self.incidentupdate_set.order_by("event_type", "-event_ts")
-            .distinct("event_type")
-            .filter(event_type__isnull=False)
-        )
-        return {iu.event_type: iu for iu in qs}  # type: ignore
+        milestone_ids = IncidentTimeline.objects.get_for_incident(
+            self.id
+        ).latest_milestone_ids
+        updates = {
+            str(update.id): update
+            for update in IncidentUpdate.objects.filter(id__in=milestone_ids.values())
+        }
+        return {
+            event_type: updates[update_id]
+            for event_type, update_id in milestone_ids.items()
+            if update_id in updates
+        }
 
     @property
     def total_cost(self) -> int | float | Decimal:
@@ -524,49 +539,11 @@ class Incident(models.Model):
         return sum(iu.amount for iu in qs if iu.amount is not None)
 
     def compute_metrics(self, *, purge: bool = False) -> None:
-        """Compute all metrics (time to fix, ...) from events."""
-        latest_updates_by_type = self.latest_updates_by_type
-
-        for metric_type in MetricType.objects.all():
-            lhs_type = metric_type.milestone_lhs.event_type
-            rhs_type = metric_type.milestone_rhs.event_type
+        """Compute all metrics (time to fix, ...) from events.
 
-            lhs = latest_updates_by_type.get(lhs_type, None)
-            rhs = latest_updates_by_type.get(rhs_type, None)
-
-            if not lhs or not lhs.event_ts:
-                logger.info(
-                    f"Missing operand '{lhs_type}' on metric {metric_type.type} for #{self.id}"
-                )
-                if purge:
-                    IncidentMetric.objects.filter(
-                        incident=self, metric_type=metric_type
-                    ).delete()
-                continue
-            if not rhs or not rhs.event_ts:
-                logger.info(
-                    f"Missing operand '{rhs_type}' on metric {metric_type.type} for #{self.id}"
-                )
-                if purge:
-                    IncidentMetric.objects.filter(
-                        incident=self, metric_type=metric_type
-                    ).delete()
-                continue
-            duration = lhs.event_ts - rhs.event_ts
-            if duration < TD0:
-                logger.warning(
-                    f"Tried to compute a negative metric! Metric {metric_type.type} for #{self.id} has a duration of {duration} ({lhs.event_type}:{lhs.event_ts} - {rhs.event_type}:{rhs.event_ts})"
-                )
-                if purge:
-                    IncidentMetric.objects.filter(
-                        incident=self, metric_type=metric_type
-                    ).delete()
-                continue
-            IncidentMetric.objects.update_or_create(
-                incident=self,
-                metric_type=metric_type,
-                defaults={"duration": duration},
-            )
+        To compute the metrics of many incidents, use [IncidentMetricManager.compute_for_incidents][firefighter.incidents.models.metric_type.IncidentMetricManager.compute_for_incidents].
+        """
+        IncidentMetric.objects.compute_for_incidents([self.id], purge=purge)
         self.save()
 
     def build_invite_list(self) -> list[User]:
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.db import models
+from django.utils import timezone
+from django_stubs_ext.db.models import TypedModelMeta
+
+if TYPE_CHECKING:
+    from firefighter.incidents.models.incident import Incident  # noqa: F401
+
+
+class IncidentEventType(models.TextChoices):
+    CREATED = "incident_created", "Incident created"
+    UPDATED = "incident_updated", "Incident updated"
+    CLOSED = "incident_closed", "Incident closed"
+
+
+class IncidentEvent(models.Model):
+    """Append-only log of the incident lifecycle signals, read by the change feed of the API.
+
+    The ID is the position in the feed: events are committed in the order of their ID (see [firefighter.incidents.change_feed][]).
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    incident = models.ForeignKey(
+        "Incident", on_delete=models.CASCADE, related_name="events"
+    )
+    event_type = models.CharField(max_length=32, choices=IncidentEventType.choices)
+    data = models.JSONField(
+        default=dict,
+        help_text="State of the incident after the event, and the updated fields",
+    )
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta(TypedModelMeta):
+        verbose_name = "Incident event"
+        verbose_name_plural = "Incident events"
+        ordering = ["id"]
+
+    def __str__(self) -> str:
+        return f"#{self.id} {self.event_type} of incident {self.incident_id}"
+
+    def to_payload(self) -> dict[str, Any]:
+        """Representation of the event in the API and the Server-Sent Events stream."""
+        return {
+            "id": self.id,
+            "type": self.event_type,
+            "incident_id": self.incident_id,
+            "created_at": timezone.localtime(self.created_at).isoformat(),
+            "data": self.data,
+        }
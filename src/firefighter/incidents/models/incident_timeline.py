@@ -0,0 +1,348 @@
+"""Compact projection of the [IncidentUpdate][firefighter.incidents.models.incident_update.IncidentUpdate] log of each incident.
+
+The state of an incident (latest milestones, role holders, status history and time spent in each status) is reconstructed from its updates.
+Instead of scanning the updates on every read, it is kept in an [IncidentTimeline][firefighter.incidents.models.incident_timeline.IncidentTimeline] snapshot, read by primary key:
+
+- Each saved or deleted update updates the snapshot in the same transaction, with its row locked.
+  A new update that comes after the last status change is applied to the snapshot; otherwise (edited, deleted or backdated update), the snapshot is rebuilt from the log.
+- The role holders are refreshed when an [IncidentRole][firefighter.incidents.models.incident_membership.IncidentRole] is saved or deleted.
+- Updates inserted or changed in bulk (`bulk_create`, `bulk_update`, `QuerySet.update`) rebuild the snapshots of their incidents.
+- The snapshots of the incidents created before them are backfilled by a data migration.
+  A missing snapshot (incident without updates or not saved) or one of a previous [TIMELINE_VERSION][firefighter.incidents.models.incident_timeline.TIMELINE_VERSION] is built in memory on read, and never saved by a read.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django_stubs_ext.db.models import TypedModelMeta
+
+from firefighter.incidents.enums import IncidentStatus
+from firefighter.incidents.models.incident_membership import IncidentRole
+from firefighter.incidents.models.incident_update import IncidentUpdate
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from firefighter.incidents.models.incident import Incident  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_VERSION = 1
+"""Version of the format of the snapshots. Snapshots of another version are built in memory on read, until they are rebuilt: bump it with a data migration rebuilding them."""
+
+
+def build_timeline_data(
+    updates: Iterable[tuple[Any, int | None, str | None, datetime]],
+    roles: Iterable[tuple[str, Any]],
+) -> dict[str, Any]:
+    """Builds the data of a snapshot from the log of an incident.
+
+    Args:
+        updates (Iterable[tuple[Any, int | None, str | None, datetime]]): `(id, status, event_type, event_ts)` of the updates, ordered by `event_ts`.
+        roles (Iterable[tuple[str, Any]]): `(role type slug, user ID)` of the roles.
+
+    Returns:
+        dict[str, Any]: The data of the snapshot.
+    """
+    data: dict[str, Any] = {
+        "version": TIMELINE_VERSION,
+        "milestones": {},
+        "status_history": [],
+        "durations": {},
+        "roles": {},
+    }
+    for update_id, status, event_type, event_ts in updates:
+        _apply(data, update_id, status, event_type, event_ts)
+    for role_slug, user_id in roles:
+        data["roles"].setdefault(role_slug, []).append(str(user_id))
+    return data
+
+
+def _apply(
+    data: dict[str, Any],
+    update_id: Any,
+    status: int | None,
+    event_type: str | None,
+    event_ts: datetime,
+) -> None:
+    if event_type:
+        milestone = data["milestones"].get(event_type)
+        if (
+            milestone is None
+            or datetime.fromisoformat(milestone["event_ts"]) <= event_ts
+        ):
+            data["milestones"][event_type] = {
+                "id": str(update_id),
+                "event_ts": event_ts.isoformat(),
+            }
+    if status:
+        history: list[dict[str, Any]] = data["status_history"]
+        if history:
+            # Time spent in the previous status, until this change
+            previous = history[-1]
+            spent = event_ts - datetime.fromisoformat(previous["event_ts"])
+            durations = data["durations"]
+            key = str(previous["status"])
+            durations[key] = durations.get(key, 0) + spent.total_seconds()
+        history.append({"status": status, "event_ts": event_ts.isoformat()})
+
+
+class IncidentTimelineManager(models.Manager["IncidentTimeline"]):
+    def get_for_incident(self, incident_id: int | None) -> IncidentTimeline:
+        """Returns the snapshot of an incident. A missing or outdated one is built in memory, without being saved."""
+        if incident_id is None:
+            # The incident is not saved: it has no updates
+            return IncidentTimeline(data=build_timeline_data([], []))
+        return self.get_for_incidents([incident_id])[incident_id]
+
+    def get_for_incidents(
+        self, incident_ids: Iterable[int]
+    ) -> dict[int, IncidentTimeline]:
+        """Returns the snapshots of many incidents, per incident ID. The missing or outdated ones are built in bulk, in memory, without being saved."""
+        incident_ids = list(incident_ids)
+        timelines = {
+            incident_id: timeline
+            for incident_id, timeline in self.in_bulk(incident_ids).items()
+            if timeline.data.get("version") == TIMELINE_VERSION
+        }
+        missing = [
+            incident_id for incident_id in incident_ids if incident_id not in timelines
+        ]
+        if missing:
+            timelines.update(
+                (incident_id, IncidentTimeline(incident_id=incident_id, data=data))
+                for incident_id, data in self._build(missing).items()
+            )
+        return timelines
+
+    def refresh(
+        self, incident_id: int, update: IncidentUpdate | None = None
+    ) -> IncidentTimeline:
+        """Updates the snapshot of an incident with its row locked, until the end of the transaction.
+
+        Args:
+            incident_id (int): ID of the incident.
+            update (IncidentUpdate | None, optional): New update to apply to the snapshot. Defaults to None: the snapshot is rebuilt from the log.
+        """
+        with transaction.atomic():
+            timeline = self._lock(incident_id)
+            if timeline is None:
+                self.bulk_create(
+                    [IncidentTimeline(incident_id=incident_id)], ignore_conflicts=True
+                )
+                timeline = self._lock(incident_id)
+                assert timeline is not None  # noqa: S101
+            if update is None or not timeline.apply(update):
+                timeline.data = self._build([incident_id])[incident_id]
+            timeline.save(update_fields=["data", "updated_at"])
+        return timeline
+
+    def refresh_existing(self, incident_id: int, *, roles_only: bool = False) -> None:
+        """Rebuilds the snapshot of an incident if it has one, e.g. not while the incident is deleted.
+
+        Args:
+            incident_id (int): ID of the incident.
+            roles_only (bool, optional): Only refresh the role holders. Defaults to False.
+        """
+        with transaction.atomic():
+            timeline = self._lock(incident_id)
+            if timeline is None:
+                return
+            if roles_only and timeline.data.get("version") == TIMELINE_VERSION:
+                roles = self._roles([incident_id]).get(incident_id, [])
+                timeline.data["roles"] = build_timeline_data([], roles)["roles"]
+            else:
+                timeline.data = self._build([incident_id])[incident_id]
+            timeline.save(update_fields=["data", "updated_at"])
+
+    def rebuild(self, incident_ids: Iterable[int]) -> None:
+        """Rebuilds the snapshots of many incidents from their logs, with their rows locked, e.g. after their updates are changed in bulk. The missing snapshots are created."""
+        incident_ids = sorted(set(incident_ids))
+        if not incident_ids:
+            return
+        with transaction.atomic():
+            list(
+                self.select_for_update()
+                .filter(pk__in=incident_ids)
+                .values_list("pk", flat=True)
+            )
+            self.bulk_create(
+                [
+                    IncidentTimeline(incident_id=incident_id, data=data)
+                    for incident_id, data in self._build(incident_ids).items()
+                ],
+                update_conflicts=True,
+                unique_fields=["incident"],
+                update_fields=["data", "updated_at"],
+            )
+
+    def _lock(self, incident_id: int) -> IncidentTimeline | None:
+        return self.select_for_update().filter(pk=incident_id).first()
+
+    def _build(self, incident_ids: list[int]) -> dict[int, dict[str, Any]]:
+        updates: dict[int, list[tuple[Any, int | None, str | None, datetime]]] = {
+            incident_id: [] for incident_id in incident_ids
+        }
+        for incident_id, update_id, status, event_type, event_ts in (
+            IncidentUpdate.objects.filter(incident_id__in=incident_ids)
+            .filter(
+                models.Q(_status__isnull=False) | models.Q(event_type__isnull=False)
+            )
+            .order_by("event_ts", "created_at")
+            .values_list("incident_id", "id", "_status", "event_type", "event_ts")
+        ):
+            updates[incident_id].append((update_id, status, event_type, event_ts))
+        roles = self._roles(incident_ids)
+        return {
+            incident_id: build_timeline_data(
+                incident_updates, roles.get(incident_id, [])
+            )
+            for incident_id, incident_updates in updates.items()
+        }
+
+    @staticmethod
+    def _roles(incident_ids: list[int]) -> dict[int, list[tuple[str, Any]]]:
+        roles: dict[int, list[tuple[str, Any]]] = {}
+        for incident_id, role_slug, user_id in (
+            IncidentRole.objects.filter(incident_id__in=incident_ids)
+            .order_by("role_type__order", "created_at")
+            .values_list("incident_id", "role_type__slug", "user_id")
+        ):
+            roles.setdefault(incident_id, []).append((role_slug, user_id))
+        return roles
+
+
+class IncidentTimeline(models.Model):
+    """Snapshot of the state of an incident, projected from its [IncidentUpdate][firefighter.incidents.models.incident_update.IncidentUpdate] log.
+
+    See [firefighter.incidents.models.incident_timeline][].
+    """
+
+    objects: IncidentTimelineManager = IncidentTimelineManager()
+
+    incident = models.OneToOneField(
+        "Incident",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="timeline",
+    )
+    data = models.JSONField(
+        default=dict,
+        help_text="Latest milestones, role holders, status history and time spent in each status",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    if TYPE_CHECKING:
+        incident_id: int
+
+    class Meta(TypedModelMeta):
+        verbose_name = "Incident timeline"
+        verbose_name_plural = "Incident timelines"
+
+    def __str__(self) -> str:
+        return f"Timeline of incident {self.incident_id}"
+
+    def apply(self, update: IncidentUpdate) -> bool:
+        """Applies a new update to the snapshot, if it comes after the last status change.
+
+        Returns:
+            bool: Whether the update was applied. If not, the snapshot must be rebuilt.
+        """
+        if self.data.get("version") != TIMELINE_VERSION or not isinstance(
+            update.event_ts, datetime
+        ):
+            return False
+        history = self.data["status_history"]
+        if (
+            update._status  # noqa: SLF001
+            and history
+            and datetime.fromisoformat(history[-1]["event_ts"]) > update.event_ts
+        ):
+            return False
+        _apply(
+            self.data,
+            update.id,
+            update._status,  # noqa: SLF001
+            update.event_type,
+            update.event_ts,
+        )
+        return True
+
+    @property
+    def latest_milestones(self) -> dict[str, datetime]:
+        """`event_ts` of the latest update of each event type."""
+        return {
+            event_type: datetime.fromisoformat(milestone["event_ts"])
+            for event_type, milestone in self.data["milestones"].items()
+        }
+
+    @property
+    def latest_milestone_ids(self) -> dict[str, str]:
+        """ID of the latest update of each event type."""
+        return {
+            event_type: milestone["id"]
+            for event_type, milestone in self.data["milestones"].items()
+        }
+
+    @property
+    def role_holders(self) -> dict[str, list[str]]:
+        """IDs of the users holding each role, per role type slug."""
+        return self.data["roles"]
+
+    @property
+    def status_history(self) -> list[tuple[IncidentStatus, datetime]]:
+        """Status changes, in chronological order."""
+        return [
+            (
+                IncidentStatus(change["status"]),
+                datetime.fromisoformat(change["event_ts"]),
+            )
+            for change in self.data["status_history"]
+        ]
+
+    @property
+    def status_durations(self) -> dict[IncidentStatus, timedelta]:
+        """Time spent in each status. The current status is counted until now."""
+        durations = {
+            IncidentStatus(int(status)): timedelta(seconds=seconds)
+            for status, seconds in self.data["durations"].items()
+        }
+        if history := self.status_history:
+            status, since = history[-1]
+            durations[status] = durations.get(status, timedelta(0)) + max(
+                timezone.now() - since, timedelta(0)
+            )
+        return durations
+
+
+@receiver(post_save, sender=IncidentUpdate)
+def incident_update_saved(
+    sender: Any, instance: IncidentUpdate, created: bool, **kwargs: Any
+) -> None:
+    if kwargs.get("raw"):
+        return
+    IncidentTimeline.objects.refresh(
+        instance.incident_id, update=instance if created else None
+    )
+
+
+@receiver(post_delete, sender=IncidentUpdate)
+def incident_update_deleted(
+    sender: Any, instance: IncidentUpdate, **kwargs: Any
+) -> None:
+    IncidentTimeline.objects.refresh_existing(instance.incident_id)
+
+
+@receiver(post_delete, sender=IncidentRole)
+@receiver(post_save, sender=IncidentRole)
+def incident_role_changed(sender: Any, instance: IncidentRole, **kwargs: Any) -> None:
+    if kwargs.get("raw"):
+        return
+    IncidentTimeline.objects.refresh_existing(instance.incident_id, roles_only=True)
@@ -19,13 +19,70 @@ from firefighter.incidents.models.user import User
 
 if TYPE_CHECKING:
     import datetime
+    from collections.abc import Collection, Iterable
 
     from firefighter.incidents.models.incident import Incident  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
 
+class IncidentUpdateQuerySet(models.QuerySet["IncidentUpdate"]):
+    """The updates changed in bulk send no signal: the [IncidentTimeline][firefighter.incidents.models.incident_timeline.IncidentTimeline] snapshots of their incidents are rebuilt."""
+
+    def bulk_create(
+        self,
+        objs: Iterable[IncidentUpdate],
+        batch_size: int | None = None,
+        ignore_conflicts: bool = False,  # noqa: FBT002
+        update_conflicts: bool = False,  # noqa: FBT002
+        update_fields: Collection[str] | None = None,
+        unique_fields: Collection[str] | None = None,
+    ) -> list[IncidentUpdate]:
+        created = super().bulk_create(
+            objs,
+            batch_size=batch_size,
+            ignore_conflicts=ignore_conflicts,
+            update_conflicts=update_conflicts,
+            update_fields=update_fields,
+            unique_fields=unique_fields,
+        )
+        _rebuild_timelines(update.incident_id for update in created)
+        return created
+
+    def bulk_update(
+        self,
+        objs: Iterable[IncidentUpdate],
+        fields: Iterable[str],
+        batch_size: int | None = None,
+    ) -> int:
+        objs = list(objs)
+        updated = super().bulk_update(objs, fields, batch_size=batch_size)
+        _rebuild_timelines(update.incident_id for update in objs)
+        return updated
+
+    def update(self, **kwargs: Any) -> int:
+        # The incidents of the updates before and after the change
+        incident_ids = set(self.values_list("incident_id", flat=True))
+        updated = super().update(**kwargs)
+        incident = kwargs.get("incident_id", kwargs.get("incident"))
+        if incident is not None:
+            incident_ids.add(getattr(incident, "pk", incident))
+        _rebuild_timelines(incident_ids)
+        return updated
+
+
+def _rebuild_timelines(incident_ids: Iterable[int]) -> None:
+    from firefighter.incidents.models.incident_timeline import (
+        IncidentTimeline,
+    )
+
+    IncidentTimeline.objects.rebuild(incident_ids)
+
+
 class IncidentUpdateManager(models.Manager["IncidentUpdate"]):
+    def get_queryset(self) -> IncidentUpdateQuerySet:
+        return IncidentUpdateQuerySet(self.model, using=self._db)
+
     def get_or_none(self, **kwargs: Any) -> IncidentUpdate | None:
         try:
             return self.get(**kwargs)
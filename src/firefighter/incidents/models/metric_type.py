@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import TYPE_CHECKING
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, ClassVar
 
 from django.core.validators import MinValueValidator
 from django.db import models
@@ -12,6 +13,13 @@ from firefighter.incidents.models.milestone_type import (
     MilestoneType,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+TD0 = timedelta(0)
+
 
 class MetricType(models.Model):
     name = models.CharField(
@@ -56,7 +64,90 @@ class MetricType(models.Model):
         return self.name
 
 
+class IncidentMetricManager(models.Manager["IncidentMetric"]):
+    @staticmethod
+    def compute_for_incidents(
+        incident_ids: Iterable[int], *, purge: bool = False, batch_size: int = 1000
+    ) -> tuple[int, int]:
+        """Compute all metrics (time to fix, ...) of many incidents at once, from their latest milestones.
+
+        The latest milestones of all incidents are read from their [IncidentTimeline][firefighter.incidents.models.incident_timeline.IncidentTimeline] snapshots, and the metrics are upserted in bulk.
+
+        Args:
+            incident_ids (Iterable[int]): IDs of the incidents to compute the metrics of.
+            purge (bool, optional): Delete the metrics that can no longer be computed. Defaults to False.
+            batch_size (int, optional): Number of metrics per upsert query. Defaults to 1000.
+
+        Returns:
+            tuple[int, int]: Number of metrics computed, and number of metrics deleted.
+        """
+        # Circular import
+        from firefighter.incidents.models.incident_timeline import IncidentTimeline
+
+        incident_ids = list(incident_ids)
+        metric_types = list(
+            MetricType.objects.select_related("milestone_lhs", "milestone_rhs")
+        )
+        if not incident_ids or not metric_types:
+            return 0, 0
+
+        # Latest milestone of each type, from the timeline snapshots
+        milestones: dict[int, dict[str, datetime]] = {
+            incident_id: timeline.latest_milestones
+            for incident_id, timeline in IncidentTimeline.objects.get_for_incidents(
+                incident_ids
+            ).items()
+        }
+
+        metrics: list[IncidentMetric] = []
+        to_purge: dict[int, list[int]] = {}
+        for incident_id in incident_ids:
+            incident_milestones = milestones.get(incident_id, {})
+            for metric_type in metric_types:
+                lhs_ts = incident_milestones.get(metric_type.milestone_lhs.event_type)
+                rhs_ts = incident_milestones.get(metric_type.milestone_rhs.event_type)
+                if lhs_ts is None or rhs_ts is None:
+                    logger.debug(
+                        "Missing operand on metric %s for #%s",
+                        metric_type.type,
+                        incident_id,
+                    )
+                    to_purge.setdefault(metric_type.id, []).append(incident_id)
+                    continue
+                duration = lhs_ts - rhs_ts
+                if duration < TD0:
+                    logger.warning(
+                        f"Tried to compute a negative metric! Metric {metric_type.type} for #{incident_id} has a duration of {duration}"
+                    )
+                    to_purge.setdefault(metric_type.id, []).append(incident_id)
+                    continue
+                metrics.append(
+                    IncidentMetric(
+                        incident_id=incident_id,
+                        metric_type=metric_type,
+                        duration=duration,
+                    )
+                )
+
+        IncidentMetric.objects.bulk_create(
+            metrics,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["incident", "metric_type"],
+            update_fields=["duration"],
+        )
+        deleted = 0
+        if purge:
+            for metric_type_id, purge_incident_ids in to_purge.items():
+                deleted += IncidentMetric.objects.filter(
+                    metric_type_id=metric_type_id, incident_id__in=purge_incident_ids
+                ).delete()[0]
+        return len(metrics), deleted
+
+
 class IncidentMetric(models.Model):
+    objects: ClassVar[IncidentMetricManager] = IncidentMetricManager()
+
     incident = models.ForeignKey(
         "incidents.Incident",
         on_delete=models.CASCADE,
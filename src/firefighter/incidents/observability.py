@@ -16,8 +16,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from django.dispatch import receiver
-
+from firefighter.incidents.signal_bus import lifecycle_receiver
 from firefighter.incidents.signals import (
     incident_closed,
     incident_created,
@@ -27,7 +26,7 @@ from firefighter.incidents.signals import (
 logger = logging.getLogger("firefighter.observability")
 
 
-@receiver(signal=incident_created)
+@lifecycle_receiver(incident_created)
 def log_incident_created(sender: Any, incident: Any, **kwargs: Any) -> None:
     logger.info(
         "Incident created: #%s [P%s] %s",
@@ -43,7 +42,7 @@ def log_incident_created(sender: Any, incident: Any, **kwargs: Any) -> None:
     )
 
 
-@receiver(signal=incident_closed)
+@lifecycle_receiver(incident_closed)
 def log_incident_closed(sender: Any, incident: Any, **kwargs: Any) -> None:
     logger.info(
         "Incident closed: #%s [P%s]",
@@ -58,7 +57,7 @@ def log_incident_closed(sender: Any, incident: Any, **kwargs: Any) -> None:
     )
 
 
-@receiver(signal=incident_updated)
+@lifecycle_receiver(incident_updated)
 def log_incident_updated(sender: Any, incident: Any, **kwargs: Any) -> None:
     updated_fields: list[str] = kwargs.get("updated_fields", [])
     old_priority = kwargs.get("old_priority")
@@ -0,0 +1,247 @@
+"""Dispatch of the incident lifecycle signals ([incident_created][firefighter.incidents.signals.incident_created],
+[incident_updated][firefighter.incidents.signals.incident_updated] and [incident_closed][firefighter.incidents.signals.incident_closed])
+to their receivers, synchronously or in Celery.
+
+Receivers are connected with [lifecycle_receiver][firefighter.incidents.signal_bus.lifecycle_receiver] instead of Django's `receiver`, and declare a mode:
+
+- `sync` receivers run when the signal is sent, in the caller's transaction. Use it for cheap receivers, or those that must see the in-memory objects.
+- `async` receivers run in a Celery task, after the transaction is committed. The task gets the IDs of the objects sent with the signal and reloads them,
+  so the caller (Slack modal, API) does not wait for the integrations (Slack, Jira, Confluence...).
+
+Set `FF_SIGNALS_ASYNC` to `False` to run the `async` receivers inline, e.g. without a Celery worker or in tests.
+
+Each receiver run is logged to the `firefighter.observability` logger, with its duration and outcome (`ff.metric: signal.receiver`).
+`async` receivers failing with a Slack API error (rate limit, unavailability...) are retried by Celery, with a backoff.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial, update_wrapper
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models, transaction
+
+from firefighter.incidents.signals import (
+    incident_closed,
+    incident_created,
+    incident_updated,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.dispatch import Signal
+
+logger = logging.getLogger("firefighter.observability")
+
+ReceiverMode = Literal["sync", "async"]
+ReceiverT = TypeVar("ReceiverT", bound="Callable[..., Any]")
+
+LIFECYCLE_SIGNALS: dict[str, Signal] = {
+    "incident_created": incident_created,
+    "incident_updated": incident_updated,
+    "incident_closed": incident_closed,
+}
+"""Signals supported by the bus, by name. The name is used in the Celery task payload."""
+
+
+@dataclass(frozen=True)
+class AsyncReceiver:
+    path: str
+    """Dotted path of the receiver function, imported by the Celery task."""
+    func: Callable[..., Any]
+    sender: Any = None
+    """Only run for this sender, like Django's `receiver(sender=...)`."""
+
+
+_async_receivers: dict[str, list[AsyncReceiver]] = {}
+
+
+def _signal_name(signal: Signal) -> str:
+    for name, lifecycle_signal in LIFECYCLE_SIGNALS.items():
+        if lifecycle_signal is signal:
+            return name
+    msg = f"{signal!r} is not an incident lifecycle signal. Use one of {', '.join(LIFECYCLE_SIGNALS)}."
+    raise ValueError(msg)
+
+
+def _receiver_path(func: Callable[..., Any]) -> str:
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def lifecycle_receiver(
+    signal: Signal, *, sender: Any = None, mode: ReceiverMode = "sync"
+) -> Callable[[ReceiverT], ReceiverT]:
+    """Decorator to connect a receiver to an incident lifecycle signal.
+
+    The decorated function is returned unchanged, and can still be called directly.
+
+    Args:
+        signal (Signal): One of the [LIFECYCLE_SIGNALS][firefighter.incidents.signal_bus.LIFECYCLE_SIGNALS].
+        sender (Any, optional): Only receive the signal from this sender. Defaults to None (all senders).
+        mode (ReceiverMode, optional): `sync` to run when the signal is sent, `async` to run in Celery after commit. Defaults to "sync".
+
+    Raises:
+        ValueError: If the signal is not an incident lifecycle signal.
+    """
+    signal_name = _signal_name(signal)
+
+    def decorator(func: ReceiverT) -> ReceiverT:
+        path = _receiver_path(func)
+        if mode == "sync":
+            signal.connect(
+                # Named after the receiver, e.g. for the error log of `send_robust`
+                update_wrapper(
+                    partial(
+                        run_receiver, func, path, signal_name, "sync", robust=False
+                    ),
+                    func,
+                ),
+                sender=sender,
+                weak=False,
+                dispatch_uid=path,
+            )
+            return func
+
+        receivers = _async_receivers.setdefault(signal_name, [])
+        if not any(receiver.path == path for receiver in receivers):
+            receivers.append(AsyncReceiver(path=path, func=func, sender=sender))
+        signal.connect(
+            partial(_dispatch_async_receivers, signal_name),
+            weak=False,
+            dispatch_uid=f"{__name__}.{signal_name}",
+        )
+        return func
+
+    return decorator
+
+
+def run_receiver(
+    func: Callable[..., Any],
+    path: str,
+    signal_name: str,
+    mode: ReceiverMode,
+    *,
+    robust: bool = True,
+    reraise: tuple[type[Exception], ...] = (),
+    **kwargs: Any,
+) -> Any:
+    """Run a receiver and log its duration and outcome. Exceptions are re-raised, unless `robust` is set and they are not instances of `reraise`."""
+    start = time.perf_counter()
+    error: Exception | None = None
+    try:
+        return func(**kwargs)
+    except Exception as e:
+        error = e
+        if not robust or isinstance(e, reraise):
+            raise
+        return None
+    finally:
+        extra = {
+            "ff.metric": "signal.receiver",
+            "ff.signal": signal_name,
+            "ff.receiver": path,
+            "ff.receiver_mode": mode,
+            "ff.duration_ms": round((time.perf_counter() - start) * 1000, 3),
+            "ff.success": error is None,
+        }
+        if error is None:
+            logger.debug("Receiver %s of %s succeeded", path, signal_name, extra=extra)
+        else:
+            logger.error(
+                "Receiver %s of %s failed: %s",
+                path,
+                signal_name,
+                error,
+                exc_info=error,
+                extra=extra,
+            )
+
+
+def serialize_signal_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Replace the model instances sent with a signal by references, to send them to Celery as JSON."""
+    return {
+        key: {"model": value._meta.label_lower, "pk": str(value.pk)}  # noqa: SLF001
+        if isinstance(value, models.Model)
+        else value
+        for key, value in kwargs.items()
+    }
+
+
+def deserialize_signal_kwargs(payload: dict[str, Any]) -> dict[str, Any]:
+    """Reload the model instances referenced by [serialize_signal_kwargs][firefighter.incidents.signal_bus.serialize_signal_kwargs].
+
+    Raises:
+        ObjectDoesNotExist: If an object was deleted since the signal was sent.
+    """
+    kwargs: dict[str, Any] = {}
+    for key, value in payload.items():
+        if isinstance(value, dict) and value.keys() == {"model", "pk"}:
+            model = apps.get_model(value["model"])
+            value = model._default_manager.get(pk=value["pk"])  # noqa: PLW2901, SLF001
+        kwargs[key] = value
+    return kwargs
+
+
+def _dispatch_async_receivers(
+    signal_name: str, sender: Any, signal: Signal, **kwargs: Any
+) -> None:
+    """Connected to each lifecycle signal with `async` receivers: schedules them after commit, or runs them inline if `FF_SIGNALS_ASYNC` is disabled."""
+    receivers = [
+        receiver
+        for receiver in _async_receivers.get(signal_name, [])
+        if receiver.sender is None or receiver.sender == sender
+    ]
+    if not receivers:
+        return
+    if not settings.FF_SIGNALS_ASYNC:
+        for receiver in receivers:
+            run_receiver(
+                receiver.func,
+                receiver.path,
+                signal_name,
+                "async",
+                sender=sender,
+                signal=signal,
+                **kwargs,
+            )
+        return
+
+    payload = serialize_signal_kwargs(kwargs)
+    sender_name = sender if sender is None or isinstance(sender, str) else str(sender)
+    for receiver in receivers:
+        transaction.on_commit(
+            partial(_enqueue, receiver.path, signal_name, sender_name, payload)
+        )
+
+
+def _enqueue(
+    path: str, signal_name: str, sender: str | None, payload: dict[str, Any]
+) -> None:
+    from firefighter.incidents.tasks.signal_bus import (
+        RETRIED_ERRORS,
+        run_async_receiver,
+    )
+
+    try:
+        run_async_receiver.delay(path, signal_name, sender, payload)
+    except Exception:
+        # The broker is unavailable: better late than never
+        logger.exception("Could not enqueue receiver %s, running it inline.", path)
+        # Already logged, and can't be retried without the broker
+        with suppress(*RETRIED_ERRORS):
+            run_async_receiver(path, signal_name, sender, payload)
+
+
+def get_async_receiver(signal_name: str, path: str) -> AsyncReceiver | None:
+    """Returns the `async` receiver registered with this path for a signal, if any."""
+    for receiver in _async_receivers.get(signal_name, []):
+        if receiver.path == path:
+            return receiver
+    return None
@@ -16,7 +16,8 @@ if TYPE_CHECKING:
 class IncidentTable(tables.Table):
     class Meta:
         model = Incident
-        template_name = "incidents/table.html"
+        # Rows are cached, see firefighter.incidents.fragment_cache
+        template_name = "incidents/incident_table.html"
         fields = (
             "id",
             "title",
@@ -1,3 +1,3 @@
 from __future__ import annotations
 
-from firefighter.incidents.tasks import updateoncall
+from firefighter.incidents.tasks import change_feed, signal_bus, updateoncall
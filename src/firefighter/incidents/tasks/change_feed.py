@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from celery import shared_task
+
+from firefighter.incidents.change_feed import (
+    purge_incident_events as purge_incident_events_from_db,
+)
+
+
+@shared_task(name="incidents.purge_incident_events", ignore_result=True)
+def purge_incident_events() -> int:
+    """Deletes the incident events older than the retention of the change feed. Scheduled daily."""
+    return purge_incident_events_from_db()
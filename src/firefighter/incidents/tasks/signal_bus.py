@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from celery import shared_task
+from django.core.exceptions import ObjectDoesNotExist
+from slack_sdk.errors import SlackApiError
+
+from firefighter.incidents.signal_bus import (
+    LIFECYCLE_SIGNALS,
+    deserialize_signal_kwargs,
+    get_async_receiver,
+    run_receiver,
+)
+
+logger = logging.getLogger(__name__)
+
+
+RETRIED_ERRORS: tuple[type[Exception], ...] = (SlackApiError,)
+"""Errors of the `async` receivers that are retried, with a backoff."""
+
+
+@shared_task(
+    name="incidents.run_async_receiver",
+    ignore_result=True,
+    autoretry_for=RETRIED_ERRORS,
+    max_retries=3,
+    retry_backoff=True,
+)
+def run_async_receiver(
+    path: str, signal_name: str, sender: str | None, payload: dict[str, Any]
+) -> None:
+    """Run an `async` receiver of an incident lifecycle signal, see [firefighter.incidents.signal_bus][].
+
+    Args:
+        path (str): Dotted path of the receiver.
+        signal_name (str): Name of the signal, in [LIFECYCLE_SIGNALS][firefighter.incidents.signal_bus.LIFECYCLE_SIGNALS].
+        sender (str | None): Sender of the signal.
+        payload (dict[str, Any]): Signal kwargs, from [serialize_signal_kwargs][firefighter.incidents.signal_bus.serialize_signal_kwargs].
+    """
+    receiver = get_async_receiver(signal_name, path)
+    if receiver is None:
+        logger.error(f"Unknown async receiver {path} for signal {signal_name}.")
+        return
+    try:
+        kwargs = deserialize_signal_kwargs(payload)
+    except ObjectDoesNotExist:
+        logger.warning(
+            f"Skipping receiver {path} of {signal_name}: an object was deleted since the signal was sent."
+        )
+        return
+    run_receiver(
+        receiver.func,
+        path,
+        signal_name,
+        "async",
+        reraise=RETRIED_ERRORS,
+        sender=sender,
+        signal=LIFECYCLE_SIGNALS[signal_name],
+        **kwargs,
+    )
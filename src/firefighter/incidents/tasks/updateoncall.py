@@ -14,8 +14,6 @@ if TYPE_CHECKING:
 if settings.ENABLE_PAGERDUTY:
     from firefighter.pagerduty.models import PagerDutyOncall
     from firefighter.pagerduty.tasks import fetch_oncalls
-if settings.ENABLE_CONFLUENCE:
-    from firefighter.confluence.service import confluence_service
 if settings.ENABLE_SLACK:
     from firefighter.slack.models.conversation import Conversation
     from firefighter.slack.models.user import SlackUser
@@ -107,5 +105,6 @@ def update_oncall_slack_topic(
 def update_oncall_confluence(users: dict[str, User]) -> bool:
     if not settings.ENABLE_CONFLUENCE:
         return False
+    from firefighter.confluence.service import confluence_service
 
     return confluence_service.update_oncall_page(users)
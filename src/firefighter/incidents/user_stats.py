@@ -0,0 +1,126 @@
+"""Incident statistics of a user: incidents opened and incident roles held, for the user profile and the admin.
+
+The statistics are computed with a single grouped query, and cached per user.
+The entry of a user is invalidated when one of their incidents or incident roles is saved or deleted.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import CharField, Count, F, Value
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch.dispatcher import receiver
+
+from firefighter.incidents.models.incident import Incident
+from firefighter.incidents.models.incident_membership import IncidentRole
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+USER_STATS_CACHE_KEY = "incidents:user_stats:{user_id}"
+USER_STATS_MAX_AGE = timedelta(hours=1)
+"""The entries are invalidated on changes, this is only a safety net for changes made without signals (e.g. `QuerySet.update`)."""
+_INCIDENTS_OPENED = "incidents-opened"
+"""Not a valid role type slug, as they can't contain dashes."""
+
+
+class UserIncidentStats(TypedDict):
+    incidents_opened: int
+    roles: dict[str, int]
+    """Number of incident roles, per role type slug."""
+
+
+def _cache_key(user_id: UUID) -> str:
+    return USER_STATS_CACHE_KEY.format(user_id=user_id)
+
+
+def get_user_incident_stats(user_id: UUID) -> UserIncidentStats:
+    """Returns the incident statistics of a user, from the cache if possible.
+
+    Args:
+        user_id (UUID): ID of the user.
+
+    Returns:
+        UserIncidentStats: Incidents opened and roles held by the user.
+    """
+    key = _cache_key(user_id)
+    stats: UserIncidentStats | None = cache.get(key)
+    if stats is None:
+        stats = compute_user_incident_stats(user_id)
+        cache.set(key, stats, timeout=int(USER_STATS_MAX_AGE.total_seconds()))
+    return stats
+
+
+def compute_user_incident_stats(user_id: UUID) -> UserIncidentStats:
+    """Computes the incident statistics of a user, with one query grouping their roles by role type, and counting the incidents they opened.
+
+    Args:
+        user_id (UUID): ID of the user.
+    """
+    roles = (
+        IncidentRole.objects.filter(user_id=user_id)
+        .annotate(key=F("role_type__slug"))
+        .values_list("key")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    incidents_opened = (
+        Incident.objects.filter(created_by_id=user_id)
+        .annotate(key=Value(_INCIDENTS_OPENED, output_field=CharField()))
+        .values_list("key")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    counts: dict[str, int] = dict(roles.union(incidents_opened, all=True))
+    return UserIncidentStats(
+        incidents_opened=counts.pop(_INCIDENTS_OPENED, 0),
+        roles=counts,
+    )
+
+
+def invalidate_user_incident_stats(*user_ids: UUID | None) -> None:
+    """Invalidates the statistics of some users, now and after the current transaction is committed. `None` values are ignored.
+
+    The second invalidation prevents a concurrent lookup from caching the statistics of before the commit.
+    """
+    keys = [_cache_key(user_id) for user_id in user_ids if user_id is not None]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(partial(cache.delete_many, keys))
+
+
+@receiver(post_save, sender=Incident)
+@receiver(post_delete, sender=Incident)
+def incident_changed(sender: Any, instance: Incident, **kwargs: Any) -> None:
+    invalidate_user_incident_stats(instance.created_by_id)
+
+
+@receiver(pre_save, sender=IncidentRole)
+def incident_role_reassigned(
+    sender: Any, instance: IncidentRole, **kwargs: Any
+) -> None:
+    # Roles are reassigned to another user (e.g. a new commander): the previous user also loses a role
+    if instance.pk is None or kwargs.get("raw"):
+        return
+    previous_user_id = (
+        IncidentRole.objects.filter(pk=instance.pk)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+    if previous_user_id != instance.user_id:
+        invalidate_user_incident_stats(previous_user_id)
+
+
+@receiver(post_save, sender=IncidentRole)
+@receiver(post_delete, sender=IncidentRole)
+def incident_role_changed(sender: Any, instance: IncidentRole, **kwargs: Any) -> None:
+    invalidate_user_incident_stats(instance.user_id)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import logging
 import re
+from datetime import date
 from typing import TYPE_CHECKING
 
 from dateutil.relativedelta import relativedelta
@@ -14,7 +16,9 @@ from firefighter.incidents.views.date_utils import (
     get_bounds_from_week,
     get_bounds_from_year,
     get_current_quarter,
+    get_day_date_range,
     get_last_quarter,
+    get_month_date_range,
     parse_date_natural,
 )
 
@@ -25,24 +29,72 @@ logger = logging.getLogger(__name__)
 
 
 RANGE_REGEX = re.compile(
-    r"^(?P<iso_year>[iI])?(?P<year>\d{4})?/?(?:[qQ](?P<quarter>[1-4])|([wW](?P<week>5[0-3]|[1-4]\d|[0-4]?[1-9])))?$"
+    r"^(?P<iso_year>[iI])?(?P<year>\d{4})?(?:/|-(?=[qQwW]))?(?:[qQ](?P<quarter>[1-4])|([wW](?P<week>5[0-3]|[1-4]\d|[0-4]?[1-9])))?$"
 )
+ISO_DATE_REGEX = re.compile(r"^(?P<year>\d{4})-(?P<month>\d{2})(?:-(?P<day>\d{2}))?$")
 
 
 SPECIAL_RANGES = ["current_week", "last_week", "current_quarter", "last_quarter"]
+SPECIAL_RANGES_ALIASES = {
+    "this_week": "current_week",
+    "this_quarter": "current_quarter",
+}
+
+
+def _normalize_moment(value: str) -> str:
+    return " ".join(value.split()).lower()
 
 
 def parse_moment(value: str) -> slice | None:
     """Returns a :class:`slice` with the :func:`slice.start` and :func:`slice.stop` of the given moment.
     If the moment is not a valid moment, returns None.
     If the moment is a point in time, returns a slice with the same start and stop.
+
+    The usual values are parsed by [parse_moment_fast][firefighter.incidents.views.date_filter.parse_moment_fast], the others with dateparser, which is much slower.
+    The results are memoized per normalized value and per day, as relative values (`last week`, `Q1`, `may 1`) depend on the current day.
+    The values parsed with dateparser are memoized per minute instead, as they can depend on the current time (`now`, `2 hours ago`).
     """
-    value = value.strip()
+    value = _normalize_moment(value)
+    now = timezone.localtime(timezone.now())
+    moment = _parse_moment(value, now.date())
+    if moment is not None or not value:
+        # An empty value is the missing side of an open range (e.g. `2022-`)
+        return moment
+
+    # Match using dateparser (lots of formats)
+    return _parse_moment_natural(value, now.replace(second=0, microsecond=0))
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_moment(value: str, today: date) -> slice | None:
+    return parse_moment_fast(value)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_moment_natural(value: str, minute: datetime) -> slice | None:
+    return parse_date_natural(value)
+
 
+def parse_moment_fast(value: str) -> slice | None:
+    """Parses the usual moments without dateparser. Returns None if the value is not one of them.
+
+    Supported values:
+
+    - Relative ranges: `current_week`, `last_week`, `current_quarter`, `last_quarter` (or `last week`, `this week`...)
+    - Calendar values: `2022`, `I2022` (ISO year), `Q4`, `W20`, `2022/Q4`, `2022-Q4`, `2022/W20`, `2022-W20`
+    - ISO dates and months: `2022-05-01`, `2022-05`
+
+    Args:
+        value (str): The moment, normalized (stripped and lowercase).
+    """
     # Quarter/Week relative (current/previous quarter, current/previous week)
-    if value in SPECIAL_RANGES:
+    special_range = value.replace(" ", "_")
+    special_range = SPECIAL_RANGES_ALIASES.get(special_range, special_range)
+    if special_range in SPECIAL_RANGES:
         now = timezone.localtime(timezone.now())
-        returned_range = get_date_range_from_relative_calendar_value(value, now, value)
+        returned_range = get_date_range_from_relative_calendar_value(
+            special_range, now, value
+        )
         if None not in returned_range:
             return slice(returned_range[0], returned_range[1])
 
@@ -51,14 +103,30 @@ def parse_moment(value: str) -> slice | None:
     if None not in week_or_quarter_time_frame:
         return slice(week_or_quarter_time_frame[0], week_or_quarter_time_frame[1])
 
-    # Match using dateparser (lots of formats)
-    return parse_date_natural(value)
+    match = ISO_DATE_REGEX.match(value)
+    if match:
+        try:
+            date_ = date(
+                int(match["year"]), int(match["month"]), int(match["day"] or 1)
+            )
+        except ValueError:
+            return None
+        if match["day"]:
+            return get_day_date_range(date_)
+        return get_month_date_range(date_)
+    return None
 
 
 def get_date_range_from_special_date(
     unparsed_date: str,
 ) -> tuple[datetime | None, datetime | None, str | None, str | None]:
     """TODO Specify the year parameter (ISO or calendar)."""
+    unparsed_date = unparsed_date.strip()
+    # Some single moments contain a dash (2022-Q1, 2022-05-01...)
+    date_range = parse_moment_fast(_normalize_moment(unparsed_date))
+    if date_range is not None:
+        return date_range.start, date_range.stop, None, "TODO"
+
     if "-" in unparsed_date:
         logger.debug("Parsing range, splitting with /")
 
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from django.apps import apps
-from django.db.models.query import Prefetch
+from django.db.models import Count, Exists, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
 from firefighter.firefighter.views import CustomDetailView
+from firefighter.incidents.models.incident_role_type import IncidentRoleType
 from firefighter.incidents.models.user import User
+from firefighter.incidents.user_stats import get_user_incident_stats
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
 
 logger = logging.getLogger(__name__)
 SELECT_RELATED = []
@@ -18,6 +24,40 @@ if apps.is_installed("firefighter.pagerduty"):
     SELECT_RELATED.append("pagerduty_user")
 
 
+def _with_members_count(
+    queryset: QuerySet[Any], model: type[UserGroup | Conversation]
+) -> QuerySet[Any]:
+    """Annotates `members_count` with a subquery, without loading the members."""
+    model_name = str(model._meta.model_name)  # noqa: SLF001
+    members = (
+        model.members.through.objects.filter(**{model_name: OuterRef("pk")})
+        .order_by()
+        .values(model_name)
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    has_incident_categories = model.incident_categories.through.objects.filter(
+        **{model_name: OuterRef("pk")}
+    )
+    return queryset.filter(Exists(has_incident_categories)).annotate(
+        members_count=Coalesce(Subquery(members, output_field=IntegerField()), 0)
+    )
+
+
+def get_responder_groups(
+    user: User,
+) -> tuple[QuerySet[UserGroup], QuerySet[Conversation]]:
+    """Returns the usergroups and conversations of a user that are linked to an incident category, with their `members_count`."""
+    usergroups = _with_members_count(UserGroup.objects.filter(members=user), UserGroup)
+    conversations = _with_members_count(
+        Conversation.objects.not_incident_channel()
+        .exclude(tag="")
+        .filter(members=user),
+        Conversation,
+    )
+    return usergroups, conversations
+
+
 class UserDetailView(CustomDetailView[User]):
     """In this view, be extra careful.
 
@@ -29,29 +69,24 @@ class UserDetailView(CustomDetailView[User]):
     pk_url_kwarg = "user_id"
     model = User
     select_related = SELECT_RELATED
-    queryset = User.objects.select_related(*select_related).prefetch_related(
-        Prefetch(
-            "conversation_set",
-            queryset=Conversation.objects.not_incident_channel()
-            .exclude(tag="")
-            .filter(incident_categories__isnull=False)
-            .distinct()
-            .prefetch_related(Prefetch("members")),
-        ),
-        Prefetch(
-            "usergroup_set",
-            queryset=UserGroup.objects.filter(incident_categories__isnull=False)
-            .distinct()
-            .prefetch_related(Prefetch("members")),
-        ),
-    )
+    queryset = User.objects.select_related(*select_related)
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         target_user: User = context[self.context_object_name]
+        user_stats = get_user_incident_stats(target_user.id)
 
-        additional_context = {
+        additional_context: dict[str, Any] = {
             "page_title": f"{target_user.full_name} | User",
+            "incidents_opened": user_stats["incidents_opened"],
+            "role_stats": [
+                (role_type, user_stats["roles"].get(role_type.slug, 0))
+                for role_type in IncidentRoleType.objects.order_by("order")
+            ],
         }
+        if apps.is_installed("firefighter.slack"):
+            usergroups, conversations = get_responder_groups(target_user)
+            additional_context["usergroups"] = usergroups
+            additional_context["conversations"] = conversations
 
         return {**context, **additional_context}
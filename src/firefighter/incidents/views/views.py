@@ -3,24 +3,28 @@ from __future__ import annotations
 import logging
 import re
 from contextlib import suppress
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, cast
 
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Prefetch
 from django.db.models.expressions import OuterRef, Subquery
-from django.db.models.query import Prefetch
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.urls import reverse, reverse_lazy
 from django.views import generic
 from django_filters.views import FilterView
 from django_tables2.views import SingleTableMixin
 
+from firefighter.firefighter.pagination import EstimatedCountPaginator, fast_count
 from firefighter.firefighter.views import CustomDetailView
 from firefighter.incidents.enums import IncidentStatus
 from firefighter.incidents.forms import CreateIncidentForm
 from firefighter.incidents.forms.update_key_events import IncidentUpdateKeyEventsForm
+from firefighter.incidents.fragment_cache import get_fragment_version
 from firefighter.incidents.models.impact import Impact
 from firefighter.incidents.models.incident import Incident, IncidentFilterSet
+from firefighter.incidents.models.incident_membership import IncidentRole
 from firefighter.incidents.models.incident_update import IncidentUpdate
 from firefighter.incidents.models.metric_type import IncidentMetric
 from firefighter.incidents.signals import (
@@ -37,21 +41,84 @@ logger = logging.getLogger(__name__)
 
 
 class IncidentListView(SingleTableMixin, FilterView):
+    """List of incidents, filtered with HTMX.
+
+    Sorted by ID (the default), the list is paginated with a cursor on the ID and a "Load more" button,
+    so every page is a range scan of the primary key index, however deep it is.
+    Sorted by another column or by search relevance, or when a page number is given, the pages are numbered.
+
+    Large results are counted with an estimate (see [fast_count][firefighter.firefighter.pagination.fast_count]).
+    """
+
     table_class = IncidentTable
     context_object_name = "incidents"
     filterset_class = IncidentFilterSet
     model = Incident
 
-    paginate_by = 125
-    paginate_orphans = 15
+    # Only the table is paginated, the list is not paginated (and counted) a second time
+    table_pagination: dict[str, Any] = {
+        "per_page": 125,
+        "orphans": 15,
+        "paginator_class": EstimatedCountPaginator,
+    }
     queryset = Incident.objects.select_related(
         "priority", "incident_category__group", "environment"
     ).order_by("-id")
+    cursor_param = "cursor"
+    next_cursor: int | None = None
+
+    @cached_property
+    def ordered_by_id(self) -> bool:
+        """Whether the filtered incidents are in the default order: not sorted by search relevance or by the `order_by` filter."""
+        return tuple(self.object_list.query.order_by) == ("-id",)
+
+    @cached_property
+    def keyset(self) -> bool:
+        # `sort` is the ordering parameter of django-tables2
+        if "sort" in self.request.GET or "page" in self.request.GET:
+            return False
+        return self.ordered_by_id and not self.request.GET.get("search", "").strip()
+
+    @cached_property
+    def cursor(self) -> int | None:
+        """ID of the last incident already displayed, from the query parameters."""
+        with suppress(KeyError, ValueError):
+            return int(self.request.GET[self.cursor_param])
+        return None
+
+    def get_table_data(self) -> Any:
+        incidents = super().get_table_data()
+        if not self.keyset:
+            return incidents
+
+        if self.cursor is not None:
+            incidents = incidents.filter(id__lt=self.cursor)
+        per_page = self.table_pagination["per_page"]
+        # One more incident, to know if there is a next page
+        page = list(incidents.order_by("-id")[: per_page + 1])
+        if len(page) > per_page:
+            page = page[:per_page]
+            self.next_cursor = page[-1].id
+        return page
+
+    def get_table_kwargs(self) -> dict[str, Any]:
+        if "sort" not in self.request.GET and not self.ordered_by_id:
+            # Keep the order of the search results or of the `order_by` filter, instead of the default order of the table
+            return {"order_by": ()}
+        return {}
+
+    def get_table_pagination(self, table: IncidentTable) -> dict[str, Any] | bool:
+        if self.keyset:
+            return False
+        return super().get_table_pagination(table)
 
     def get_template_names(self) -> list[str]:
         request = cast("HtmxHttpRequest", self.request)
         if request.htmx and not request.htmx.boosted:
-            template_name = "layouts/partials/partial_table_list_paginated.html"
+            if self.keyset and self.cursor is not None:
+                template_name = "layouts/partials/partial_table_rows.html"
+            else:
+                template_name = "layouts/partials/partial_table_list_paginated.html"
         else:
             template_name = "pages/incident_list.html"
 
@@ -61,9 +128,20 @@ class IncidentListView(SingleTableMixin, FilterView):
         """No *args to pass."""
         # Call the base implementation first to get a context
         context = super().get_context_data(**kwargs)
-        context["page_range"] = context["table"].paginator.get_elided_page_range(
-            context["table"].page.number, on_each_side=2, on_ends=1
-        )
+        table = context["table"]
+        if self.keyset:
+            context["keyset"] = True
+            context["cursor_param"] = self.cursor_param
+            context["next_cursor"] = self.next_cursor
+            if self.cursor is None:
+                context["result_count"], context["result_count_is_exact"] = fast_count(
+                    self.object_list
+                )
+        else:
+            context["page_obj"] = table.page
+            context["page_range"] = table.paginator.get_elided_page_range(
+                table.page.number, on_each_side=2, on_ends=1
+            )
         context["filter_order"] = [
             "search",
             "created_at",
@@ -171,23 +249,11 @@ class IncidentDetailView(CustomDetailView[Incident]):
         pass
     queryset = Incident.objects.select_related(*select_related).prefetch_related(
         Prefetch(
-            "incidentupdate_set",
-            queryset=IncidentUpdate.objects.select_related(
-                "priority",
-                "incident_category__group",
-                "created_by__slack_user",
-                "created_by",
-                "commander",
-                "communication_lead",
-            ).order_by("-event_ts"),
-        ),
-        Prefetch(
-            "metrics", queryset=IncidentMetric.objects.select_related("metric_type")
-        ),
-        Prefetch(
-            "impacts",
-            queryset=Impact.objects.select_related("impact_type", "impact_level"),
-        ),
+            "roles_set",
+            queryset=IncidentRole.objects.select_related(
+                "role_type", "user__slack_user"
+            ),
+        )
     )
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
@@ -219,6 +285,24 @@ class IncidentDetailView(CustomDetailView[Incident]):
 
         additional_context = {
             "page_title": f"Incident #{incident.id}",
+            # Lazy querysets: only evaluated when their cached fragment is rendered
+            "fragment_version": get_fragment_version(incident.id),
+            "incident_updates": IncidentUpdate.objects.filter(incident=incident)
+            .select_related(
+                "priority",
+                "incident_category__group",
+                "created_by__slack_user",
+                "created_by",
+                "commander",
+                "communication_lead",
+            )
+            .order_by("-event_ts"),
+            "metrics": IncidentMetric.objects.filter(incident=incident).select_related(
+                "metric_type"
+            ),
+            "impacts": Impact.objects.filter(incident=incident).select_related(
+                "impact_type", "impact_level"
+            ),
             "has_confluence_app": has_confluence_app,
             "has_jira_app": has_jira_app,
             "has_confluence_pm": has_confluence_pm,
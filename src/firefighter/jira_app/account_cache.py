@@ -0,0 +1,156 @@
+"""Cache of the resolution of Jira account IDs, for the webhooks (authors) and the watchers of the tickets.
+
+Each account ID is resolved to its [JiraUser][firefighter.jira_app.models.JiraUser], the ID of its user and their email address:
+
+- in the process memory, a LRU of the last accounts, for a few minutes ([JIRA_ACCOUNT_LOCAL_MAX_AGE][firefighter.jira_app.account_cache.JIRA_ACCOUNT_LOCAL_MAX_AGE]).
+- in the cache (Redis), for `JIRA_ACCOUNT_CACHE_TTL` seconds.
+
+Accounts not found in the Jira API (or without an email address) are cached too, for `JIRA_USER_NOT_FOUND_CACHE_TTL` seconds,
+so a webhook rarely reaches the Jira user API.
+
+The entries are invalidated when a `JiraUser` is saved or deleted, or created in bulk by the directory sync. The email of a user is refreshed after `JIRA_ACCOUNT_CACHE_TTL` seconds.
+The cache and the current process are invalidated right away, the other processes within `JIRA_ACCOUNT_LOCAL_MAX_AGE`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch.dispatcher import receiver
+
+from firefighter.jira_app.models import JiraUser
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from uuid import UUID
+
+JIRA_ACCOUNT_CACHE_KEY = "jira_app:account:{account_id}"
+JIRA_ACCOUNT_LOCAL_MAX_AGE = timedelta(minutes=5)
+"""How long an account is kept in the memory of a process. Other processes see an invalidation after at most this delay."""
+_LOCAL_MAX_SIZE = 2048
+
+NOT_FOUND: Literal[False] = False
+"""Cached for the accounts not found in Jira."""
+
+
+class JiraAccount(NamedTuple):
+    jira_user_id: str
+    """ID of the `JiraUser`: usually the account ID, or another account of the same user."""
+    user_id: UUID
+    email: str
+
+    def to_jira_user(self) -> JiraUser:
+        """The `JiraUser`, as loaded from the database. Its user is fetched on access."""
+        return JiraUser.from_db(
+            "default", ["id", "user_id"], [self.jira_user_id, self.user_id]
+        )
+
+
+CachedJiraAccount = JiraAccount | Literal[False]
+
+_local_cache: OrderedDict[str, tuple[float, CachedJiraAccount]] = OrderedDict()
+_local_lock = threading.Lock()
+"""Guards `_local_cache`, shared by the threads of the process."""
+
+
+def _cache_key(account_id: str) -> str:
+    return JIRA_ACCOUNT_CACHE_KEY.format(account_id=account_id)
+
+
+def get_cached_accounts(account_ids: Iterable[str]) -> dict[str, CachedJiraAccount]:
+    """Returns the cached accounts, from the memory of the process then from the cache.
+
+    Returns:
+        dict[str, CachedJiraAccount]: The account or [NOT_FOUND][firefighter.jira_app.account_cache.NOT_FOUND], per account ID. Accounts not cached are missing.
+    """
+    now = time.monotonic()
+    accounts: dict[str, CachedJiraAccount] = {}
+    missing: dict[str, str] = {}
+    with _local_lock:
+        for account_id in account_ids:
+            local = _local_cache.get(account_id)
+            if local is not None and local[0] > now:
+                _local_cache.move_to_end(account_id)
+                accounts[account_id] = local[1]
+            else:
+                missing[_cache_key(account_id)] = account_id
+    if not missing:
+        return accounts
+
+    for key, account in cache.get_many(missing).items():
+        accounts[missing[key]] = account
+        _set_local(missing[key], account, now)
+    return accounts
+
+
+def cache_accounts(accounts: dict[str, JiraAccount]) -> None:
+    """Caches resolved accounts, per account ID, once the current transaction is committed (or now, outside of a transaction).
+
+    A `JiraUser` created in a transaction that is rolled back must not be cached.
+    """
+    if not accounts:
+        return
+    transaction.on_commit(
+        partial(_cache_many, accounts, timeout=settings.JIRA_ACCOUNT_CACHE_TTL)
+    )
+
+
+def cache_accounts_not_found(account_ids: Iterable[str]) -> None:
+    """Caches the accounts not found in Jira, so they are not fetched again for `JIRA_USER_NOT_FOUND_CACHE_TTL` seconds."""
+    _cache_many(
+        dict.fromkeys(account_ids, NOT_FOUND),
+        timeout=settings.JIRA_USER_NOT_FOUND_CACHE_TTL,
+    )
+
+
+def _cache_many(accounts: Mapping[str, CachedJiraAccount], timeout: int) -> None:
+    if not accounts:
+        return
+    cache.set_many(
+        {_cache_key(account_id): account for account_id, account in accounts.items()},
+        timeout=timeout,
+    )
+    now = time.monotonic()
+    for account_id, account in accounts.items():
+        _set_local(account_id, account, now)
+
+
+def _set_local(account_id: str, account: CachedJiraAccount, now: float) -> None:
+    with _local_lock:
+        _local_cache[account_id] = (
+            now + JIRA_ACCOUNT_LOCAL_MAX_AGE.total_seconds(),
+            account,
+        )
+        _local_cache.move_to_end(account_id)
+        while len(_local_cache) > _LOCAL_MAX_SIZE:
+            _local_cache.popitem(last=False)
+
+
+def invalidate_accounts(*account_ids: str) -> None:
+    """Invalidates some accounts, now and after the current transaction is committed.
+
+    The second invalidation prevents a concurrent resolution from caching an account of before the commit.
+    """
+    if not account_ids:
+        return
+    with _local_lock:
+        for account_id in account_ids:
+            _local_cache.pop(account_id, None)
+    cache_keys = [_cache_key(account_id) for account_id in account_ids]
+    cache.delete_many(cache_keys)
+    transaction.on_commit(partial(cache.delete_many, cache_keys))
+
+
+@receiver(post_delete, sender=JiraUser)
+@receiver(post_save, sender=JiraUser)
+def jira_user_changed(sender: Any, instance: JiraUser, **kwargs: Any) -> None:
+    invalidate_accounts(instance.id)
@@ -12,6 +12,7 @@ class JiraAppConfig(AppConfig):
     def ready(self) -> None:
         # Register signals
         # E.g. usage: create PostMortem (Jira and/or Confluence) on incident_updated
+        import firefighter.jira_app.account_cache
         import firefighter.jira_app.signals
         import firefighter.jira_app.tasks
 
@@ -4,14 +4,20 @@ import logging
 import time
 import urllib.parse
 from functools import cached_property
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from django import db
 from django.conf import settings
-from jira import JIRA, exceptions
-from jira import User as JiraAPIUser
+from django.core.cache import cache
 
 from firefighter.incidents.models.user import User
+from firefighter.jira_app.account_cache import (
+    NOT_FOUND,
+    JiraAccount,
+    cache_accounts,
+    cache_accounts_not_found,
+    get_cached_accounts,
+)
 from firefighter.jira_app.models import JiraUser
 from firefighter.jira_app.types import (
     Status,
@@ -25,10 +31,21 @@ from firefighter.jira_app.utils import (
     pythonic_keys,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from uuid import UUID
+
+    from jira import JIRA
+    from jira import User as JiraAPIUser
+
 logger = logging.getLogger(__name__)
 
 
 RAID_JIRA_API_URL: str = settings.RAID_JIRA_API_URL
+JIRA_DIRECTORY_PAGE_SIZE = 1000
+"""Maximum number of accounts returned by a page of `users/search`."""
+JIRA_BULK_USERS_PAGE_SIZE = 50
+"""Number of accounts fetched per request of `user/bulk` (their IDs are in the URL)."""
 
 
 class JiraUserNotFoundError(Exception):
@@ -55,12 +72,36 @@ class GetReporterError(Exception):
     pass
 
 
+def _jira_user_not_found_cache_key(user_id: UUID) -> str:
+    return f"jira_app:user_not_found:{user_id}"
+
+
+def is_jira_user_not_found(user_id: UUID) -> bool:
+    """Whether the user was not found in Jira recently, so it's not searched again."""
+    return bool(cache.get(_jira_user_not_found_cache_key(user_id)))
+
+
+def set_jira_users_not_found(user_ids: Iterable[UUID]) -> None:
+    """Remembers users not found in Jira for `JIRA_USER_NOT_FOUND_CACHE_TTL` seconds."""
+    cache.set_many(
+        {_jira_user_not_found_cache_key(user_id): True for user_id in user_ids},
+        timeout=settings.JIRA_USER_NOT_FOUND_CACHE_TTL,
+    )
+
+
+def clear_jira_users_not_found(user_ids: Iterable[UUID]) -> None:
+    cache.delete_many([_jira_user_not_found_cache_key(user_id) for user_id in user_ids])
+
+
 class JiraClient:
     def __init__(self) -> None:
         self.url = RAID_JIRA_API_URL
 
     @cached_property
     def jira(self) -> JIRA:
+        # The jira library (and its HTTP stack) is only imported when the API is called, not when the processes start
+        from jira import JIRA
+
         return JIRA(
             server=self.url,
             basic_auth=(
@@ -195,15 +236,39 @@ class JiraClient:
         if hasattr(user, "jira_user") and user.jira_user:
             return user.jira_user
 
+        if is_jira_user_not_found(user.id):
+            raise JiraUserNotFoundError("User not found in Jira (cached).")
         username = user.email.split("@")[0]
-        jira_user = self._fetch_jira_user(username)
+        try:
+            jira_user = self._fetch_jira_user(username)
+        except JiraUserNotFoundError:
+            set_jira_users_not_found([user.id])
+            raise
 
         return JiraUser.objects.update_or_create(
             id=jira_user.raw.get("accountId"), defaults={"user": user}
         )[0]
 
+    def iter_directory_users(self) -> Iterator[dict[str, Any]]:
+        """Pages through the whole Jira user directory, [JIRA_DIRECTORY_PAGE_SIZE][firefighter.jira_app.client.JIRA_DIRECTORY_PAGE_SIZE] accounts per request.
+
+        Yields:
+            dict[str, Any]: Raw Jira account (`accountId`, `accountType`, `active`, `emailAddress` if visible...)
+        """
+        start_at = 0
+        while True:
+            # Pages may be shorter than requested (accounts filtered out by Jira): stop on an empty one
+            page: list[dict[str, Any]] = self.jira._get_json(  # noqa: SLF001
+                "users/search",
+                params={"startAt": start_at, "maxResults": JIRA_DIRECTORY_PAGE_SIZE},
+            )
+            if not page:
+                return
+            yield from page
+            start_at += len(page)
+
     def get_jira_user_from_jira_id(self, jira_account_id: str) -> JiraUser:
-        """Look for a Jira User in DB, if not found, fetch it from Jira API.
+        """Look for a Jira User in the cache and the DB, if not found, fetch it from Jira API.
 
         Args:
             jira_account_id (str): Jira account id
@@ -220,19 +285,109 @@ class JiraClient:
             err_msg = f"Jira account id is empty ('{jira_account_id}')"
             raise ValueError(err_msg)
 
+        jira_user = self.get_jira_users_from_jira_ids([jira_account_id]).get(
+            jira_account_id
+        )
+        if jira_user is None:
+            raise JiraUserNotFoundError("User not Found")
+        return jira_user
+
+    def get_jira_users_from_jira_ids(
+        self, jira_account_ids: Iterable[str], *, fetch_missing: bool = True
+    ) -> dict[str, JiraUser]:
+        """Resolves Jira account ids to Jira users, in bulk: from the cache (see [firefighter.jira_app.account_cache][]),
+        then with one DB query, then with one Jira API call for the accounts not in the DB.
+
+        Accounts fetched from the Jira API are matched with the users by email, and the users are created if needed.
+
+        Args:
+            jira_account_ids (Iterable[str]): Jira account ids
+            fetch_missing (bool, optional): Fetch the accounts not in the DB from the Jira API, and create their users. Defaults to True.
+
+        Raises:
+            JiraUserNotFoundError: Jira API error
+            JiraUserDatabaseError: Unable to create user in DB
+
+        Returns:
+            dict[str, JiraUser]: Jira user per account id. Accounts not found are missing.
+        """
+        account_ids = {account_id for account_id in jira_account_ids if account_id}
+        jira_users: dict[str, JiraUser] = {}
+        cached = get_cached_accounts(account_ids)
+        for account_id, account in cached.items():
+            if account is not NOT_FOUND:
+                jira_users[account_id] = account.to_jira_user()
+        missing = account_ids - cached.keys()
+        if not missing:
+            return jira_users
+
         # Look in the DB
-        try:
-            return JiraUser.objects.get(id=jira_account_id)
-        except JiraUser.DoesNotExist:
-            logger.debug(
-                f"Jira user {jira_account_id} not found in DB, fetching from Jira API"
-            )
-        logger.info("User %s not found in DB. Check sync user task.", jira_account_id)
+        in_db = JiraUser.objects.select_related("user").in_bulk(missing)
+        jira_users |= in_db
+        missing -= in_db.keys()
+        if missing and fetch_missing:
+            logger.info("Users %s not found in DB. Check sync user task.", missing)
+            # Look on JIRA API
+            for account_id, raw_account in self._fetch_jira_accounts(missing).items():
+                email: str | None = raw_account.get("emailAddress")
+                if email is None:
+                    logger.warning("User %s has no email address", account_id)
+                    continue
+                jira_users[account_id] = self._get_or_create_jira_user(
+                    account_id, email, raw_account.get("displayName")
+                )
+            cache_accounts_not_found(missing - jira_users.keys())
+
+        cache_accounts(
+            {
+                account_id: JiraAccount(
+                    jira_user.id, jira_user.user_id, jira_user.user.email
+                )
+                for account_id, jira_user in jira_users.items()
+                if account_id not in cached
+            }
+        )
+        return jira_users
+
+    def _fetch_jira_accounts(
+        self, jira_account_ids: set[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Fetches accounts from the Jira API, [JIRA_BULK_USERS_PAGE_SIZE][firefighter.jira_app.client.JIRA_BULK_USERS_PAGE_SIZE] accounts per request.
 
-        # Look on JIRA API
-        jira_api_user, email = self._get_user_from_api(jira_account_id)
+        Raises:
+            JiraUserNotFoundError: Jira API error
+
+        Returns:
+            dict[str, dict[str, Any]]: Raw account per account id. Accounts not found are missing.
+        """
+        from jira.exceptions import JIRAError
+
+        account_ids = sorted(jira_account_ids)
+        accounts: dict[str, dict[str, Any]] = {}
+        try:
+            if len(account_ids) == 1:
+                accounts[account_ids[0]] = self.jira.user(account_ids[0]).raw
+                return accounts
+            for start in range(0, len(account_ids), JIRA_BULK_USERS_PAGE_SIZE):
+                page_ids = account_ids[start : start + JIRA_BULK_USERS_PAGE_SIZE]
+                page = self.jira._get_json(  # noqa: SLF001
+                    "user/bulk",
+                    params={"accountId": page_ids, "maxResults": len(page_ids)},
+                )
+                accounts |= {
+                    account["accountId"]: account for account in page.get("values", [])
+                }
+        except JIRAError as e:
+            if e.status_code == 404:
+                return accounts
+            logger.exception("Error getting users %s", account_ids)
+            raise JiraUserNotFoundError("User not Found") from e
+        return accounts
 
-        username: str = email.split("@")[0]
+    def _get_or_create_jira_user(
+        self, jira_account_id: str, email: str, display_name: Any
+    ) -> JiraUser:
+        username: str = email.split("@", maxsplit=1)[0]
         # Check if we have user with same email
         try:
             user: User = User.objects.select_related("jira_user").get(email=email)
@@ -254,7 +409,7 @@ class JiraClient:
         except User.DoesNotExist:
             logger.warning("User %s not found in DB. Creating it...", jira_account_id)
             user = self._create_user_from_jira_info(
-                jira_account_id, jira_api_user, email, username
+                jira_account_id, display_name, email, username
             )
 
         try:
@@ -280,9 +435,11 @@ class JiraClient:
         Returns:
             list(JiraAPIUser): List of Jira users object, or empty list if ticket doesn't exist
         """
+        from jira.exceptions import JIRAError
+
         try:
             watchers = self.jira.watchers(jira_issue_id).raw.get("watchers")
-        except exceptions.JIRAError as e:
+        except JIRAError as e:
             if e.status_code == 404:
                 logger.warning(
                     "Jira ticket %s not found or no permission to access it. Cannot fetch watchers.",
@@ -298,11 +455,11 @@ class JiraClient:
     @staticmethod
     def _create_user_from_jira_info(
         jira_account_id: str,
-        jira_api_user: JiraAPIUser,
+        display_name: Any,
         email: str,
         username: str,
     ) -> User:
-        name = jira_api_user.raw.get("displayName")
+        name = display_name
         if not name or not isinstance(name, str):
             logger.warning("User %s has no display name, using email as name", email)
             name = email.split("@", maxsplit=1)[0]
@@ -318,20 +475,6 @@ class JiraClient:
             raise JiraUserDatabaseError("Unable to create user") from e
         return user
 
-    def _get_user_from_api(self, jira_account_id: str) -> tuple[JiraAPIUser, str]:
-        try:
-            jira_api_user = self.jira.user(jira_account_id)
-            email: str | None = jira_api_user.raw.get("emailAddress")
-
-        except exceptions.JIRAError as e:
-            logger.exception("Error getting user %s", jira_account_id)
-            raise JiraUserNotFoundError("User not Found") from e
-
-        if email is None:
-            logger.warning("User %s has no email address", jira_account_id)
-            raise JiraUserNotFoundError("User not Found: no email address for user")
-        return jira_api_user, email
-
     def _get_project_config_workflow_base(
         self, project_key: str, workflow_name: str
     ) -> dict[str, Any]:
@@ -509,6 +652,8 @@ class JiraClient:
         Raises:
             JiraAPIError: If issue creation fails
         """
+        from jira.exceptions import JIRAError
+
         try:
             issue_dict: dict[str, Any] = {
                 "project": {"key": project_key},
@@ -530,7 +675,7 @@ class JiraClient:
                     postmortem_issue_key=issue.key,
                 )
 
-        except exceptions.JIRAError as e:
+        except JIRAError as e:
             logger.exception(
                 "Failed to create Jira issue in project %s",
                 project_key,
@@ -549,6 +694,15 @@ class JiraClient:
                 "id": issue.id,
             }
 
+    def link_postmortem_issue(
+        self, parent_issue_key: str, postmortem_issue_key: str
+    ) -> None:
+        """Links a post-mortem to its incident issue. Errors are logged, not raised."""
+        self._create_issue_link_safe(
+            parent_issue_key=parent_issue_key,
+            postmortem_issue_key=postmortem_issue_key,
+        )
+
     def _create_issue_link_safe(
         self, parent_issue_key: str, postmortem_issue_key: str
     ) -> None:
@@ -567,6 +721,8 @@ class JiraClient:
             This method will not raise exceptions - it logs warnings instead.
             The post-mortem creation should succeed even if linking fails.
         """
+        from jira.exceptions import JIRAError
+
         # List of link types to try, in order of preference
         link_types = ["Relates", "Blocks", "Relates to"]
 
@@ -576,7 +732,7 @@ class JiraClient:
                 try:
                     self.jira.issue(parent_issue_key)
                     self.jira.issue(postmortem_issue_key)
-                except exceptions.JIRAError as validation_error:
+                except JIRAError as validation_error:
                     logger.warning(
                         "Issue validation failed before creating link: %s",
                         validation_error,
@@ -593,7 +749,7 @@ class JiraClient:
                     },
                 )
 
-            except exceptions.JIRAError as link_error:
+            except JIRAError as link_error:
                 logger.warning(
                     "Failed to create issue link (%s) from %s to %s: %s",
                     link_type,
@@ -633,9 +789,11 @@ class JiraClient:
             This method does not raise exceptions. Assignment failures are logged
             as warnings since assignment is typically an optional operation.
         """
+        from jira.exceptions import JIRAError
+
         try:
             self.jira.assign_issue(issue_key, account_id)
-        except exceptions.JIRAError as e:
+        except JIRAError as e:
             logger.warning(
                 "Failed to assign issue %s to user %s: %s",
                 issue_key,
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from functools import cache, partial
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
 from django.conf import settings
+from django.core.cache import cache as django_cache
 from django.template.loader import render_to_string
 
 from firefighter.jira_app.client import (
@@ -17,11 +21,81 @@ from firefighter.jira_app.client import (
 from firefighter.jira_app.models import JiraPostMortem
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from firefighter.incidents.models.incident import Incident
     from firefighter.incidents.models.user import User
+    from firefighter.jira_app.models import JiraUser
 
 logger = logging.getLogger(__name__)
 
+POSTMORTEM_TIMELINE_CACHE_KEY = "jira_app:postmortem_timeline:{incident_id}"
+POSTMORTEM_TIMELINE_VERSION_KEY = "jira_app:postmortem_timeline_version:{incident_id}"
+POSTMORTEM_TIMELINE_MAX_AGE = timedelta(days=7)
+STATIC_SECTIONS = ("impact", "mitigation_actions", "root_causes")
+"""Templates of the post-mortem that don't use the incident: they are rendered once per process."""
+
+
+@cache
+def render_static_section(name: str) -> str:
+    """Renders a section of [STATIC_SECTIONS][firefighter.jira_app.service_postmortem.STATIC_SECTIONS], once per process."""
+    return render_to_string(f"jira/postmortem/{name}.txt", {"components": []})
+
+
+def render_postmortem_timeline(incident: Incident) -> str:
+    return render_to_string("jira/postmortem/timeline.txt", {"incident": incident})
+
+
+def invalidate_postmortem_timeline(incident_id: int) -> None:
+    """Changes the version of the timeline of an incident, so the pre-rendered timelines are not used anymore."""
+    django_cache.set(
+        POSTMORTEM_TIMELINE_VERSION_KEY.format(incident_id=incident_id),
+        uuid4().hex,
+        timeout=int(POSTMORTEM_TIMELINE_MAX_AGE.total_seconds()),
+    )
+
+
+def prerender_postmortem_timeline(incident_id: int) -> str:
+    """Loads an incident with its updates, renders its timeline and caches it, for the creation of its post-mortem.
+
+    The timeline is cached with the current version: it is used only if no update was saved since
+    (see [invalidate_postmortem_timeline][firefighter.jira_app.service_postmortem.invalidate_postmortem_timeline]).
+    """
+    from firefighter.incidents.models.incident import Incident
+
+    timeout = int(POSTMORTEM_TIMELINE_MAX_AGE.total_seconds())
+    version_key = POSTMORTEM_TIMELINE_VERSION_KEY.format(incident_id=incident_id)
+    # Read the version before loading the updates, so an update committed in between makes this timeline stale
+    django_cache.add(version_key, uuid4().hex, timeout=timeout)
+    version = django_cache.get(version_key)
+    incident = (
+        Incident.objects.select_related("priority")
+        .prefetch_related("incidentupdate_set")
+        .get(pk=incident_id)
+    )
+    timeline = render_postmortem_timeline(incident)
+    django_cache.set(
+        POSTMORTEM_TIMELINE_CACHE_KEY.format(incident_id=incident_id),
+        {"version": version, "priority_id": incident.priority_id, "timeline": timeline},
+        timeout=timeout,
+    )
+    return timeline
+
+
+def get_postmortem_timeline(incident: Incident) -> str:
+    """The pre-rendered timeline of an incident if it is up to date, or renders it."""
+    version_key = POSTMORTEM_TIMELINE_VERSION_KEY.format(incident_id=incident.id)
+    timeline_key = POSTMORTEM_TIMELINE_CACHE_KEY.format(incident_id=incident.id)
+    cached = django_cache.get_many([version_key, timeline_key])
+    entry: dict[str, Any] | None = cached.get(timeline_key)
+    if (
+        entry is not None
+        and cached.get(version_key) == entry["version"]
+        and entry["priority_id"] == incident.priority_id
+    ):
+        return str(entry["timeline"])
+    return render_postmortem_timeline(incident)
+
 
 class JiraPostMortemService:
     """Service for creating and managing Jira post-mortems."""
@@ -70,14 +144,12 @@ class JiraPostMortemService:
 
         logger.info(f"Creating Jira post-mortem for incident #{incident.id}")
 
-        # Prefetch incident updates and jira_ticket for timeline and parent link
+        # The timeline is usually pre-rendered, so the updates are only fetched when it's not
         from firefighter.incidents.models.incident import Incident
 
-        incident = (
-            Incident.objects.select_related("priority", "environment", "jira_ticket")
-            .prefetch_related("incidentupdate_set")
-            .get(pk=incident.pk)
-        )
+        incident = Incident.objects.select_related(
+            "priority", "environment", "incident_category", "jira_ticket"
+        ).get(pk=incident.pk)
 
         # Generate content from templates
         fields = self._generate_issue_fields(incident)
@@ -87,42 +159,34 @@ class JiraPostMortemService:
         if hasattr(incident, "jira_ticket") and incident.jira_ticket:
             parent_issue_key = incident.jira_ticket.key
 
-        # Create Jira issue with optional parent link
-        jira_issue = self.client.create_postmortem_issue(
-            project_key=self.project_key,
-            issue_type=self.issue_type,
-            fields=fields,
-            parent_issue_key=parent_issue_key,
-        )
-
-        # Assign to incident commander if available
+        # Look for the commander's Jira user before creating the issue, so the
+        # steps after the creation only call Jira
         commander = (
             incident.roles_set.select_related("user__jira_user", "role_type")
             .filter(role_type__slug="commander")
             .first()
         )
+        commander_jira_user: JiraUser | None = None
         if commander:
-            jira_user = getattr(commander.user, "jira_user", None)
-            if jira_user is None:
+            commander_jira_user = getattr(commander.user, "jira_user", None)
+            if commander_jira_user is None:
                 try:
-                    jira_user = self.client.get_jira_user_from_user(commander.user)
+                    commander_jira_user = self.client.get_jira_user_from_user(
+                        commander.user
+                    )
                 except (JiraUserNotFoundError, JiraUserDatabaseError) as exc:
                     logger.warning(
                         "Unable to fetch Jira user for commander %s: %s",
                         commander.user_id,
                         exc,
                     )
-            if jira_user is not None:
-                assigned = self.client.assign_issue(
-                    issue_key=jira_issue["key"],
-                    account_id=jira_user.id,
-                )
-                if assigned:
-                    logger.info(
-                        "Assigned post-mortem %s to commander %s",
-                        jira_issue["key"],
-                        commander.user.username,
-                    )
+
+        # Create Jira issue. It is linked to its parent afterwards, with the assignment
+        jira_issue = self.client.create_postmortem_issue(
+            project_key=self.project_key,
+            issue_type=self.issue_type,
+            fields=fields,
+        )
 
         # Create JiraPostMortem record
         jira_postmortem = JiraPostMortem.objects.create(
@@ -132,6 +196,27 @@ class JiraPostMortemService:
             created_by=created_by,
         )
 
+        # Link to the parent and assign to the incident commander, concurrently
+        follow_ups: list[Callable[[], Any]] = []
+        if parent_issue_key:
+            follow_ups.append(
+                partial(
+                    self.client.link_postmortem_issue,
+                    parent_issue_key=parent_issue_key,
+                    postmortem_issue_key=jira_issue["key"],
+                )
+            )
+        if commander and commander_jira_user is not None:
+            follow_ups.append(
+                partial(
+                    self._assign_postmortem,
+                    jira_issue["key"],
+                    commander_jira_user.id,
+                    commander.user.username,
+                )
+            )
+        self._run_follow_ups(follow_ups)
+
         logger.info(
             f"Created Jira post-mortem {jira_postmortem.jira_issue_key} "
             f"for incident #{incident.id}"
@@ -139,6 +224,26 @@ class JiraPostMortemService:
 
         return jira_postmortem
 
+    def _assign_postmortem(
+        self, issue_key: str, account_id: str, username: str
+    ) -> None:
+        if self.client.assign_issue(issue_key=issue_key, account_id=account_id):
+            logger.info("Assigned post-mortem %s to commander %s", issue_key, username)
+
+    @staticmethod
+    def _run_follow_ups(follow_ups: list[Callable[[], Any]]) -> None:
+        """Runs the Jira calls following the creation of a post-mortem, concurrently.
+
+        They must not use the database: they run in other threads.
+        """
+        if len(follow_ups) <= 1:
+            for follow_up in follow_ups:
+                follow_up()
+            return
+        with ThreadPoolExecutor(max_workers=len(follow_ups)) as executor:
+            for future in [executor.submit(follow_up) for follow_up in follow_ups]:
+                future.result()
+
     def is_postmortem_ready(self, jira_postmortem: JiraPostMortem) -> tuple[bool, str]:
         """Check if the Jira post-mortem issue is in the Ready status.
 
@@ -181,26 +286,14 @@ class JiraPostMortemService:
             context,
         )
 
-        timeline = render_to_string(
-            "jira/postmortem/timeline.txt",
-            context,
-        )
+        timeline = get_postmortem_timeline(incident)
 
-        impact = render_to_string(
-            "jira/postmortem/impact.txt",
-            context,
-        )
+        impact = render_static_section("impact")
 
-        mitigation_actions = render_to_string(
-            "jira/postmortem/mitigation_actions.txt",
-            context,
-        )
+        mitigation_actions = render_static_section("mitigation_actions")
 
         # Optional: root causes (editable placeholder for manual completion)
-        root_causes = render_to_string(
-            "jira/postmortem/root_causes.txt",
-            context,
-        )
+        root_causes = render_static_section("root_causes")
 
         # Build field mapping
         fields: dict[str, str | dict[str, str] | list[dict[str, str]]] = {
@@ -6,5 +6,14 @@ from firefighter.jira_app.signals.incident_key_events_updated import (
 from firefighter.jira_app.signals.postmortem_created import (
     postmortem_created_handler,
 )
+from firefighter.jira_app.signals.postmortem_timeline import (
+    incident_update_changed,
+    prerender_timeline_on_update,
+)
 
-__all__ = ["postmortem_created_handler", "sync_key_events_to_jira_postmortem"]
+__all__ = [
+    "incident_update_changed",
+    "postmortem_created_handler",
+    "prerender_timeline_on_update",
+    "sync_key_events_to_jira_postmortem",
+]
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from django.conf import settings
+from django.db import transaction
 from django.dispatch import receiver
-from django.template.loader import render_to_string
 
 from firefighter.incidents.models.incident import Incident as IncidentModel
 from firefighter.incidents.signals import incident_key_events_updated
 from firefighter.jira_app.client import JiraClient
-from firefighter.jira_app.service_postmortem import JiraPostMortemService
+from firefighter.jira_app.signals.postmortem_timeline import (
+    prerender_timeline_if_needed,
+)
 
 if TYPE_CHECKING:
     from firefighter.incidents.models.incident import Incident
@@ -42,6 +45,8 @@ def sync_key_events_to_jira_postmortem(
     # Check if incident has a Jira post-mortem
     if not hasattr(incident, "jira_postmortem_for") or not incident.jira_postmortem_for:
         logger.debug(f"Incident #{incident.id} has no Jira post-mortem, skipping timeline sync")
+        # Prepare the timeline of the post-mortem to come instead
+        transaction.on_commit(partial(prerender_timeline_if_needed, incident.id))
         return
 
     jira_postmortem = incident.jira_postmortem_for
@@ -50,6 +55,11 @@ def sync_key_events_to_jira_postmortem(
         f"for incident #{incident.id}"
     )
 
+    from firefighter.jira_app.service_postmortem import (
+        JiraPostMortemService,
+        render_postmortem_timeline,
+    )
+
     try:
         # Prefetch incident updates for timeline generation
         incident_refreshed = (
@@ -59,10 +69,7 @@ def sync_key_events_to_jira_postmortem(
         )
 
         # Generate updated timeline from template
-        timeline_content = render_to_string(
-            "jira/postmortem/timeline.txt",
-            {"incident": incident_refreshed},
-        )
+        timeline_content = render_postmortem_timeline(incident_refreshed)
 
         # Get the field ID for timeline from service
         service = JiraPostMortemService()
@@ -6,10 +6,10 @@ from typing import TYPE_CHECKING, Any, Never
 
 from django.apps import apps
 from django.conf import settings
-from django.dispatch.dispatcher import receiver
 from django.utils import timezone
 
 from firefighter.incidents.enums import IncidentStatus
+from firefighter.incidents.signal_bus import lifecycle_receiver
 from firefighter.incidents.signals import incident_updated
 
 if TYPE_CHECKING:
@@ -122,7 +122,7 @@ def _publish_postmortem_announcement(incident: Incident) -> None:
         )
 
 
-@receiver(signal=incident_updated)
+@lifecycle_receiver(incident_updated, mode="async")
 def postmortem_created_handler(
     sender: Any,
     incident: Incident,
@@ -0,0 +1,64 @@
+"""Pre-rendering of the timeline of the Jira post-mortems, as the incidents are updated.
+
+The timeline is rendered when an update (status, priority, key event...) is recorded on an incident that needs a post-mortem,
+so creating the post-mortem doesn't wait for it. Each saved update changes the version of the timeline first:
+a timeline rendered before the update is committed is not used.
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from firefighter.incidents.models.incident import Incident as IncidentModel
+from firefighter.incidents.models.incident_update import IncidentUpdate
+from firefighter.incidents.signal_bus import lifecycle_receiver
+from firefighter.incidents.signals import incident_updated
+
+if TYPE_CHECKING:
+    from firefighter.incidents.models.incident import Incident
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_delete, sender=IncidentUpdate)
+@receiver(post_save, sender=IncidentUpdate)
+def incident_update_changed(
+    sender: Any, instance: IncidentUpdate, **kwargs: Any
+) -> None:
+    if kwargs.get("raw"):
+        return
+    from firefighter.jira_app.service_postmortem import invalidate_postmortem_timeline
+
+    # Again after the commit, for the timelines rendered before it
+    invalidate_postmortem_timeline(instance.incident_id)
+    transaction.on_commit(partial(invalidate_postmortem_timeline, instance.incident_id))
+
+
+def prerender_timeline_if_needed(incident_id: int) -> None:
+    """Pre-renders the timeline of an incident that needs a post-mortem and doesn't have one yet."""
+    if not getattr(settings, "ENABLE_JIRA_POSTMORTEM", False):
+        return
+    incident = IncidentModel.objects.select_related("priority", "environment").get(
+        pk=incident_id
+    )
+    if not incident.needs_postmortem or hasattr(incident, "jira_postmortem_for"):
+        return
+    from firefighter.jira_app.service_postmortem import prerender_postmortem_timeline
+
+    # Loads the updates itself, after reading the version of the timeline
+    prerender_postmortem_timeline(incident.id)
+    logger.debug(f"Pre-rendered the post-mortem timeline of incident #{incident.id}")
+
+
+@lifecycle_receiver(incident_updated, mode="async")
+def prerender_timeline_on_update(
+    sender: Any, incident: Incident, **kwargs: Any
+) -> None:
+    prerender_timeline_if_needed(incident.id)
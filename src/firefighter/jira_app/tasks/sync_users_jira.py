@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 from celery import shared_task
 
 from firefighter.incidents.models.user import User
-from firefighter.jira_app.client import JiraUserNotFoundError, client
+from firefighter.jira_app.account_cache import invalidate_accounts
+from firefighter.jira_app.client import (
+    JiraUserNotFoundError,
+    clear_jira_users_not_found,
+    client,
+    is_jira_user_not_found,
+)
 from firefighter.jira_app.models import JiraUser
 
+if TYPE_CHECKING:
+    from uuid import UUID
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,17 +41,103 @@ def add_jira_slack_relationship(user: User) -> JiraUser | None:
     return jira_user
 
 
+def _index_jira_directory() -> tuple[dict[str, str], dict[str, str]]:
+    """Indexes the active Jira accounts by email address, and by email prefix (the first account wins, as with the user search)."""
+    by_email: dict[str, str] = {}
+    by_prefix: dict[str, str] = {}
+    for account in client.iter_directory_users():
+        email: str | None = account.get("emailAddress")
+        # Skip the apps and customers, and the accounts with a hidden email address
+        if (
+            account.get("accountType") != "atlassian"
+            or not account.get("active", True)
+            or not email
+        ):
+            continue
+        email = email.lower()
+        by_email.setdefault(email, account["accountId"])
+        by_prefix.setdefault(email.split("@")[0], account["accountId"])
+    return by_email, by_prefix
+
+
+def sync_jira_users_from_directory(*, only_missing: bool = False) -> int:
+    """Maps the active users to their Jira account, from a snapshot of the Jira directory.
+
+    The directory is paged through once and indexed in memory, then all users are matched at once,
+    by email address or email prefix, and the missing [JiraUser][firefighter.jira_app.models.JiraUser] are created in bulk.
+    The directory hides the email address of some accounts: the users it doesn't match are then searched one by one,
+    and only the users this search doesn't find either are remembered in the cache, so they are not searched again.
+
+    Existing mappings are not changed: a user whose account differs in the directory is logged.
+
+    Args:
+        only_missing (bool, optional): Only match the users without a `JiraUser`. Defaults to False.
+
+    Returns:
+        int: Number of `JiraUser` created.
+    """
+    by_email, by_prefix = _index_jira_directory()
+    mapped_accounts: dict[str, UUID] = dict(
+        JiraUser.objects.values_list("id", "user_id")
+    )
+    users = User.objects.exclude(is_active=False).exclude(username="")
+    if only_missing:
+        users = users.filter(jira_user__isnull=True)
+
+    to_create: list[JiraUser] = []
+    not_found: list[User] = []
+    for user in users.select_related("jira_user"):
+        email = user.email.lower()
+        account_id = by_email.get(email) or by_prefix.get(email.split("@")[0])
+        jira_user = getattr(user, "jira_user", None)
+        if account_id is None:
+            if jira_user is None:
+                not_found.append(user)
+            continue
+        if jira_user is not None:
+            if jira_user.id != account_id:
+                logger.warning(
+                    "User %s is mapped to Jira account %s, but matches %s in the directory.",
+                    user.id,
+                    jira_user.id,
+                    account_id,
+                )
+            continue
+        if account_id in mapped_accounts:
+            logger.warning(
+                "Jira account %s of user %s is already mapped to user %s.",
+                account_id,
+                user.id,
+                mapped_accounts[account_id],
+            )
+            continue
+        mapped_accounts[account_id] = user.id
+        to_create.append(JiraUser(id=account_id, user=user))
+
+    JiraUser.objects.bulk_create(to_create, batch_size=500, ignore_conflicts=True)
+    # No post_save: the accounts may be cached as not found
+    invalidate_accounts(*(jira_user.id for jira_user in to_create))
+    clear_jira_users_not_found(jira_user.user_id for jira_user in to_create)
+    # Users not found by their last search are in the cache: they are not searched again
+    searched = [
+        user for user in not_found if user.email and not is_jira_user_not_found(user.id)
+    ]
+    found = sum(add_jira_slack_relationship(user) is not None for user in searched)
+    logger.info(
+        "Synced Jira users from the directory (%s accounts): %s created, %s found by search, %s not found.",
+        len(by_email),
+        len(to_create),
+        found,
+        len(not_found) - found,
+    )
+    return len(to_create) + found
+
+
 @shared_task(name="raid.jira_slack_full")
 def add_jira_slack_to_all_full() -> None:
-    for user in User.objects.exclude(is_active=False).exclude(username=""):
-        add_jira_slack_relationship(user)
+    sync_jira_users_from_directory()
 
 
 @shared_task(name="raid.jira_slack_only_missing")
 def add_jira_slack_to_all_only_missing() -> None:
-    for user in (
-        User.objects.exclude(is_active=False)
-        .exclude(username="")
-        .filter(jira_user__isnull=True)
-    ):
-        add_jira_slack_relationship(user)
+    sync_jira_users_from_directory(only_missing=True)
@@ -9,7 +9,13 @@ from django.conf import settings
 from pythonjsonlogger.core import RESERVED_ATTRS
 from pythonjsonlogger.json import JsonEncoder, JsonFormatter
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment,unused-ignore]
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from logging import LogRecord
 
 GUNICORN_KEY_RE = re.compile(r"{([^}]+)}")
@@ -146,3 +152,129 @@ class CustomJsonFormatter(JsonFormatter):
                 "wsgi.input",
             ],
         )
+
+
+HEADER_ATTRIBUTES = (
+    "accept",
+    "accept-encoding",
+    "accept-language",
+    "access-control-allow-origin",
+    "cache-control",
+    "connection",
+    "content_length",
+    "content-encoding",
+    "content-length",
+    "content-type",
+    "cookie",
+    "etag",
+    "pragma",
+)
+HEADER_PREFIXES = ("x-", "sec-", "mm-")
+DROPPED_ATTRIBUTES = frozenset(
+    (
+        "name",
+        "funcName",
+        "gunicorn.socket",
+        "wsgi.file_wrapper",
+        "wsgi.input_terminated",
+        "wsgi.multiprocess",
+        "wsgi.multithread",
+        "wsgi.run_once",
+        "wsgi.url_scheme",
+        "wsgi.version",
+        "wsgi.errors",
+        "wsgi.input",
+    )
+)
+
+
+def orjson_default(o: Any) -> Any:
+    if isinstance(o, socket):
+        return {"socket": {"peer": o.getpeername()}}
+    from pythonjsonlogger.orjson import orjson_default as base_orjson_default
+
+    return base_orjson_default(o)
+
+
+class FastJsonFormatter(CustomJsonFormatter):
+    """Drop-in replacement for [CustomJsonFormatter][firefighter.logging.custom_json_formatter.CustomJsonFormatter], producing the same fields.
+
+    Renames and drops are looked up in tables computed once, and the record is transformed in a single pass.
+    If [orjson](https://github.com/ijl/orjson) is installed, it is used to serialize the record.
+    """
+
+    def __init__(self, *args: Any, use_orjson: bool = True, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.use_orjson = use_orjson and orjson is not None
+        self.renames: dict[str, str] = {
+            "pathname": "logger.path_name",
+            "lineno": "logger.lineno",
+            "levelname": "status",
+            self.FF_USER_ID_HEADER: "usr.id",
+            "raw_uri": "http.uri",
+            "request_method": "http.method",
+            "referer": "http.referer",
+            "user_agent": "http.useragent",
+            "server_protocol": "http.version",
+        }
+        self.renames.update({k: f"http.headers.{k}" for k in HEADER_ATTRIBUTES})
+
+    def add_fields(
+        self,
+        log_record: dict[str, Any],
+        record: LogRecord,
+        message_dict: dict[str, Any],
+    ) -> None:
+        fields: dict[str, Any] = {}
+        JsonFormatter.add_fields(self, fields, record, message_dict)
+        self._transform(log_record, fields.items())
+
+        log_record["logger.name"] = record.name
+        log_record["logger.thread_name"] = record.threadName
+        log_record["logger.method_name"] = record.funcName
+        log_record["duration"] = record.msecs * 1000000
+
+        # Expansion of gunicorn specific log attributes, which must be renamed as well
+        if "gunicorn" in record.name:
+            if hasattr(record.args, "items"):
+                self._transform(
+                    log_record,
+                    (
+                        (m[1], v)
+                        for k, v in record.args.items()  # type: ignore[union-attr]
+                        if "{" in k
+                        and not k.startswith("{http_")
+                        and (m := GUNICORN_KEY_RE.search(k))
+                    ),
+                )
+            else:
+                log_record["args.type"] = str(type(record.args))
+                log_record["args"] = str(record.args)
+
+    def _transform(
+        self, log_record: dict[str, Any], items: Iterable[tuple[str, Any]]
+    ) -> None:
+        renames = self.renames
+        for key, value in items:
+            if key in DROPPED_ATTRIBUTES:
+                continue
+            if key == "exc_info":
+                stack, _, message = value.rpartition("\n")
+                log_record["error.stack"] = stack
+                log_record["error.message"] = message
+                if message:
+                    log_record["error.kind"] = message.split(":", 1)[0]
+                continue
+            if key == "cookie":
+                value = "STRIPPED_AT_EMISSION"  # noqa: PLW2901
+            new_key = renames.get(key)
+            if new_key is None and key.startswith(HEADER_PREFIXES):
+                new_key = f"http.headers.{key}"
+            log_record[new_key or key] = value
+
+    def jsonify_log_record(self, log_data: dict[str, Any]) -> str:
+        if self.use_orjson:
+            return orjson.dumps(
+                log_data, default=orjson_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        return super().jsonify_log_record(log_data)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import copy
+import os
+from logging import Formatter
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logging import LogRecord
+
+_exc_formatter = Formatter()
+
+
+class DeferredFormattingQueueHandler(QueueHandler):
+    """Queue handler that leaves the formatting of records to the handlers of its listener, in a background thread.
+
+    Unlike the standard [QueueHandler][logging.handlers.QueueHandler], records are not formatted before being enqueued,
+    so the JSON formatters still have access to the gunicorn `args` mapping. Only the values that can't safely cross threads are rendered:
+    the message (unless `args` is a mapping) and the exception traceback.
+
+    The listener is started in the process which emits the first record, so it also works in forked gunicorn workers
+    (again in each worker, if the master process emitted records before forking).
+    It is started once per process, under the handler lock, even if threads emit their first records concurrently.
+    It is stopped when the handler is closed, i.e. on [logging.shutdown][logging.shutdown].
+
+    Configure it with `dictConfig`, listing the handlers doing the I/O in `handlers`.
+    """
+
+    listener: QueueListener | None
+
+    _listener_pid: int | None = None
+
+    def emit(self, record: LogRecord) -> None:
+        pid = os.getpid()
+        if self.listener is not None and self._listener_pid != pid:
+            # Reentrant lock, already held when called from `handle`
+            with self.lock:  # type: ignore[union-attr]
+                if self._listener_pid != pid:
+                    # The thread of a listener started before a fork only runs in the parent,
+                    # and Python 3.14+ refuses to start a listener which has one
+                    self.listener._thread = None  # noqa: SLF001
+                    self.listener.start()
+                    self._listener_pid = pid
+        super().emit(record)
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        record = copy.copy(record)
+        if not hasattr(record.args, "items"):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def close(self) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            if self.listener is not None and self._listener_pid == os.getpid():
+                self.listener.stop()
+                self._listener_pid = None
+        super().close()
@@ -1,23 +1,32 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from django.conf import settings
-from pagerduty import RestApiV2Client
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
     from datetime import datetime
 
     from httpx import Response
+    from pagerduty import RestApiV2Client
 
 logger = logging.getLogger(__name__)
 
 
 class PagerdutyClient:
     api_key = settings.PAGERDUTY_API_KEY
-    session = RestApiV2Client(api_key, default_from=settings.PAGERDUTY_ACCOUNT_EMAIL)
+
+    @cached_property
+    def session(self) -> RestApiV2Client:
+        # The pagerduty library (and its HTTP client) is only imported when the API is called, not when the workers start
+        from pagerduty import RestApiV2Client
+
+        return RestApiV2Client(
+            self.api_key, default_from=settings.PAGERDUTY_ACCOUNT_EMAIL
+        )
 
     def get_schedule_on_call_users(
         self, schedule: str, since: datetime, until: datetime
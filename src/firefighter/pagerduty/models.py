@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import logging
 import uuid
+from datetime import datetime, timedelta
 from itertools import groupby
-from typing import Any, ClassVar
+from typing import Any, ClassVar, TypedDict
 
+from django.core.cache import cache
 from django.db import models
 from django.db.utils import IntegrityError
 from django.utils import timezone
@@ -15,6 +17,23 @@ from firefighter.incidents.models.user import User
 
 logger = logging.getLogger(__name__)
 
+ONCALL_SNAPSHOT_CACHE_KEY = "pagerduty:current_oncalls:v2"
+ONCALL_SNAPSHOT_MAX_AGE = timedelta(hours=1)
+"""Upper bound on the snapshot lifetime, in case no shift boundary is known."""
+
+
+class OncallSnapshot(TypedDict):
+    """Compact, cacheable representation of the current on-calls."""
+
+    valid_until: float
+    """POSIX timestamp of the next shift boundary."""
+    groups: list[list[str]]
+    """On-call IDs of each group of the current on-calls, ordered by escalation level.
+
+    One group per escalation policy and service, in the order of [get_current_oncalls_per_escalation_policy][firefighter.pagerduty.models.PagerDutyOncallManager.get_current_oncalls_per_escalation_policy].
+    """
+
+
 STATUS_HELP_TEXT = """The current state of the Service. Valid statuses are:
 <ul>
 <li><code>active</code>: The service is enabled and has no open incidents. This is the only status a service can be created with.</li>
@@ -353,15 +372,109 @@ class PagerDutyOncallManager(models.Manager["PagerDutyOncall"]):
     def get_current_oncalls_per_escalation_policy(
         self,
     ) -> list[tuple[PagerDutyEscalationPolicy, list[PagerDutyOncall]]]:
-        """Returns the list of on call Users. These users have their PagerDutyUser associated."""
+        """Returns the list of on call Users. These users have their PagerDutyUser associated.
+
+        Reads the current on-call snapshot (see [get_current_oncalls_snapshot][firefighter.pagerduty.models.PagerDutyOncallManager.get_current_oncalls_snapshot])
+        and resolves it with a single primary key query.
+        """
+        snapshot = self._get_cached_snapshot()
+        if snapshot is not None:
+            oncalls_grouped = self._resolve_snapshot(snapshot)
+            if oncalls_grouped is not None:
+                return oncalls_grouped
+            # An on-call has been deleted since the snapshot was built
+            logger.debug("Stale on-call snapshot, rebuilding it.")
+        return self._refresh_snapshot()[1]
+
+    def _resolve_snapshot(
+        self, snapshot: OncallSnapshot
+    ) -> list[tuple[PagerDutyEscalationPolicy, list[PagerDutyOncall]]] | None:
+        oncall_ids = {oncall_id for group in snapshot["groups"] for oncall_id in group}
+        oncalls = {
+            str(oncall.id): oncall
+            for oncall in self._with_related().filter(id__in=oncall_ids)
+        }
+        if len(oncalls) != len(oncall_ids):
+            return None
+        oncalls_grouped: list[
+            tuple[PagerDutyEscalationPolicy, list[PagerDutyOncall]]
+        ] = []
+        for group in snapshot["groups"]:
+            oncalls_list = [oncalls[oncall_id] for oncall_id in group]
+            oncalls_grouped.append((oncalls_list[0].escalation_policy, oncalls_list))
+        return oncalls_grouped
+
+    def get_current_oncalls_snapshot(self) -> OncallSnapshot:
+        """Returns the current on-call snapshot, from the cache if it is still valid.
+
+        The snapshot holds the ordered IDs of the current on-calls, per group.
+        It expires at the next shift boundary (the next start or end of an on-call), and is rebuilt on the first lookup after that.
+        """
+        snapshot = self._get_cached_snapshot()
+        if snapshot is None:
+            snapshot = self.refresh_current_oncalls_snapshot()
+        return snapshot
+
+    @staticmethod
+    def _get_cached_snapshot() -> OncallSnapshot | None:
+        snapshot: OncallSnapshot | None = cache.get(ONCALL_SNAPSHOT_CACHE_KEY)
+        if snapshot is None or snapshot["valid_until"] <= timezone.now().timestamp():
+            return None
+        return snapshot
+
+    def refresh_current_oncalls_snapshot(self) -> OncallSnapshot:
+        """Computes the current on-calls and stores them in the cache, until the next shift boundary."""
+        return self._refresh_snapshot()[0]
+
+    def _refresh_snapshot(
+        self,
+    ) -> tuple[
+        OncallSnapshot, list[tuple[PagerDutyEscalationPolicy, list[PagerDutyOncall]]]
+    ]:
+        now = timezone.now()
+        oncalls_grouped = self._compute_current_oncalls_per_escalation_policy()
+        next_boundary = self._get_next_shift_boundary(now)
+        max_valid_until = now + ONCALL_SNAPSHOT_MAX_AGE
+        valid_until = (
+            min(next_boundary, max_valid_until) if next_boundary else max_valid_until
+        )
+        snapshot: OncallSnapshot = {
+            "valid_until": valid_until.timestamp(),
+            "groups": [
+                [str(oncall.id) for oncall in oncalls]
+                for _, oncalls in oncalls_grouped
+            ],
+        }
+        timeout = max(1, int((valid_until - now).total_seconds()))
+        cache.set(ONCALL_SNAPSHOT_CACHE_KEY, snapshot, timeout=timeout)
+        logger.debug(
+            "Refreshed on-call snapshot for %s escalation policies, valid until %s.",
+            len(snapshot["groups"]),
+            valid_until,
+        )
+        return snapshot, oncalls_grouped
+
+    def _get_next_shift_boundary(self, now: datetime) -> datetime | None:
+        boundaries = self.aggregate(
+            next_start=models.Min("start", filter=models.Q(start__gt=now)),
+            next_end=models.Min("end", filter=models.Q(end__gte=now)),
+        )
+        candidates = [date for date in boundaries.values() if date is not None]
+        return min(candidates) if candidates else None
+
+    def _with_related(self) -> models.QuerySet[PagerDutyOncall]:
+        return self.select_related(
+            "pagerduty_user",
+            "schedule",
+            "escalation_policy",
+            "pagerduty_user__user__slack_user",
+        )
+
+    def _compute_current_oncalls_per_escalation_policy(
+        self,
+    ) -> list[tuple[PagerDutyEscalationPolicy, list[PagerDutyOncall]]]:
         oncalls = (
-            self.select_related(
-                "pagerduty_user",
-                "schedule",
-                "escalation_policy",
-                "pagerduty_user",
-                "pagerduty_user__user__slack_user",
-            )
+            self._with_related()
             .filter(
                 models.Q(start__lte=timezone.now(), end__gte=timezone.now())
                 | models.Q(end__isnull=True)
@@ -23,9 +23,11 @@ logger = logging.getLogger(__name__)
 def fetch_oncalls() -> None:
     """Celery task to fetch PagerDuty oncalls and save them in the database.
     Will try to update services, users, schedules and escalation policies if needed.
+    The current on-call snapshot is rebuilt afterwards.
     """
     services = pagerduty_service.get_all_oncalls()
-    return create_oncalls(services)
+    create_oncalls(services)
+    PagerDutyOncall.objects.refresh_current_oncalls_snapshot()
 
 
 @transaction.atomic
@@ -5,8 +5,6 @@ from typing import TYPE_CHECKING
 
 from celery import shared_task
 from django.conf import settings
-from pagerduty import Error as PDClientError
-from pagerduty import HttpError as PDHTTPError
 
 from firefighter.incidents.models.incident import Incident
 from firefighter.pagerduty.models import PagerDutyIncident, PagerDutyService
@@ -46,6 +44,10 @@ Slack channel #{incident.slack_channel_name}: {incident.slack_channel_url}
 Incident Details:
 {details}
 """
+    # Imported here, as the client imports the pagerduty library lazily
+    from pagerduty import Error as PDClientError
+    from pagerduty import HttpError as PDHTTPError
+
     try:
         res = pagerduty_service.client.create_incident(
             title=title,
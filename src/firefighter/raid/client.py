@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING, Any, Final, cast
 
 from django.conf import settings
 from httpx import HTTPError
-from jira.exceptions import JIRAError
 
 from firefighter.firefighter.http_client import HttpClient
 from firefighter.firefighter.utils import get_in
@@ -142,6 +141,8 @@ class RaidJiraClient(JiraClient):
         Raises:
             JiraAttachmentError: if there is an error while adding any attachment
         """
+        from jira.exceptions import JIRAError
+
         http_client = HttpClient()
         for i, url in enumerate(urls):
             index = url.rfind(".")
@@ -5,15 +5,16 @@ from typing import TYPE_CHECKING, Any, Never
 
 from django.conf import settings
 from django.db import models
+from django.db.models import Prefetch, prefetch_related_objects
 from slack_sdk.errors import SlackApiError
 
 from firefighter.incidents.forms.select_impact import SelectImpactForm
 from firefighter.incidents.models.priority import Priority
+from firefighter.incidents.models.user import User
 from firefighter.jira_app.client import (
     JiraAPIError,
     JiraUserNotFoundError,
 )
-from firefighter.jira_app.models import JiraUser
 from firefighter.raid.client import client as jira_client
 from firefighter.raid.messages import (
     SlackMessageRaidComment,
@@ -28,7 +29,7 @@ if TYPE_CHECKING:
     from django.db.models import QuerySet
 
     from firefighter.incidents.models.impact import ImpactLevel
-    from firefighter.incidents.models.user import User
+    from firefighter.jira_app.models import JiraUser
     from firefighter.raid.types import JiraObject
     from firefighter.slack.messages.base import SlackMessageSurface
 
@@ -210,54 +211,66 @@ def send_message_to_watchers(
     if not watchers:
         return True
 
+    watcher_account_ids: list[str] = []
     for watcher in watchers:
-        try:
-            watcher_account_id = watcher.get("accountId")
-            if watcher_account_id is None:
-                logger.warning(f"Couldn't find Jira account ID for watcher {watcher}")
-                continue
-
-            if watcher.get("accountType") == "app":
-                logger.info(
-                    f"Skipping sending message to jira_user_id={watcher_account_id}: is an app"
-                )
-                continue
-
-            watcher_email = (watcher.get("emailAddress") or "").strip().lower()
-            if watcher_email and watcher_email in RAID_WATCHER_EMAIL_EXCLUSIONS:
-                logger.info(
-                    "Skipping sending message to jira_user_id=%s (email=%s): excluded by RAID_WATCHER_EMAIL_EXCLUSIONS",
-                    watcher_account_id,
-                    watcher_email,
-                )
-                continue
-            if not JiraUser.objects.filter(id=watcher_account_id).exists():
-                logger.debug(
-                    "Skipping watcher %s: no JiraUser mapping in database",
-                    watcher_account_id,
-                )
-                continue
-            watcher_jira_user = jira_client.get_jira_user_from_jira_id(
-                watcher_account_id
+        watcher_account_id = watcher.get("accountId")
+        if watcher_account_id is None:
+            logger.warning(f"Couldn't find Jira account ID for watcher {watcher}")
+            continue
+
+        if watcher.get("accountType") == "app":
+            logger.info(
+                f"Skipping sending message to jira_user_id={watcher_account_id}: is an app"
             )
-            watcher_slack_user = (
-                watcher_jira_user.user.slack_user
-                if hasattr(watcher_jira_user.user, "slack_user")
-                else None
+            continue
+
+        watcher_email = (watcher.get("emailAddress") or "").strip().lower()
+        if watcher_email and watcher_email in RAID_WATCHER_EMAIL_EXCLUSIONS:
+            logger.info(
+                "Skipping sending message to jira_user_id=%s (email=%s): excluded by RAID_WATCHER_EMAIL_EXCLUSIONS",
+                watcher_account_id,
+                watcher_email,
             )
-            if watcher_slack_user is None:
-                logger.debug(
-                    "Watcher %s has a JiraUser but no linked Slack user",
-                    watcher_account_id,
-                )
-                continue
+            continue
+        watcher_account_ids.append(watcher_account_id)
+    if not watcher_account_ids:
+        return True
+
+    # All the watchers at once: from the cache, or with one DB query
+    watcher_jira_users = jira_client.get_jira_users_from_jira_ids(
+        watcher_account_ids, fetch_missing=False
+    )
+    prefetch_related_objects(
+        list(watcher_jira_users.values()),
+        Prefetch("user", queryset=User.objects.select_related("slack_user")),
+    )
+    for watcher_account_id in watcher_account_ids:
+        watcher_jira_user = watcher_jira_users.get(watcher_account_id)
+        if watcher_jira_user is None:
+            logger.debug(
+                "Skipping watcher %s: no JiraUser mapping in database",
+                watcher_account_id,
+            )
+            continue
+        watcher_slack_user = (
+            watcher_jira_user.user.slack_user
+            if hasattr(watcher_jira_user.user, "slack_user")
+            else None
+        )
+        if watcher_slack_user is None:
+            logger.debug(
+                "Watcher %s has a JiraUser but no linked Slack user",
+                watcher_account_id,
+            )
+            continue
+        try:
             watcher_slack_user.send_private_message(
                 message,
                 unfurl_links=False,
             )
         except SlackApiError:
             logger.warning(
-                f"Couldn't send private message to reporter with jira_id={watcher.get('accountId', watcher)}"
+                f"Couldn't send private message to reporter with jira_id={watcher_account_id}"
             )
     return True
 
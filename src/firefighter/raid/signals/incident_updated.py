@@ -10,6 +10,7 @@ from django.dispatch.dispatcher import receiver
 
 from firefighter.incidents.enums import IncidentStatus
 from firefighter.incidents.models.incident import Incident
+from firefighter.incidents.signal_bus import lifecycle_receiver
 from firefighter.incidents.signals import incident_updated
 from firefighter.raid.client import RAID_JIRA_WORKFLOW_NAME, client
 from firefighter.raid.utils import normalize_cache_value
@@ -45,7 +46,7 @@ def _set_impact_to_jira_cache(
     cache.set(cache_key, value=True, timeout=timeout)
 
 
-@receiver(signal=incident_updated, sender="update_status")
+@lifecycle_receiver(incident_updated, sender="update_status", mode="async")
 def incident_updated_close_ticket_when_mitigated_or_postmortem(
     sender: Any,
     incident: Incident,
@@ -193,7 +194,7 @@ def incident_updated_close_ticket_when_mitigated_or_postmortem(
 
 
 # Listen to all incident_updated signals so both UI (update_status) and API/admin paths trigger
-@receiver(signal=incident_updated)
+@lifecycle_receiver(incident_updated, mode="async")
 def incident_updated_sync_priority_to_jira(
     sender: Any,
     incident: Incident,
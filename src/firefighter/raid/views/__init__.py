@@ -80,6 +80,7 @@ class CreateJiraBotView(
     authentication_classes = [BearerTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     renderer_classes = [JSONRenderer]
+    throttle_scope = "critical"
 
     def post(self, request: Request, *args: Never, **kwargs: Never) -> Response:
         """Allow to create a Jira ticket through Landbot.
@@ -101,6 +102,7 @@ class JiraUpdateAlertView(
     authentication_classes = [JiraHmacWebhookAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     renderer_classes = [JSONRenderer]
+    throttle_scope = "critical"
 
     def post(self, request: Request, *args: Never, **kwargs: Never) -> Response:
         """Allow to send a message in Slack when some fields ("Priority", "project", "description", "status") of a Jira ticket are updated.
@@ -124,6 +126,7 @@ class JiraCommentAlertView(
     authentication_classes = [JiraHmacWebhookAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     renderer_classes = [JSONRenderer]
+    throttle_scope = "critical"
 
     def post(self, request: Request, *args: Never, **kwargs: Never) -> Response:
         """Allow to send a message in Slack when a comment in a Jira ticket is created or modified.
@@ -18,6 +18,7 @@ class SlackConfig(AppConfig):
             incident_closed,
             incident_updated,
             postmortem_created,
+            responder_index,
             roles_reminders,
         )
         from firefighter.slack.tasks import send_message
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 from django.conf import settings
 from django.db import models
+from django.db.models import prefetch_related_objects
 from slack_sdk.errors import SlackApiError
 
 from firefighter.incidents.models.incident import Incident
@@ -146,7 +147,11 @@ class IncidentChannel(Conversation):
 
     @staticmethod
     def _get_active_slack_users(users_mapped: list[User]) -> list[User]:
-        """Filter out users that have no Slack user linked or are disabled."""
+        """Filter out users that have no Slack user linked or are disabled.
+
+        The Slack users are loaded with a single query. Users without one are looked up in Slack, one by one.
+        """
+        prefetch_related_objects(users_mapped, "slack_user")
         users_with_slack: list[User] = []
 
         for user in users_mapped:
@@ -0,0 +1,76 @@
+"""Record the database queries of the Slack listeners, and check them against their query budget.
+
+Bolt acknowledges the request and runs most listeners in a thread pool, so a global Bolt middleware can't see their queries.
+Instead, the recording is started and checked by the listener start and completion handlers, which run in the listener thread.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any
+
+from slack_bolt.listener.listener_completion_handler import (
+    DefaultListenerCompletionHandler,
+)
+from slack_bolt.listener.listener_start_handler import DefaultListenerStartHandler
+
+from firefighter.firefighter.query_budget import check_query_budget, record_queries
+
+if TYPE_CHECKING:
+    from slack_bolt.app.app import App
+    from slack_bolt.request.request import BoltRequest
+    from slack_bolt.response.response import BoltResponse
+
+    from firefighter.firefighter.query_budget import QueryStats
+
+
+def get_slack_route(body: dict[str, Any]) -> str:
+    """Name of the route of a Slack request: its command, action ID, view callback ID or event type."""
+    if command := body.get("command"):
+        return f"slack:{command}"
+    if actions := body.get("actions"):
+        return f"slack:{actions[0].get('action_id')}"
+    if callback_id := body.get("view", {}).get("callback_id") or body.get(
+        "callback_id"
+    ):
+        return f"slack:{callback_id}"
+    if event := body.get("event"):
+        return f"slack:{event.get('type')}"
+    return f"slack:{body.get('type')}"
+
+
+_listener_state = threading.local()
+
+
+class QueryBudgetListenerStartHandler(DefaultListenerStartHandler):
+    """Starts recording queries before a Bolt listener runs, in the listener thread."""
+
+    def handle(self, request: BoltRequest, response: BoltResponse | None) -> None:
+        super().handle(request, response)
+        stack = ExitStack()
+        _listener_state.stack = stack
+        _listener_state.stats = stack.enter_context(record_queries())
+
+
+class QueryBudgetListenerCompletionHandler(DefaultListenerCompletionHandler):
+    """Checks the query budget after a Bolt listener has run, in the listener thread."""
+
+    def handle(self, request: BoltRequest, response: BoltResponse | None) -> None:
+        super().handle(request, response)
+        stack: ExitStack | None = getattr(_listener_state, "stack", None)
+        if stack is None:
+            return
+        stack.close()
+        stats: QueryStats = _listener_state.stats
+        del _listener_state.stack, _listener_state.stats
+        check_query_budget(get_slack_route(request.body), stats)
+
+
+def instrument_query_budget(app: App) -> None:
+    """Record the queries of all listeners of the app, and check them against their query budget."""
+    runner = app.listener_runner
+    runner.listener_start_handler = QueryBudgetListenerStartHandler(logger=app.logger)
+    runner.listener_completion_handler = QueryBudgetListenerCompletionHandler(
+        logger=app.logger
+    )
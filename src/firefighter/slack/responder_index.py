@@ -0,0 +1,129 @@
+"""Cached index of the users to invite in an incident conversation, per incident category.
+
+An incident category is linked to Slack usergroups and conversations: their members are invited in the conversations of the incidents of this category.
+The members of the usergroups tagged `invited_for_all_public_p1` are also invited in all public P1 incidents.
+
+The index stores the IDs of these members in the cache, one entry per incident category (and one for P1), so getting the responders of an incident
+is a single cache read. The entries are invalidated when the members or the categories of a usergroup or conversation change
+(see [firefighter.slack.signals.responder_index][]), and rebuilt on the next lookup.
+
+The index does not store the users themselves: they are loaded with a single query, which also filters out the inactive users or users without a Slack ID.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db import transaction
+
+from firefighter.slack.models.conversation import Conversation
+from firefighter.slack.models.user_group import UserGroup
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+RESPONDER_INDEX_CACHE_KEY = "slack:responders:{entry}"
+RESPONDER_INDEX_MAX_AGE = timedelta(hours=1)
+"""The entries are invalidated on changes, this is only a safety net for changes made without signals (e.g. `QuerySet.update`)."""
+ALL_PUBLIC_P1_TAG = "invited_for_all_public_p1"
+"""Tag of the usergroups invited in all public P1 incidents."""
+ALL_PUBLIC_P1_ENTRY = "all_public_p1"
+
+
+def _cache_key(entry: str) -> str:
+    return RESPONDER_INDEX_CACHE_KEY.format(entry=entry)
+
+
+def get_responder_ids(
+    incident_category_id: UUID | str, *, all_public_p1: bool = False
+) -> set[str]:
+    """Returns the IDs of the users to invite for an incident category.
+
+    Args:
+        incident_category_id (UUID | str): ID of the incident category.
+        all_public_p1 (bool, optional): Also include the users invited in all public P1 incidents. Defaults to False.
+
+    Returns:
+        set[str]: IDs of the Users. They may be inactive or have no Slack user.
+    """
+    entries = [str(incident_category_id)]
+    if all_public_p1:
+        entries.append(ALL_PUBLIC_P1_ENTRY)
+    keys = {_cache_key(entry): entry for entry in entries}
+
+    cached: dict[str, list[str]] = cache.get_many(keys)
+    missing = [entry for key, entry in keys.items() if key not in cached]
+    responders = {keys[key]: user_ids for key, user_ids in cached.items()}
+    if missing:
+        responders.update(refresh_responder_index(missing))
+    return {user_id for user_ids in responders.values() for user_id in user_ids}
+
+
+def refresh_responder_index(entries: Iterable[str]) -> dict[str, list[str]]:
+    """Computes some entries of the index, and stores them in the cache.
+
+    Args:
+        entries (Iterable[str]): Incident category IDs, or `all_public_p1`.
+
+    Returns:
+        dict[str, list[str]]: User IDs, per entry.
+    """
+    entries = list(entries)
+    category_ids = [entry for entry in entries if entry != ALL_PUBLIC_P1_ENTRY]
+    responders: dict[str, set[str]] = defaultdict(set)
+
+    if category_ids:
+        for model in (UserGroup, Conversation):
+            model_name = model._meta.model_name  # noqa: SLF001
+            memberships = (
+                model.members.through.objects.filter(
+                    **{f"{model_name}__incident_categories__in": category_ids}
+                )
+                .values_list(f"{model_name}__incident_categories", "user_id")
+                .distinct()
+            )
+            for category_id, user_id in memberships:
+                responders[str(category_id)].add(str(user_id))
+    if ALL_PUBLIC_P1_ENTRY in entries:
+        responders[ALL_PUBLIC_P1_ENTRY] = {
+            str(user_id)
+            for user_id in UserGroup.members.through.objects.filter(
+                usergroup__tag=ALL_PUBLIC_P1_TAG
+            ).values_list("user_id", flat=True)
+        }
+
+    index = {entry: sorted(responders[entry]) for entry in entries}
+    cache.set_many(
+        {_cache_key(entry): user_ids for entry, user_ids in index.items()},
+        timeout=int(RESPONDER_INDEX_MAX_AGE.total_seconds()),
+    )
+    logger.debug("Refreshed responder index entries: %s", entries)
+    return index
+
+
+def invalidate_responder_index(
+    incident_category_ids: Iterable[UUID | str], *, all_public_p1: bool = False
+) -> None:
+    """Invalidates the entries of some incident categories, now and after the current transaction is committed.
+
+    The second invalidation prevents a concurrent lookup from caching the memberships of before the commit.
+
+    Args:
+        incident_category_ids (Iterable[UUID | str]): IDs of the incident categories.
+        all_public_p1 (bool, optional): Also invalidate the users invited in all public P1 incidents. Defaults to False.
+    """
+    keys = [_cache_key(str(category_id)) for category_id in incident_category_ids]
+    if all_public_p1:
+        keys.append(_cache_key(ALL_PUBLIC_P1_ENTRY))
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(partial(cache.delete_many, keys))
@@ -3,8 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from django.dispatch.dispatcher import receiver
-
+from firefighter.incidents.signal_bus import lifecycle_receiver
 from firefighter.incidents.signals import incident_closed
 
 if TYPE_CHECKING:
@@ -12,7 +11,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@receiver(signal=incident_closed)
+# Sync, like `incident_updated_update_status_handler`: the closing update must be posted before the channel is archived
+@lifecycle_receiver(incident_closed, mode="sync")
 # pylint: disable=unused-argument
 def incident_closed_slack(sender: Any, incident: Incident, **kwargs: Any) -> bool:
     if not hasattr(incident, "conversation"):
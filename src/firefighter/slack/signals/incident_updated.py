@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 from django.dispatch.dispatcher import receiver
 
 from firefighter.incidents.enums import IncidentStatus
+from firefighter.incidents.signal_bus import lifecycle_receiver
 from firefighter.incidents.signals import incident_key_events_updated, incident_updated
 from firefighter.slack.messages.slack_messages import (
     SlackMessageDeployWarning,
@@ -30,7 +31,8 @@ logger = logging.getLogger(__name__)
 # pylint: disable=unused-argument
 
 
-@receiver(signal=incident_updated, sender="update_status")
+# Sync, so the status update is posted before the channel is archived by `incident_closed_slack`
+@lifecycle_receiver(incident_updated, sender="update_status", mode="sync")
 def incident_updated_update_status_handler(
     sender: Any,
     incident: Incident,
@@ -62,7 +64,7 @@ def incident_updated_update_status_handler(
     )
 
 
-@receiver(signal=incident_updated, sender="update_status")
+@lifecycle_receiver(incident_updated, sender="update_status", mode="async")
 def incident_updated_check_dowmgrade_handler(
     sender: Any,
     incident: Incident,
@@ -118,7 +120,7 @@ def incident_updated_check_dowmgrade_handler(
     )
 
 
-@receiver(signal=incident_updated, sender="update_roles")
+@lifecycle_receiver(incident_updated, sender="update_roles", mode="async")
 def incident_updated_update_roles_handler(
     sender: Any,
     incident: Incident,
@@ -153,7 +155,7 @@ def incident_updated_update_roles_handler(
     incident.conversation.invite_users(list(users_to_invite))
 
 
-@receiver(signal=incident_updated)
+@lifecycle_receiver(incident_updated, mode="async")
 # pylint: disable=unused-argument
 def incident_updated_reinvite_handler(
     sender: Any,
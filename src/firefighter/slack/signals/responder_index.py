@@ -0,0 +1,118 @@
+"""Invalidation of the [responder index][firefighter.slack.responder_index] when the members or incident categories of usergroups and conversations change."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.dispatch.dispatcher import receiver
+
+from firefighter.incidents.models.incident_category import IncidentCategory
+from firefighter.slack.models.conversation import Conversation
+from firefighter.slack.models.user_group import UserGroup
+from firefighter.slack.responder_index import (
+    ALL_PUBLIC_P1_TAG,
+    invalidate_responder_index,
+)
+
+if TYPE_CHECKING:
+    from django.db import models
+
+logger = logging.getLogger(__name__)
+
+CHANGE_ACTIONS = {"post_add", "post_remove", "pre_clear"}
+
+
+def _get_changed_ids(
+    model: type[UserGroup | Conversation],
+    instance: models.Model,
+    pk_set: set[Any] | None,
+    *,
+    reverse: bool,
+) -> list[Any]:
+    """Returns the IDs of the usergroups or conversations of a `members` change, from either side of the relation."""
+    if not reverse:
+        return [instance.pk]
+    if pk_set is not None:
+        return list(pk_set)
+    # Clearing all usergroups or conversations of a user
+    return list(
+        model.members.through.objects.filter(user_id=instance.pk).values_list(
+            f"{model._meta.model_name}_id",  # noqa: SLF001
+            flat=True,
+        )
+    )
+
+
+def _invalidate(model: type[UserGroup | Conversation], ids: list[Any]) -> None:
+    related_name = "usergroups" if model is UserGroup else "conversations"
+    category_ids = set(
+        IncidentCategory.objects.filter(**{f"{related_name}__in": ids}).values_list(
+            "id", flat=True
+        )
+    )
+    all_public_p1 = (
+        model is UserGroup
+        and UserGroup.objects.filter(id__in=ids, tag=ALL_PUBLIC_P1_TAG).exists()
+    )
+    invalidate_responder_index(category_ids, all_public_p1=all_public_p1)
+
+
+@receiver(m2m_changed, sender=UserGroup.members.through)
+@receiver(m2m_changed, sender=Conversation.members.through)
+def members_changed(
+    sender: Any,
+    instance: models.Model,
+    action: str,
+    pk_set: set[Any] | None,
+    *,
+    reverse: bool,
+    **kwargs: Any,
+) -> None:
+    if action not in CHANGE_ACTIONS:
+        return
+    model = UserGroup if sender is UserGroup.members.through else Conversation
+    ids = _get_changed_ids(model, instance, pk_set, reverse=reverse)
+    if ids:
+        _invalidate(model, ids)
+
+
+@receiver(m2m_changed, sender=UserGroup.incident_categories.through)
+@receiver(m2m_changed, sender=Conversation.incident_categories.through)
+def incident_categories_changed(
+    sender: Any,
+    instance: models.Model,
+    action: str,
+    pk_set: set[Any] | None,
+    *,
+    reverse: bool,
+    **kwargs: Any,
+) -> None:
+    if action not in CHANGE_ACTIONS:
+        return
+    if reverse:
+        # The usergroups or conversations of an incident category changed
+        invalidate_responder_index([instance.pk])
+    elif pk_set is not None:
+        invalidate_responder_index(pk_set)
+    else:
+        invalidate_responder_index(
+            instance.incident_categories.values_list("id", flat=True)  # type: ignore[attr-defined]
+        )
+
+
+@receiver(post_save, sender=UserGroup)
+def usergroup_saved(sender: Any, instance: UserGroup, **kwargs: Any) -> None:
+    # The tag may have been added or removed
+    invalidate_responder_index([], all_public_p1=True)
+
+
+@receiver(pre_delete, sender=UserGroup)
+@receiver(pre_delete, sender=Conversation)
+def usergroup_or_conversation_deleted(
+    sender: Any, instance: UserGroup | Conversation, **kwargs: Any
+) -> None:
+    _invalidate(
+        UserGroup if isinstance(instance, UserGroup) else Conversation, [instance.pk]
+    )
@@ -12,6 +12,7 @@ from slack_sdk.errors import SlackApiError
 
 from firefighter.incidents.models.incident_membership import IncidentRole
 from firefighter.incidents.models.incident_role_type import IncidentRoleType
+from firefighter.incidents.signal_bus import lifecycle_receiver
 from firefighter.incidents.signals import incident_updated
 from firefighter.slack.messages.slack_messages import SlackMessageRoleAssignedToYou
 from firefighter.slack.signals import incident_channel_done
@@ -54,7 +55,7 @@ def incident_created_roles_dm(sender: Any, incident: Incident, **kwargs: Any) ->
                 )
 
 
-@receiver(signal=incident_updated, sender="update_roles")
+@lifecycle_receiver(incident_updated, sender="update_roles", mode="async")
 def incident_updated_roles_dm(
     sender: Any,
     incident: Incident,
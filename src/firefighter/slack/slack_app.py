@@ -1,13 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 from typing import TYPE_CHECKING, Any, ParamSpec, Self, TypedDict, TypeVar
 
 from django.conf import settings
+from django.core.cache import cache
 from slack_bolt.app.app import App
-from slack_bolt.middleware.authorization.single_team_authorization import (
-    SingleTeamAuthorization,
-)
+from slack_sdk.errors import SlackApiError
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -27,8 +27,78 @@ class SlackAppDetails(TypedDict):
     is_enterprise_install: bool
 
 
+def _slack_app_details_cache_key() -> str:
+    # Changing the token may change the bot or workspace
+    token_hash = hashlib.sha256(settings.SLACK_BOT_TOKEN.encode()).hexdigest()[:16]
+    return f"slack:app_details:{token_hash}"
+
+
+def get_slack_app_details(client: WebClient) -> SlackAppDetails:
+    """Returns the details of the bot and its workspace, from the cache or from Slack `auth.test`.
+
+    The details are cached for `FF_SLACK_APP_DETAILS_CACHE_TTL` seconds, and shared by all processes.
+
+    Args:
+        client (WebClient): The Slack client to call `auth.test` with.
+
+    Raises:
+        RuntimeError: If the Slack credentials are invalid.
+    """
+    if settings.FF_SLACK_SKIP_CHECKS:
+        return SlackAppDetails(
+            url="",
+            team="",
+            user="",
+            team_id="",
+            user_id="",
+            bot_id="",
+            is_enterprise_install=False,
+        )
+    cache_key = _slack_app_details_cache_key()
+    details: SlackAppDetails | None = cache.get(cache_key)
+    if details is not None:
+        return details
+
+    try:
+        res = client.auth_test()
+    except SlackApiError as e:
+        res = e.response
+    if not res.get("ok"):
+        logger.critical("Could not verify Slack credentials! Credentials: %s", res)
+        msg = "Could not verify Slack credentials!"
+        raise RuntimeError(msg)
+    details = SlackAppDetails(
+        url=res["url"],
+        team=res["team"],
+        user=res["user"],
+        team_id=res["team_id"],
+        user_id=res["user_id"],
+        bot_id=res["bot_id"],
+        is_enterprise_install=res["is_enterprise_install"],
+    )
+    cache.set(cache_key, details, timeout=settings.FF_SLACK_APP_DETAILS_CACHE_TTL)
+    logger.debug("SlackAppDetails: %s", details)
+    return details
+
+
+class _LazyDetailsApp(App):
+    """Slack Bolt App, which resolves its [SlackAppDetails][firefighter.slack.slack_app.SlackAppDetails] on first use."""
+
+    _details: SlackAppDetails | None = None
+
+    @property
+    def details(self) -> SlackAppDetails:
+        if self._details is None:
+            self._details = get_slack_app_details(self.client)
+        return self._details
+
+
 class SlackApp(App):
-    """Subclass of the Slack App, as a singleton."""
+    """Subclass of the Slack App, as a singleton.
+
+    Creating the app does not call Slack, so importing the Slack views does not slow down or block the start of the processes.
+    The token is verified when the `details` are first needed, see [get_slack_app_details][firefighter.slack.slack_app.get_slack_app_details].
+    """
 
     instance: App | None = None
     details: SlackAppDetails
@@ -39,56 +109,24 @@ class SlackApp(App):
                 logger.warning(
                     "Skipping Slack checks! Only use for testing or demo. Features related to the Bot User or the Workspace may not work (e.g. some generated URLs may be invalid)"
                 )
-                kwargs["token_verification_enabled"] = False
                 kwargs["request_verification_enabled"] = False
                 kwargs["ssl_check_enabled"] = False
                 kwargs["url_verification_enabled"] = False
+            # No auth.test call at startup: the details are resolved lazily
+            kwargs["token_verification_enabled"] = False
+            # Without a name, Bolt inspects the whole call stack (reading the source files) to find the caller file name
+            kwargs.setdefault("name", "firefighter")
 
             slack_bot_token: str = settings.SLACK_BOT_TOKEN
             slack_signing_secret: str = settings.SLACK_SIGNING_SECRET
             kwargs["token"] = slack_bot_token
             kwargs["signing_secret"] = slack_signing_secret
             kwargs["ignoring_self_events_enabled"] = False
-            cls.instance = App(*args, **kwargs)
-            single_team_authorization = next(
-                filter(
-                    lambda m: isinstance(m, SingleTeamAuthorization),
-                    cls.instance._middleware_list,  # noqa: SLF001
-                )
-            )
-
-            if isinstance(single_team_authorization, SingleTeamAuthorization):
-                res = single_team_authorization.auth_test_result
-                if settings.FF_SLACK_SKIP_CHECKS:
-                    cls.details = cls.instance.details = SlackAppDetails(  # type: ignore
-                        url="",
-                        team="",
-                        user="",
-                        team_id="",
-                        user_id="",
-                        bot_id="",
-                        is_enterprise_install=False,
-                    )
-                    return cls.instance  # type: ignore[return-value]
-                if res is None:
-                    logger.critical("Could not verify Slack credentials! Exiting.")
-                    raise RuntimeError("Could not verify Slack credentials! Exiting.")
-                if not res.get("ok"):
-                    logger.critical(
-                        "Could not verify Slack credentials! Exiting. Credentials: %s",
-                        res,
-                    )
-                    raise RuntimeError("Could not verify Slack credentials! Exiting.")
-                cls.details = cls.instance.details = SlackAppDetails(  # type: ignore
-                    url=res["url"],
-                    team=res["team"],
-                    user=res["user"],
-                    team_id=res["team_id"],
-                    user_id=res["user_id"],
-                    bot_id=res["bot_id"],
-                    is_enterprise_install=res["is_enterprise_install"],
-                )
-                logger.debug("SlackAppDetails: %s", cls.details)
+            cls.instance = _LazyDetailsApp(*args, **kwargs)
+            if settings.FF_QUERY_BUDGET_ENABLED:
+                from firefighter.slack.query_budget import instrument_query_budget
+
+                instrument_query_budget(cls.instance)
         return cls.instance  # type: ignore[return-value]
 
 
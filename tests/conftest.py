@@ -40,6 +40,19 @@ def _debug(settings: SettingsWrapper) -> None:
         template["OPTIONS"]["debug"] = True
 
 
+@pytest.fixture(autouse=True)
+def _signals_sync(settings: SettingsWrapper) -> None:
+    """Runs the `async` incident signal receivers inline, as on-commit callbacks never run in test transactions."""
+    settings.FF_SIGNALS_ASYNC = False
+
+
+@pytest.fixture(autouse=True)
+def _query_budgets(settings: SettingsWrapper) -> None:
+    """Checks the query budgets of the requests, and fails the test if one is exceeded."""
+    settings.FF_QUERY_BUDGET_ENABLED = True
+    settings.FF_QUERY_BUDGET_RAISE = True
+
+
 @pytest.fixture
 def footer_text() -> str:
     """An example fixture containing some html fragment."""
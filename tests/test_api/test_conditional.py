@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django.utils import timezone
+
+from firefighter.incidents.factories import IncidentFactory
+from firefighter.incidents.models.incident import Incident
+
+if TYPE_CHECKING:
+    from django.test import Client
+
+    from firefighter.incidents.models.user import User
+
+INCIDENTS_URL = "/api/v2/firefighter/incidents/"
+JSON = {"HTTP_ACCEPT": "application/json"}
+
+
+@pytest.fixture
+def api_client(client: Client, admin_user: User) -> Client:
+    client.force_login(admin_user)
+    return client
+
+
+@pytest.mark.django_db
+def test_list_not_modified(
+    api_client: Client, django_assert_max_num_queries: Any
+) -> None:
+    incident = IncidentFactory.create()
+    response = api_client.get(INCIDENTS_URL, **JSON)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    # Only the session, user and validator queries: nothing is serialized
+    with django_assert_max_num_queries(3):
+        response = api_client.get(INCIDENTS_URL, HTTP_IF_NONE_MATCH=etag, **JSON)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+    incident.title = "New title"
+    incident.save()
+    response = api_client.get(INCIDENTS_URL, HTTP_IF_NONE_MATCH=etag, **JSON)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_detail_not_modified(api_client: Client) -> None:
+    incident = IncidentFactory.create()
+    url = f"{INCIDENTS_URL}{incident.id}/"
+    response = api_client.get(url, **JSON)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = api_client.get(
+        url, HTTP_IF_MODIFIED_SINCE=response.headers["Last-Modified"], **JSON
+    )
+    assert response.status_code == 304
+    assert api_client.get(url, HTTP_IF_NONE_MATCH=etag, **JSON).status_code == 304
+
+    # Tags don't update the incident, but are in its payload
+    incident.tags.add("database")
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag, **JSON)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_list_since(api_client: Client) -> None:
+    incidents = IncidentFactory.create_batch(2)
+    Incident.objects.filter(id=incidents[0].id).update(
+        updated_at=timezone.now() - timedelta(days=2)
+    )
+    since = (timezone.now() - timedelta(days=1)).isoformat()
+
+    response = api_client.get(INCIDENTS_URL, {"since": since}, **JSON)
+    assert response.status_code == 200
+    assert [incident["id"] for incident in response.json()] == [incidents[1].id]
+
+    # The documented example
+    response = api_client.get(f"{INCIDENTS_URL}?since=2024-01-31T12:00:00Z", **JSON)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "since",
+    ["yesterday", "2024-02-30T12:00:00Z", "2024-01-31T25:00:00"],
+)
+def test_list_since_invalid(api_client: Client, since: str) -> None:
+    response = api_client.get(INCIDENTS_URL, {"since": since}, **JSON)
+    assert response.status_code == 400
+    assert response.json()["errors"][0]["attr"] == "since"
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+
+from firefighter.api.models import APIToken
+from firefighter.api.views import events
+from firefighter.incidents.factories import IncidentFactory, UserFactory
+from firefighter.incidents.models.incident_event import IncidentEvent
+
+if TYPE_CHECKING:
+    from django.test import Client
+
+    from firefighter.incidents.models.user import User
+
+EVENTS_URL = "/api/v2/firefighter/events/"
+STREAM_URL = "/api/v2/firefighter/events/stream"
+
+
+@pytest.fixture
+def incident_events() -> list[IncidentEvent]:
+    incident = IncidentFactory.create()
+    return IncidentEvent.objects.bulk_create(
+        IncidentEvent(incident=incident, event_type=event_type)
+        for event_type in ("incident_created", "incident_updated", "incident_closed")
+    )
+
+
+@pytest.mark.django_db
+def test_events_after_cursor(
+    client: Client, admin_user: User, incident_events: list[IncidentEvent]
+) -> None:
+    client.force_login(admin_user)
+
+    response = client.get(EVENTS_URL, {"after": incident_events[0].id, "limit": 1})
+    assert response.status_code == 200
+    assert response.json() == [incident_events[1].to_payload()]
+
+    response = client.get(EVENTS_URL, {"after": incident_events[2].id})
+    assert response.json() == []
+    assert client.get(EVENTS_URL, {"after": "last"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_events_requires_incident_permission(client: Client) -> None:
+    client.force_login(UserFactory.create())
+    assert client.get(EVENTS_URL).status_code == 403
+    assert client.get(STREAM_URL).status_code == 403
+
+
+@pytest.mark.django_db(transaction=True)
+def test_events_stream(
+    admin_user: User,
+    incident_events: list[IncidentEvent],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(events, "STREAM_MAX_DURATION", timedelta(seconds=1))
+    monkeypatch.setattr(events, "STREAM_HEARTBEAT", timedelta(seconds=0.2))
+    token = APIToken.objects.create(user=admin_user)
+
+    async def read_stream() -> str:
+        response = await AsyncClient().get(
+            STREAM_URL,
+            headers={
+                "Authorization": f"Bearer {token.key}",
+                "Last-Event-ID": str(incident_events[0].id),
+            },
+        )
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/event-stream"
+        return "".join([chunk.decode() async for chunk in response.streaming_content])
+
+    content = async_to_sync(read_stream)()
+
+    assert f"id: {incident_events[0].id}\n" not in content
+    assert f"id: {incident_events[1].id}\nevent: incident_updated\n" in content
+    assert f"id: {incident_events[2].id}\nevent: incident_closed\n" in content
+    assert ": keep-alive" in content
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django_redis import get_redis_connection
+
+from firefighter.api.throttling import (
+    LANE_SLOTS_KEY,
+    LaneFullError,
+    acquire_lane_slot,
+    parse_rate,
+    release_lane_slot,
+)
+from firefighter.incidents.factories import IncidentFactory
+
+if TYPE_CHECKING:
+    from django.test import Client
+    from pytest_django.fixtures import SettingsWrapper
+
+    from firefighter.incidents.models.user import User
+
+INCIDENTS_URL = "/api/v2/firefighter/incidents/"
+JSON = {"HTTP_ACCEPT": "application/json"}
+
+
+@pytest.fixture
+def bulk_lane(settings: SettingsWrapper) -> None:
+    settings.FF_API_LANE_CONCURRENCY = {"bulk": 1}
+    get_redis_connection("default").delete(LANE_SLOTS_KEY.format(lane="bulk"))
+
+
+def test_parse_rate() -> None:
+    assert parse_rate("60/min") == (60, 60)
+    assert parse_rate("1000/day") == (1000, 86400)
+
+
+@pytest.mark.django_db
+def test_rate_limit_per_client(
+    client: Client, admin_user: User, settings: SettingsWrapper
+) -> None:
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": {
+            "critical": None,
+            "default": None,
+            "bulk": "2/min",
+        },
+    }
+    client.force_login(admin_user)
+
+    assert client.get(INCIDENTS_URL, **JSON).status_code == 200
+    assert client.get(INCIDENTS_URL, **JSON).status_code == 200
+    response = client.get(INCIDENTS_URL, **JSON)
+
+    assert response.status_code == 429
+    assert 0 < int(response.headers["Retry-After"]) <= 60
+
+
+@pytest.mark.usefixtures("bulk_lane")
+def test_lane_slots() -> None:
+    assert acquire_lane_slot("critical") is None
+    slot = acquire_lane_slot("bulk")
+    assert slot is not None
+    with pytest.raises(LaneFullError):
+        acquire_lane_slot("bulk")
+
+    release_lane_slot("bulk", slot)
+    slot = acquire_lane_slot("bulk")
+    assert slot is not None
+    release_lane_slot("bulk", slot)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("bulk_lane")
+def test_lane_full(client: Client, admin_user: User) -> None:
+    client.force_login(admin_user)
+    slot = acquire_lane_slot("bulk")
+    assert slot is not None
+
+    response = client.get(INCIDENTS_URL, **JSON)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+    # The slot of a request is released at the end of the request
+    release_lane_slot("bulk", slot)
+    assert client.get(INCIDENTS_URL, **JSON).status_code == 200
+    assert client.get(INCIDENTS_URL, **JSON).status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("bulk_lane")
+def test_retrieve_is_not_in_the_bulk_lane(
+    client: Client, admin_user: User, settings: SettingsWrapper
+) -> None:
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": {
+            "critical": None,
+            "default": None,
+            "bulk": "1/min",
+        },
+    }
+    client.force_login(admin_user)
+    incident = IncidentFactory.create()
+    slot = acquire_lane_slot("bulk")
+    assert slot is not None
+
+    for _ in range(2):
+        response = client.get(f"{INCIDENTS_URL}{incident.id}/", **JSON)
+        assert response.status_code == 200
+    assert client.get(INCIDENTS_URL, **JSON).status_code == 429
+    release_lane_slot("bulk", slot)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django_redis import get_redis_connection
+from rest_framework.exceptions import AuthenticationFailed
+
+from firefighter.api.authentication import BearerTokenAuthentication
+from firefighter.api.models import APIToken, APITokenUsage
+from firefighter.api.token_cache import (
+    API_TOKEN_USAGE_CALLS_KEY,
+    API_TOKEN_USAGE_LAST_USED_KEY,
+    flush_token_usage,
+    invalidate_tokens,
+)
+from firefighter.incidents.factories import UserFactory
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.fixture
+def token() -> APIToken:
+    token = APIToken.objects.create(user=UserFactory.create())
+    invalidate_tokens(token.key)
+    return token
+
+
+@pytest.mark.django_db
+def test_token_authentication_cached(
+    token: APIToken, django_assert_num_queries: Any
+) -> None:
+    authentication = BearerTokenAuthentication()
+
+    with django_assert_num_queries(1):
+        user, _ = authentication.authenticate_credentials(token.key)
+    assert user == token.user
+
+    with django_assert_num_queries(0):
+        user, cached_token = authentication.authenticate_credentials(token.key)
+    assert user == token.user
+    assert cached_token.key == token.key
+
+
+@pytest.mark.django_db
+def test_token_authentication_invalidated(token: APIToken) -> None:
+    authentication = BearerTokenAuthentication()
+    authentication.authenticate_credentials(token.key)
+
+    token.user.is_active = False
+    token.user.save()
+    with pytest.raises(AuthenticationFailed):
+        authentication.authenticate_credentials(token.key)
+
+    token.user.is_active = True
+    token.user.save()
+    key = token.key
+    authentication.authenticate_credentials(key)
+    token.delete()
+    with pytest.raises(AuthenticationFailed):
+        authentication.authenticate_credentials(key)
+
+
+@pytest.mark.django_db
+def test_flush_token_usage(token: APIToken, settings: SettingsWrapper) -> None:
+    settings.FF_API_TOKEN_USAGE = True
+    get_redis_connection("default").delete(
+        API_TOKEN_USAGE_CALLS_KEY, API_TOKEN_USAGE_LAST_USED_KEY
+    )
+    authentication = BearerTokenAuthentication()
+
+    for _ in range(3):
+        authentication.authenticate_credentials(token.key)
+    assert flush_token_usage() == 1
+    usage = APITokenUsage.objects.get(token_id=token.key)
+    assert usage.calls == 3
+    assert usage.last_used_at is not None
+
+    # Nothing new to flush, then the calls are added up
+    assert flush_token_usage() == 0
+    authentication.authenticate_credentials(token.key)
+    assert flush_token_usage() == 1
+    usage.refresh_from_db()
+    assert usage.calls == 4
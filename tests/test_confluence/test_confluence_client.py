@@ -0,0 +1,156 @@
+"""Tests for the Confluence HTTP client, with a mocked transport."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from django.apps import apps
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from firefighter.confluence.client import ConfluenceClient
+
+    Handler = Callable[[httpx.Request], httpx.Response]
+    MakeClient = Callable[[Handler], ConfluenceClient]
+
+pytestmark = pytest.mark.skipif(
+    not apps.is_installed("firefighter.confluence"),
+    reason="Confluence app not installed",
+)
+
+BASE_URL = "https://example.atlassian.net/wiki/rest/api"
+
+
+@pytest.fixture
+def make_client() -> MakeClient:
+    def make(handler: Handler) -> ConfluenceClient:
+        from firefighter.confluence.client import ConfluenceClient
+
+        client = ConfluenceClient(BASE_URL, "user", "api_key")
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    return make
+
+
+@pytest.fixture
+def sleep(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    from firefighter.confluence import client
+
+    sleep = MagicMock()
+    monkeypatch.setattr(client.time, "sleep", sleep)
+    return sleep
+
+
+def test_search_content_follows_the_pages(make_client: MakeClient) -> None:
+    requests: list[httpx.URL] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url)
+        start = int(request.url.params.get("start", 0))
+        links = {"next": f"/rest/api/content/search?start={start + 2}"}
+        return httpx.Response(
+            200,
+            json={
+                "results": [{"id": str(start)}, {"id": str(start + 1)}],
+                "_links": links if start < 4 else {},
+            },
+        )
+
+    client = make_client(handler)
+
+    pages = list(client.search_content("type=page and id in (1,2)", limit=2))
+
+    assert [page["id"] for page in pages] == ["0", "1", "2", "3", "4", "5"]
+    assert requests[0].path == "/wiki/rest/api/content/search"
+    assert requests[0].params["cql"] == "type=page and id in (1,2)"
+    assert requests[0].params["limit"] == "2"
+    assert [str(url) for url in requests[1:]] == [
+        "https://example.atlassian.net/wiki/rest/api/content/search?start=2",
+        "https://example.atlassian.net/wiki/rest/api/content/search?start=4",
+    ]
+
+
+def test_next_page_is_prefetched(make_client: MakeClient) -> None:
+    next_page_requested = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "start" in request.url.params:
+            next_page_requested.set()
+            return httpx.Response(200, json={"results": [{"id": "2"}], "_links": {}})
+        return httpx.Response(
+            200,
+            json={
+                "results": [{"id": "1"}],
+                "_links": {"next": "/rest/api/content/1/child/page?start=1"},
+            },
+        )
+
+    client = make_client(handler)
+    pages = client.get_page_children_pages(1)
+
+    assert next(pages)["id"] == "1"
+    # The second page is requested while the first one is consumed
+    assert next_page_requested.wait(timeout=5)
+    assert [page["id"] for page in pages] == ["2"]
+
+
+def test_retry_on_rate_limit(make_client: MakeClient, sleep: MagicMock) -> None:
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(429),
+            httpx.Response(200, json={"id": "1"}),
+        ]
+    )
+    client = make_client(lambda _request: next(responses))
+
+    res = client.get_page(1)
+
+    assert res.status_code == 200
+    assert [call.args[0] for call in sleep.mock_calls] == [3, 2]
+
+
+def test_retry_on_rate_limit_gives_up(
+    make_client: MakeClient, sleep: MagicMock
+) -> None:
+    from firefighter.confluence.client import (
+        MAX_RETRIES_ON_RATE_LIMIT,
+        MAX_RETRY_DELAY,
+    )
+
+    client = make_client(
+        lambda _request: httpx.Response(429, headers={"Retry-After": "3600"})
+    )
+
+    res = client.get_page(1)
+
+    assert res.status_code == 429
+    assert [call.args[0] for call in sleep.mock_calls] == [
+        MAX_RETRY_DELAY
+    ] * MAX_RETRIES_ON_RATE_LIMIT
+
+
+def test_move_pages_partial_failure(
+    make_client: MakeClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from firefighter.confluence.service import confluence_service
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page_id = request.url.path.split("/")[-4]
+        if page_id == "2":
+            return httpx.Response(404, json={"message": "Not found"})
+        return httpx.Response(200, json={"id": page_id})
+
+    monkeypatch.setitem(confluence_service.__dict__, "client", make_client(handler))
+
+    moved = confluence_service.move_pages(
+        [(1, 10, "append"), (2, 10, "append"), (3, 1, "after")], max_workers=2
+    )
+
+    assert moved == [{"id": "1"}, None, {"id": "3"}]
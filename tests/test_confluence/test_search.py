@@ -0,0 +1,128 @@
+"""Tests for the full-text search of Confluence pages."""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django.apps import apps
+from django.contrib.auth.models import Permission
+from django.db import connection
+
+from firefighter.confluence.utils import highlight_search_snippet
+from firefighter.incidents.factories import UserFactory
+
+if TYPE_CHECKING:
+    from django.test import Client
+
+    from firefighter.confluence.models import Runbook
+
+pytestmark = pytest.mark.skipif(
+    not apps.is_installed("firefighter.confluence"),
+    reason="Confluence app not installed",
+)
+
+RUNBOOKS_URL = "/api/v2/firefighter/runbooks/"
+
+
+@pytest.fixture
+def runbooks() -> list[Runbook]:
+    from firefighter.confluence.models import Runbook, update_search_vector
+
+    runbooks = [
+        Runbook.objects.create(
+            name=name,
+            title=name,
+            service_name=service_name,
+            service_type="ms",
+            page_id=page_id,
+            page_url=f"https://example.atlassian.net/wiki/pages/{page_id}",
+            page_edit_url=f"https://example.atlassian.net/wiki/pages/edit/{page_id}",
+            body_storage=body,
+        )
+        for page_id, name, service_name, body in (
+            (1, "Payments", "checkout", "<p>Restart the <b>database</b> pods.</p>"),
+            (2, "Search", "catalog", "<p>Rebuild the index &amp; warm the cache.</p>"),
+        )
+    ]
+    update_search_vector()
+    return runbooks
+
+
+@pytest.mark.django_db
+def test_service_name_is_searchable(runbooks: list[Runbook]) -> None:
+    from firefighter.confluence.models import Runbook
+
+    found, _ = Runbook.objects.search(None, "catalog")
+
+    assert list(found) == [runbooks[1]]
+
+
+@pytest.mark.django_db
+def test_backfill_matches_update_search_vector(runbooks: list[Runbook]) -> None:
+    from firefighter.confluence.models import ConfluencePage
+
+    migration = import_module(
+        "firefighter.confluence.migrations.0003_confluencepage_search_vector_service_name"
+    )
+    expected = dict(ConfluencePage.objects.values_list("id", "search_vector"))
+    ConfluencePage.objects.update(search_vector=None)
+
+    with connection.cursor() as cursor:
+        cursor.execute(migration.Migration.operations[0].sql)
+
+    assert dict(ConfluencePage.objects.values_list("id", "search_vector")) == expected
+    assert "'catalog':2B" in expected[runbooks[1].id]
+
+
+@pytest.fixture
+def api_client(client: Client) -> Client:
+    user = UserFactory.create()
+    user.user_permissions.add(
+        Permission.objects.get(
+            codename="view_runbook", content_type__app_label="confluence"
+        )
+    )
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_api_search(api_client: Client, runbooks: list[Runbook]) -> None:
+    response = api_client.get(
+        RUNBOOKS_URL, {"search": "database"}, HTTP_ACCEPT="application/json"
+    )
+
+    assert response.status_code == 200
+    results: list[dict[str, Any]] = response.json()
+    assert [result["id"] for result in results] == [str(runbooks[0].id)]
+    assert results[0]["search_rank"] > 0
+    assert "\x02database\x03" in results[0]["search_snippet"]
+
+
+@pytest.mark.django_db
+def test_api_filter_service_type(api_client: Client, runbooks: list[Runbook]) -> None:
+    from firefighter.confluence.models import Runbook
+
+    Runbook.objects.filter(pk=runbooks[1].pk).update(service_type="lib")
+
+    response = api_client.get(
+        RUNBOOKS_URL, {"service_type": "lib,other"}, HTTP_ACCEPT="application/json"
+    )
+
+    assert response.status_code == 200
+    assert [result["id"] for result in response.json()] == [str(runbooks[1].id)]
+
+
+@pytest.mark.django_db
+def test_search_snippet_is_highlighted(runbooks: list[Runbook]) -> None:
+    from firefighter.confluence.models import Runbook
+
+    found, _ = Runbook.objects.search(None, "cache")
+    snippet = found.get().search_snippet
+
+    # Tags are stripped, entities are escaped once and matches are highlighted
+    assert highlight_search_snippet(snippet) == (
+        "Rebuild the index &amp; warm the <mark>cache</mark>"
+    )
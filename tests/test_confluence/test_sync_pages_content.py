@@ -0,0 +1,128 @@
+"""Tests for the incremental sync of the content of Confluence pages."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pytest
+from django.apps import apps
+
+if TYPE_CHECKING:
+    from firefighter.confluence.models import ConfluencePage
+
+pytestmark = pytest.mark.skipif(
+    not apps.is_installed("firefighter.confluence"),
+    reason="Confluence app not installed",
+)
+
+
+@pytest.fixture
+def confluence_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    from firefighter.confluence.service import confluence_service
+
+    client = MagicMock()
+    monkeypatch.setitem(confluence_service.__dict__, "client", client)
+    return client
+
+
+@pytest.fixture
+def pages() -> list[ConfluencePage]:
+    from firefighter.confluence.models import ConfluencePage
+
+    return [
+        ConfluencePage.objects.create(
+            name=f"Page {page_id}",
+            page_id=page_id,
+            page_url=f"https://example.atlassian.net/wiki/pages/{page_id}",
+            page_edit_url=f"https://example.atlassian.net/wiki/pages/edit/{page_id}",
+            body_storage="<p>Old body</p>",
+            version={"number": 1},
+        )
+        for page_id in (1, 2, 3, 4)
+    ]
+
+
+def page_with_body(page_id: int, version: int) -> dict[str, Any]:
+    return {
+        "id": str(page_id),
+        "body": {
+            "storage": {"value": f"<p>Body {page_id}</p>"},
+            "view": {"value": f"<p>Body {page_id}</p>"},
+            "export_view": {"value": f"<p>Body {page_id}</p>"},
+        },
+        "version": {"number": version},
+    }
+
+
+def test_get_pages_version_numbers_in_batches(confluence_client: MagicMock) -> None:
+    from firefighter.confluence.service import confluence_service
+
+    confluence_client.search_content.side_effect = [
+        [{"id": "1", "version": {"number": 3}}, {"id": "2", "version": {"number": 1}}],
+        # Page 4 is missing (deleted or restricted), page 5 has no version
+        [{"id": "3", "version": {"number": 2}}, {"id": "5"}],
+    ]
+
+    versions = confluence_service.get_pages_version_numbers(
+        [1, 2, 3, 4, 5], batch_size=3
+    )
+
+    assert versions == {1: 3, 2: 1, 3: 2}
+    assert [
+        (call.args, call.kwargs) for call in confluence_client.search_content.mock_calls
+    ] == [
+        (("type=page and id in (1,2,3)",), {"expand": "version"}),
+        (("type=page and id in (4,5)",), {"expand": "version"}),
+    ]
+
+
+@pytest.mark.django_db
+def test_sync_fetches_only_changed_pages(
+    confluence_client: MagicMock, pages: list[ConfluencePage]
+) -> None:
+    from firefighter.confluence.models import ConfluencePage
+    from firefighter.confluence.tasks.sync_pages_content import sync_pages_content
+
+    # Page 1 has a newer version, page 2 is up to date, pages 3 and 4 are missing from the search
+    confluence_client.search_content.return_value = [
+        {"id": "1", "version": {"number": 2}},
+        {"id": "2", "version": {"number": 1}},
+    ]
+    responses = {
+        1: page_with_body(1, 2),
+        3: page_with_body(3, 1),
+        4: {"statusCode": 404, "data": {"authorized": True}},
+    }
+    confluence_client.get_page_body_and_version.side_effect = lambda page_id: MagicMock(
+        json=MagicMock(return_value=responses[page_id])
+    )
+
+    sync_pages_content()
+
+    assert sorted(
+        call.args[0] for call in confluence_client.get_page_body_and_version.mock_calls
+    ) == [1, 3, 4]
+    pages_by_id = {page.page_id: page for page in ConfluencePage.objects.all()}
+    # The page that does not exist anymore is deleted
+    assert sorted(pages_by_id) == [1, 2, 3]
+    assert pages_by_id[1].body_storage == "<p>Body 1</p>"
+    assert pages_by_id[1].version == {"number": 2}
+    assert pages_by_id[2].body_storage == "<p>Old body</p>"
+    assert pages_by_id[3].body_storage == "<p>Body 3</p>"
+
+
+@pytest.mark.django_db
+def test_full_sync_fetches_all_pages(
+    confluence_client: MagicMock, pages: list[ConfluencePage]
+) -> None:
+    from firefighter.confluence.tasks.sync_pages_content import sync_pages_content
+
+    confluence_client.get_page_body_and_version.side_effect = lambda page_id: MagicMock(
+        json=MagicMock(return_value=page_with_body(page_id, 1))
+    )
+
+    sync_pages_content(full=True)
+
+    confluence_client.search_content.assert_not_called()
+    assert confluence_client.get_page_body_and_version.call_count == len(pages)
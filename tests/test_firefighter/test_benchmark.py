@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from firefighter.firefighter.benchmark import (
+    BenchmarkError,
+    DatasetSize,
+    compare_results,
+    generate_dataset,
+    run_benchmarks,
+)
+from firefighter.incidents.models import Incident
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SMALL = DatasetSize(incidents=10, users=10, usergroups=2, escalation_policies=1)
+
+
+@pytest.mark.django_db
+def test_generate_dataset() -> None:
+    dataset = generate_dataset(SMALL)
+
+    assert dataset.counts["incidents"] == 10
+    assert dataset.counts["metrics"] > 0
+    assert len({incident.created_at for incident in dataset.incidents}) == 10
+    assert dataset.superuser.is_superuser
+
+
+@pytest.mark.django_db
+def test_run_benchmarks() -> None:
+    dataset = generate_dataset(SMALL)
+
+    report = run_benchmarks(
+        dataset,
+        rounds=1,
+        only=[
+            "mtbf",
+            "compute_metrics",
+            "build_invite_list",
+            "modal_rendering",
+        ],
+    )
+
+    assert report["dataset"]["counts"] == dataset.counts
+    assert list(report["results"]) == [
+        "mtbf",
+        "compute_metrics",
+        "build_invite_list",
+        "modal_rendering",
+    ]
+    for result in report["results"].values():
+        assert result["median_ms"] > 0
+    with pytest.raises(BenchmarkError, match="Unknown benchmarks: missing"):
+        run_benchmarks(dataset, only=["missing"])
+
+
+def test_compare_results() -> None:
+    previous = {
+        "results": {
+            "a": {"median_ms": 10.0, "queries": 5},
+            "b": {"median_ms": 10.0, "queries": 5},
+        }
+    }
+    current = {
+        "results": {
+            "a": {"median_ms": 11.0, "queries": 5},
+            "b": {"median_ms": 13.0, "queries": 2},
+            "c": {"median_ms": 1.0, "queries": 1},
+        }
+    }
+
+    assert compare_results(previous, current, threshold=0.2) == {
+        "a": {"ratio": 1.1, "queries": 0, "regression": False},
+        "b": {"ratio": 1.3, "queries": -3, "regression": True},
+    }
+
+
+@pytest.mark.django_db
+def test_benchmark_command(tmp_path: Path) -> None:
+    output = tmp_path / "results.json"
+    incidents = Incident.objects.count()
+
+    call_command(
+        "benchmark",
+        "--incidents",
+        "5",
+        "--users",
+        "5",
+        "-r",
+        "1",
+        "-k",
+        "mtbf",
+        "-o",
+        str(output),
+        "--label",
+        "abc123",
+    )
+
+    report = json.loads(output.read_text())
+    assert report["label"] == "abc123"
+    assert list(report["results"]) == ["mtbf"]
+    # The dataset is rolled back
+    assert Incident.objects.count() == incidents
+
+    report["results"]["mtbf"]["median_ms"] /= 10
+    output.write_text(json.dumps(report))
+    with pytest.raises(CommandError, match="Performance regressions: mtbf"):
+        call_command(
+            "benchmark",
+            "--incidents",
+            "5",
+            "-r",
+            "1",
+            "-k",
+            "mtbf",
+            "--compare",
+            str(output),
+        )
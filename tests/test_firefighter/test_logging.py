@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import os
+import time
+from typing import TYPE_CHECKING
+
 import pytest
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def test_json_logging(caplog: pytest.LogCaptureFixture, capsys, settings) -> None:
     """This test ensures that JSON logging is working."""
@@ -26,3 +33,155 @@ def test_json_logging(caplog: pytest.LogCaptureFixture, capsys, settings) -> Non
     assert '{"message": "Testing now.",' in captured.err
     # XXX Make more testing assertion about our expected JSON log output and its format.
     # This is a bit tricky as it is in Gunicorn logs.
+
+
+@pytest.mark.parametrize("record_name", ["app", "exception", "gunicorn"])
+def test_fast_json_formatter_same_fields(record_name: str) -> None:
+    """The fast JSON formatter must output the same fields as the legacy one."""
+    import json
+
+    from firefighter.firefighter.management.commands.benchmark_log_formatter import (
+        make_records,
+    )
+    from firefighter.firefighter.settings.components.logging import (
+        get_json_formatter,
+    )
+
+    record = make_records()[record_name]
+    outputs = []
+    for fast in (False, True):
+        config = get_json_formatter(fast=fast)
+        formatter = config.pop("()")(**config)
+        outputs.append(json.loads(formatter.format(record)))
+
+    legacy, fast_output = outputs
+    assert fast_output == legacy
+    if record_name == "exception":
+        assert fast_output["error.kind"] == "ValueError"
+    if record_name == "gunicorn":
+        assert fast_output["http.uri"] == "/api/v2/firefighter/incidents"
+        assert fast_output["http.headers.x-request-id"] == "4c6a8d9e"
+        assert "wsgi.url_scheme" not in fast_output
+
+
+def test_deferred_formatting_queue_handler() -> None:
+    """Records are formatted by the listener handlers, with their gunicorn args and traceback."""
+    import json
+    import logging
+    import queue
+    from logging.handlers import QueueListener
+
+    from firefighter.firefighter.management.commands.benchmark_log_formatter import (
+        make_records,
+    )
+    from firefighter.firefighter.settings.components.logging import (
+        get_json_formatter,
+    )
+    from firefighter.logging.queue_handler import DeferredFormattingQueueHandler
+
+    class ListHandler(logging.Handler):
+        def __init__(self) -> None:
+            super().__init__()
+            self.lines: list[str] = []
+
+        def emit(self, record: logging.LogRecord) -> None:
+            self.lines.append(self.format(record))
+
+    config = get_json_formatter(fast=True)
+    target = ListHandler()
+    target.setFormatter(config.pop("()")(**config))
+    q: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = DeferredFormattingQueueHandler(q)
+    handler.listener = QueueListener(q, target)
+
+    records = make_records()
+    for record in records.values():
+        handler.handle(record)
+    handler.close()
+
+    lines = [json.loads(line) for line in target.lines]
+    assert [line["logger.name"] for line in lines] == [
+        record.name for record in records.values()
+    ]
+    assert lines[0]["message"] == "Incident #42 opened"
+    assert lines[1]["error.message"] == "ValueError: Invalid value: 42"
+    assert lines[2]["http.method"] == "GET"
+
+
+def test_deferred_formatting_queue_handler_starts_listener_once() -> None:
+    """Threads emitting their first records concurrently start the listener once."""
+    import logging
+    import queue
+    import threading
+    from unittest.mock import MagicMock
+
+    from firefighter.logging.queue_handler import DeferredFormattingQueueHandler
+
+    q: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = DeferredFormattingQueueHandler(q)
+    listener = MagicMock()
+    handler.listener = listener
+    barrier = threading.Barrier(8)
+
+    def emit() -> None:
+        barrier.wait()
+        handler.emit(logging.makeLogRecord({"msg": "Concurrent record"}))
+
+    threads = [threading.Thread(target=emit) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    handler.close()
+
+    listener.start.assert_called_once()
+    listener.stop.assert_called_once()
+    assert q.qsize() == 8
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Needs os.fork")
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_deferred_formatting_queue_handler_restarts_listener_after_fork(
+    tmp_path: Path,
+) -> None:
+    """A listener started before a fork is started again in the child process."""
+    import logging
+    import queue
+    from logging.handlers import QueueListener
+
+    from firefighter.logging.queue_handler import DeferredFormattingQueueHandler
+
+    class StrictQueueListener(QueueListener):
+        """Refuses to start when it has a thread, like on Python 3.14+."""
+
+        def start(self) -> None:
+            if self._thread is not None:
+                msg = "Listener already started"
+                raise RuntimeError(msg)
+            super().start()
+
+    log_file = tmp_path / "fork.log"
+    target = logging.FileHandler(log_file)
+    q: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = DeferredFormattingQueueHandler(q)
+    handler.listener = StrictQueueListener(q, target)
+    handler.handle(logging.makeLogRecord({"msg": "Parent record"}))
+    # Written by the listener, which now waits for records
+    while "Parent record" not in log_file.read_text():
+        time.sleep(0.01)
+
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 1
+        try:
+            handler.handle(logging.makeLogRecord({"msg": "Child record"}))
+            handler.close()
+            exit_code = 0
+        finally:
+            os._exit(exit_code)
+    _, status = os.waitpid(pid, 0)
+    handler.close()
+    target.close()
+
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert log_file.read_text().splitlines() == ["Parent record", "Child record"]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.urls import reverse
+
+from firefighter.firefighter.pagination import EstimatedCountPaginator, fast_count
+from firefighter.incidents.factories import IncidentFactory
+from firefighter.incidents.models.incident import Incident
+from firefighter.incidents.views.views import IncidentListView
+
+if TYPE_CHECKING:
+    from django.test import Client
+    from pytest_django.fixtures import SettingsWrapper
+
+    from firefighter.incidents.models.user import User
+
+
+@pytest.mark.django_db
+def test_fast_count_exact_under_threshold() -> None:
+    IncidentFactory.create_batch(3)
+
+    assert fast_count(Incident.objects.all(), exact_threshold=10) == (3, True)
+    assert fast_count(Incident.objects.none(), exact_threshold=10) == (0, True)
+
+
+@pytest.mark.django_db
+def test_fast_count_estimated_over_threshold() -> None:
+    IncidentFactory.create_batch(3)
+    queryset = Incident.objects.filter(title__isnull=False)
+
+    count, is_exact = fast_count(queryset, exact_threshold=-1)
+
+    assert not is_exact
+    assert count >= 0
+
+
+@pytest.mark.django_db
+def test_estimated_count_paginator(settings: SettingsWrapper) -> None:
+    settings.FF_EXACT_COUNT_THRESHOLD = 10
+    IncidentFactory.create_batch(3)
+
+    paginator = EstimatedCountPaginator(Incident.objects.order_by("id"), per_page=2)
+
+    assert paginator.count == 3
+    assert paginator.count_is_exact
+    assert paginator.num_pages == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_debug")
+def test_incident_list_keyset_pagination(
+    client: Client, admin_user: User, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(IncidentListView.table_pagination, "per_page", 2)
+    client.force_login(admin_user)
+    incidents = IncidentFactory.create_batch(3)
+    url = reverse("incidents:incident-list")
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.context["result_count"] == 3
+    assert response.context["next_cursor"] == incidents[1].id
+    assert [row.record.id for row in response.context["table"].paginated_rows] == [
+        incidents[2].id,
+        incidents[1].id,
+    ]
+
+    # HTMX "Load more": only the next rows are rendered
+    response = client.get(url, {"cursor": incidents[1].id}, HTTP_HX_REQUEST="true")
+    assert response.status_code == 200
+    assert response.templates[0].name == "layouts/partials/partial_table_rows.html"
+    assert response.context["next_cursor"] is None
+    assert [row.record.id for row in response.context["table"].paginated_rows] == [
+        incidents[0].id
+    ]
+
+    # Sorted by another column: numbered pages
+    response = client.get(url, {"sort": "-created_at"})
+    assert response.status_code == 200
+    assert response.context["page_obj"].paginator.count == 3
+    assert response.context["page_obj"].paginator.count_is_exact
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_debug")
+def test_incident_list_search_is_not_keyset_paginated(
+    client: Client, admin_user: User, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(IncidentListView.table_pagination, "per_page", 2)
+    client.force_login(admin_user)
+    incidents = [
+        IncidentFactory.create(title=title, description="")
+        for title in (
+            "Database outage: failover of the database",
+            "Database latency",
+            "Payments down",
+        )
+    ]
+    url = reverse("incidents:incident-list")
+
+    response = client.get(url, {"search": "database"})
+    assert response.status_code == 200
+    assert "next_cursor" not in response.context
+    assert response.context["page_obj"].paginator.count == 2
+    # Sorted by relevance, not by ID
+    assert [row.record.id for row in response.context["table"].paginated_rows] == [
+        incidents[0].id,
+        incidents[1].id,
+    ]
+
+    # Ordered by the `order_by` filter: numbered pages
+    response = client.get(url, {"order_by": "id"})
+    assert response.status_code == 200
+    assert "next_cursor" not in response.context
+    assert [row.record.id for row in response.context["table"].paginated_rows] == [
+        incidents[0].id,
+        incidents[1].id,
+        incidents[2].id,
+    ]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+from django.http import HttpResponse
+from django.test import Client, RequestFactory
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+from slack_bolt.request.request import BoltRequest
+
+from firefighter.firefighter.middleware import QueryBudgetMiddleware
+from firefighter.firefighter.query_budget import (
+    QueryBudgetExceededError,
+    check_query_budget,
+    fingerprint,
+    record_queries,
+)
+from firefighter.incidents.factories import IncidentFactory, UserFactory
+from firefighter.incidents.models import IncidentRoleType, Priority, User
+from firefighter.incidents.models.incident_membership import IncidentRole
+from firefighter.slack.query_budget import (
+    QueryBudgetListenerCompletionHandler,
+    QueryBudgetListenerStartHandler,
+    get_slack_route,
+)
+
+
+def test_fingerprint() -> None:
+    assert fingerprint(
+        """SELECT "t"."id" FROM "t" U0  WHERE ("t"."id" IN (%s, %s, %s) AND "t"."name" = 'x''y' AND U0."v" > 42)"""
+    ) == fingerprint(
+        """SELECT "t"."id" FROM "t" U0 WHERE ("t"."id" IN (%s) AND "t"."name" = 'z' AND U0."v" > 1)"""
+    )
+
+
+@pytest.mark.django_db
+def test_record_queries() -> None:
+    with record_queries() as stats:
+        for priority in Priority.objects.all()[:3]:
+            User.objects.filter(username=str(priority.value)).exists()
+
+    assert stats.count == 4
+    assert stats.duration > 0
+    assert list(stats.duplicates(3).values()) == [3]
+    assert stats.duplicates(4) == {}
+
+
+@pytest.mark.django_db
+def test_check_query_budget(
+    settings: SettingsWrapper, caplog: pytest.LogCaptureFixture
+) -> None:
+    settings.FF_QUERY_BUDGETS = {"incidents:incident-detail": 1}
+    settings.FF_QUERY_BUDGET_RAISE = False
+    with record_queries() as stats:
+        list(Priority.objects.all())
+        list(User.objects.all())
+
+    with caplog.at_level(logging.INFO, logger="firefighter.observability"):
+        check_query_budget("incidents:dashboard", stats)
+        check_query_budget("incidents:incident-detail", stats)
+
+    ok, exceeded = caplog.records
+    assert ok.levelno == logging.INFO
+    assert ok.__dict__["ff.db.query_count"] == 2
+    assert exceeded.levelno == logging.WARNING
+    assert "over its budget of 1" in exceeded.getMessage()
+
+    settings.FF_QUERY_BUDGET_RAISE = True
+    with pytest.raises(QueryBudgetExceededError):
+        check_query_budget("incidents:incident-detail", stats)
+
+
+@pytest.mark.django_db
+def test_query_budget_middleware(settings: SettingsWrapper) -> None:
+    settings.FF_QUERY_BUDGET_ENABLED = True
+    settings.FF_QUERY_BUDGET_DEFAULT = 1
+    settings.FF_QUERY_BUDGET_RAISE = True
+
+    def view(request: object) -> HttpResponse:
+        list(Priority.objects.all())
+        list(User.objects.all())
+        return HttpResponse()
+
+    middleware = QueryBudgetMiddleware(view)  # type: ignore[arg-type]
+    with pytest.raises(QueryBudgetExceededError, match="/incidents/"):
+        middleware(RequestFactory().get("/incidents/"))
+
+
+@pytest.mark.django_db
+def test_incident_detail_within_budget(client: Client, admin_user: User) -> None:
+    incident = IncidentFactory.create()
+    for number in range(12):
+        IncidentRole.objects.create(
+            incident=incident,
+            user=UserFactory.create(),
+            role_type=IncidentRoleType.objects.create(
+                slug=f"role_{number}",
+                name=f"Role {number}",
+                summary="",
+                description="",
+            ),
+        )
+    client.force_login(admin_user)
+
+    # Raises QueryBudgetExceededError if the roles are loaded one by one
+    response = client.get(reverse("incidents:incident-detail", args=[incident.id]))
+
+    assert response.status_code == 200
+
+
+def test_get_slack_route() -> None:
+    assert get_slack_route({"command": "/incident"}) == "slack:/incident"
+    assert (
+        get_slack_route({"type": "block_actions", "actions": [{"action_id": "open"}]})
+        == "slack:open"
+    )
+    assert (
+        get_slack_route({"type": "view_submission", "view": {"callback_id": "close"}})
+        == "slack:close"
+    )
+    assert (
+        get_slack_route({"type": "event_callback", "event": {"type": "message"}})
+        == "slack:message"
+    )
+
+
+@pytest.mark.django_db
+def test_slack_listener_handlers(settings: SettingsWrapper) -> None:
+    settings.FF_QUERY_BUDGETS = {"slack:/incident": 0}
+    settings.FF_QUERY_BUDGET_RAISE = True
+    logger = logging.getLogger(__name__)
+    request = BoltRequest(
+        body=json.dumps({"command": "/incident"}),
+        headers={"content-type": ["application/json"]},
+    )
+
+    QueryBudgetListenerStartHandler(logger=logger).handle(request, None)
+    list(Priority.objects.all())
+    with pytest.raises(QueryBudgetExceededError, match="slack:/incident"):
+        QueryBudgetListenerCompletionHandler(logger=logger).handle(request, None)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from django.core.management import call_command
+
+from firefighter.firefighter.startup_profile import import_times_by_package
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_startup_profile_command(tmp_path: Path) -> None:
+    output = tmp_path / "startup.json"
+
+    call_command("startup_profile", "-n", "1", "-o", str(output))
+
+    report = json.loads(output.read_text())
+    assert report["runs"] == 1
+    assert report["total_ms"] >= report["setup_ms"] > 0
+    assert {"incidents", "slack"} <= report["apps"].keys()
+    assert report["apps"]["slack"]["ready_ms"] > 0
+    assert {"django", "firefighter.incidents"} <= report["packages"].keys()
+    # The Jira library is only imported when the API is called
+    assert "jira" not in report["packages"]
+
+
+def test_import_times_by_package() -> None:
+    importtime_output = """import time: self [us] | cumulative | imported package
+import time:      1200 |       1200 |     jira.exceptions
+import time:       800 |       2000 |   jira
+import time:       300 |        300 |     firefighter.slack.models.user
+import time:       500 |        800 |   firefighter.slack.models
+import time:       100 |       2900 | firefighter
+Some warning printed on stderr
+"""
+
+    assert import_times_by_package(importtime_output) == {
+        "jira": 2.0,
+        "firefighter.slack": 0.8,
+        "firefighter": 0.1,
+    }
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from django.db import OperationalError
+from django.utils import timezone
+
+from firefighter.incidents.change_feed import purge_incident_events
+from firefighter.incidents.enums import IncidentStatus
+from firefighter.incidents.factories import IncidentFactory
+from firefighter.incidents.models.incident_event import IncidentEvent
+from firefighter.incidents.signals import incident_created, incident_updated
+
+
+@pytest.mark.django_db
+def test_incident_events_recorded(django_capture_on_commit_callbacks: Any) -> None:
+    incident = IncidentFactory.create(_status=IncidentStatus.OPEN)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        incident_created.send_robust(sender=__name__, incident=incident)
+        incident.status = IncidentStatus.MITIGATING
+        incident.save()
+        incident_updated.send_robust(
+            sender="update_status", incident=incident, updated_fields=["_status"]
+        )
+        # Recorded after the commit, not while the transaction is open
+        assert not IncidentEvent.objects.exists()
+    assert callbacks
+
+    created, updated = IncidentEvent.objects.filter(incident=incident)
+    assert created.id < updated.id
+    assert created.event_type == "incident_created"
+    assert created.data["status"] == IncidentStatus.OPEN.label
+    assert updated.event_type == "incident_updated"
+    assert updated.data["status"] == IncidentStatus.MITIGATING.label
+    assert updated.data["updated_fields"] == ["_status"]
+    assert updated.to_payload()["incident_id"] == incident.id
+
+
+@pytest.mark.django_db
+def test_incident_event_error_is_not_raised(
+    django_capture_on_commit_callbacks: Any, caplog: pytest.LogCaptureFixture
+) -> None:
+    incident = IncidentFactory.create(_status=IncidentStatus.OPEN)
+
+    with (
+        patch.object(
+            IncidentEvent.objects, "create", side_effect=OperationalError("timeout")
+        ),
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        incident_created.send_robust(sender=__name__, incident=incident)
+
+    assert not IncidentEvent.objects.exists()
+    assert "Could not record incident_created event" in caplog.text
+
+
+@pytest.mark.django_db
+def test_purge_incident_events() -> None:
+    incident = IncidentFactory.create()
+    old, recent = IncidentEvent.objects.bulk_create([
+        IncidentEvent(incident=incident, event_type="incident_created"),
+        IncidentEvent(incident=incident, event_type="incident_updated"),
+    ])
+    IncidentEvent.objects.filter(id=old.id).update(
+        created_at=timezone.now() - timedelta(days=365)
+    )
+
+    assert purge_incident_events() == 1
+    assert list(IncidentEvent.objects.values_list("id", flat=True)) == [recent.id]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django.urls import reverse
+
+from firefighter.incidents.factories import IncidentFactory
+from firefighter.incidents.fragment_cache import get_fragment_version
+from firefighter.incidents.models.incident_update import IncidentUpdate
+from firefighter.incidents.signals import incident_updated
+
+if TYPE_CHECKING:
+    from django.test import Client
+
+    from firefighter.incidents.models.user import User
+
+
+@pytest.mark.django_db
+def test_fragment_version_invalidation() -> None:
+    incident = IncidentFactory.create()
+    version = get_fragment_version(incident.id)
+    assert get_fragment_version(incident.id) == version
+
+    IncidentUpdate.objects.create(
+        incident=incident, created_by=incident.created_by, message="Update"
+    )
+    new_version = get_fragment_version(incident.id)
+    assert new_version != version
+
+    incident_updated.send_robust(sender="update_status", incident=incident)
+    assert get_fragment_version(incident.id) != new_version
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_debug")
+def test_incident_detail_sections_cached(
+    client: Client,
+    admin_user: User,
+    django_assert_num_queries: Any,
+    django_assert_max_num_queries: Any,
+) -> None:
+    client.force_login(admin_user)
+    incident = IncidentFactory.create()
+    IncidentUpdate.objects.create(
+        incident=incident, created_by=admin_user, message="Investigating"
+    )
+    url = reverse("incidents:incident-detail", args=[incident.id])
+
+    with django_assert_max_num_queries(50) as captured:
+        response = client.get(url)
+    assert response.status_code == 200
+    assert b"Investigating" in response.content
+    queries_first_render = len(captured)
+
+    # Timeline, metrics and impacts are served from the cache
+    with django_assert_num_queries(queries_first_render - 3):
+        response = client.get(url)
+    assert b"Investigating" in response.content
+
+    # A new incident update is rendered right away
+    IncidentUpdate.objects.create(
+        incident=incident, created_by=admin_user, message="Mitigated"
+    )
+    response = client.get(url)
+    assert b"Mitigated" in response.content
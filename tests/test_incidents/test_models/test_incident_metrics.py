@@ -0,0 +1,100 @@
+"""Tests for the bulk computation of incident metrics from milestones."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from django.core.management import call_command
+
+from firefighter.incidents.factories import IncidentFactory
+from firefighter.incidents.models import IncidentUpdate
+from firefighter.incidents.models.incident import Incident
+from firefighter.incidents.models.metric_type import IncidentMetric, MetricType
+
+T0 = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def time_to_fix() -> MetricType:
+    """Time to Fix, from declared to recovered, from the fixtures."""
+    return MetricType.objects.get(code="TTF")
+
+
+def add_milestone(incident: Incident, event_type: str, event_ts: datetime) -> None:
+    IncidentUpdate.objects.create(
+        incident=incident,
+        created_by=incident.created_by,
+        event_type=event_type,
+        event_ts=event_ts,
+    )
+
+
+@pytest.mark.django_db
+class TestComputeMetrics:
+    def test_compute_for_incidents(self, time_to_fix: MetricType) -> None:
+        complete = IncidentFactory.create()
+        add_milestone(complete, "declared", T0)
+        add_milestone(complete, "recovered", T0 + timedelta(hours=1))
+        # Only the latest milestone of a type is used
+        add_milestone(complete, "recovered", T0 + timedelta(hours=2))
+        incomplete = IncidentFactory.create()
+        add_milestone(incomplete, "declared", T0)
+
+        computed, deleted = IncidentMetric.objects.compute_for_incidents(
+            [complete.id, incomplete.id]
+        )
+
+        assert (computed, deleted) == (1, 0)
+        metric = IncidentMetric.objects.get(incident=complete, metric_type=time_to_fix)
+        assert metric.duration == timedelta(hours=2)
+        assert not IncidentMetric.objects.filter(incident=incomplete).exists()
+
+    def test_compute_updates_and_purges(self, time_to_fix: MetricType) -> None:
+        updated = IncidentFactory.create()
+        add_milestone(updated, "declared", T0)
+        add_milestone(updated, "recovered", T0 + timedelta(minutes=5))
+        negative = IncidentFactory.create()
+        add_milestone(negative, "declared", T0)
+        add_milestone(negative, "recovered", T0 - timedelta(minutes=5))
+        for incident in (updated, negative):
+            IncidentMetric.objects.create(
+                incident=incident, metric_type=time_to_fix, duration=timedelta(days=1)
+            )
+
+        computed, deleted = IncidentMetric.objects.compute_for_incidents(
+            [updated.id, negative.id], purge=True
+        )
+
+        assert (computed, deleted) == (1, 1)
+        assert IncidentMetric.objects.get(incident=updated).duration == timedelta(
+            minutes=5
+        )
+        assert not IncidentMetric.objects.filter(incident=negative).exists()
+
+    def test_incident_compute_metrics(self, time_to_fix: MetricType) -> None:
+        incident = IncidentFactory.create()
+        add_milestone(incident, "declared", T0)
+        add_milestone(incident, "recovered", T0 + timedelta(hours=3))
+
+        incident.compute_metrics()
+
+        assert incident.metric_set.get(metric_type=time_to_fix).duration == timedelta(
+            hours=3
+        )
+
+    def test_compute_metrics_command(self) -> None:
+        incidents = IncidentFactory.create_batch(3)
+        for incident in incidents:
+            add_milestone(incident, "declared", T0)
+            add_milestone(incident, "recovered", T0 + timedelta(hours=1))
+        Incident.objects.filter(pk=incidents[0].pk).update(
+            created_at=datetime(2010, 1, 1, tzinfo=UTC)
+        )
+
+        call_command("compute_metrics", "--since", "2011-01-01", "--chunk-size", "1")
+
+        assert set(IncidentMetric.objects.values_list("incident_id", flat=True)) == {
+            incidents[1].id,
+            incidents[2].id,
+        }
@@ -0,0 +1,77 @@
+"""Tests for the incident search, on the trigger-maintained `search_vector` and the title trigram index."""
+
+from __future__ import annotations
+
+import pytest
+
+from firefighter.incidents.factories import IncidentFactory
+from firefighter.incidents.models.incident import Incident
+
+
+@pytest.mark.django_db
+class TestIncidentSearch:
+    def test_search_vector_is_maintained(self) -> None:
+        incident = IncidentFactory.create(
+            title="Checkout unavailable", description="Payments time out"
+        )
+        incident.refresh_from_db()
+        assert "checkout" in incident.search_vector
+
+        Incident.objects.filter(pk=incident.pk).update(title="Search is slow")
+        incident.refresh_from_db()
+        assert "checkout" not in incident.search_vector
+        assert "slow" in incident.search_vector
+
+    def test_search_title_and_description(self) -> None:
+        in_title = IncidentFactory.create(
+            title="Payments failing", description="Nothing works"
+        )
+        in_description = IncidentFactory.create(
+            title="Checkout errors", description="The payments provider is down"
+        )
+        IncidentFactory.create(title="Slow search", description="Elasticsearch")
+
+        result, may_have_duplicates = Incident.objects.search(None, "payments")
+
+        assert list(result) == [in_title, in_description]
+        assert may_have_duplicates is False
+
+    def test_search_partial_word_and_typo(self) -> None:
+        incident = IncidentFactory.create(
+            title="Infrastructure outage", description="Nothing works"
+        )
+
+        assert list(Incident.objects.search(None, "infra")[0]) == [incident]
+        assert list(Incident.objects.search(None, "infrastrcture")[0]) == [incident]
+
+    def test_search_id_ranked_first(self) -> None:
+        incident = IncidentFactory.create(title="Outage", description="Nothing works")
+        mentions_id = IncidentFactory.create(
+            title=f"Follow-up of {incident.id}", description="Nothing works"
+        )
+
+        result = list(Incident.objects.search(None, str(incident.id))[0])
+
+        assert result[0] == incident
+        assert mentions_id in result
+
+    @pytest.mark.parametrize("search_term", ["²", "٣", "①"])
+    def test_search_non_ascii_digits(self, search_term: str) -> None:
+        IncidentFactory.create(title="Outage", description="Nothing works")
+
+        assert list(Incident.objects.search(None, search_term)[0]) == []
+
+    def test_search_filtered_queryset(self) -> None:
+        incident = IncidentFactory.create(title="Database down")
+        IncidentFactory.create(title="Database slow")
+
+        result, _ = Incident.objects.search(
+            Incident.objects.filter(pk=incident.pk), "database"
+        )
+
+        assert list(result) == [incident]
+
+    def test_empty_search_returns_queryset(self) -> None:
+        queryset = Incident.objects.all()
+
+        assert Incident.objects.search(queryset, "  ")[0] is queryset
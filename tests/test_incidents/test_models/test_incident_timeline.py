@@ -0,0 +1,175 @@
+"""Tests for the timeline snapshot of the incidents, projected from their updates."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django.apps import apps
+
+from firefighter.incidents.enums import IncidentStatus
+from firefighter.incidents.factories import IncidentFactory
+from firefighter.incidents.models import IncidentRoleType, IncidentTimeline
+from firefighter.incidents.models.incident_membership import IncidentRole
+from firefighter.incidents.models.incident_timeline import build_timeline_data
+from firefighter.incidents.models.incident_update import IncidentUpdate
+
+if TYPE_CHECKING:
+    from firefighter.incidents.models.incident import Incident
+
+T0 = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def add_update(incident: Incident, event_ts: datetime, **kwargs: Any) -> IncidentUpdate:
+    return IncidentUpdate.objects.create(
+        incident=incident, created_by=incident.created_by, event_ts=event_ts, **kwargs
+    )
+
+
+@pytest.mark.django_db
+class TestIncidentTimeline:
+    def test_updates_are_projected(self) -> None:
+        incident = IncidentFactory.create()
+        add_update(incident, T0, _status=IncidentStatus.OPEN, event_type="declared")
+        add_update(incident, T0 + timedelta(hours=1), _status=IncidentStatus.MITIGATED)
+        add_update(incident, T0 - timedelta(hours=1), event_type="detected")
+        recovered = add_update(
+            incident, T0 + timedelta(hours=2), event_type="recovered"
+        )
+        add_update(incident, T0 + timedelta(hours=3), _status=IncidentStatus.CLOSED)
+
+        timeline = IncidentTimeline.objects.get(pk=incident.id)
+        assert timeline.latest_milestones == {
+            "declared": T0,
+            "detected": T0 - timedelta(hours=1),
+            "recovered": T0 + timedelta(hours=2),
+        }
+        assert timeline.latest_milestone_ids["recovered"] == str(recovered.id)
+        assert [status for status, _ in timeline.status_history] == [
+            IncidentStatus.OPEN,
+            IncidentStatus.MITIGATED,
+            IncidentStatus.CLOSED,
+        ]
+        durations = timeline.status_durations
+        assert durations[IncidentStatus.OPEN] == timedelta(hours=1)
+        assert durations[IncidentStatus.MITIGATED] == timedelta(hours=2)
+
+        # A backdated status change and a deleted milestone rebuild the snapshot
+        add_update(
+            incident, T0 + timedelta(minutes=30), _status=IncidentStatus.MITIGATING
+        )
+        recovered.delete()
+
+        timeline.refresh_from_db()
+        assert "recovered" not in timeline.latest_milestones
+        assert timeline.status_durations[IncidentStatus.OPEN] == timedelta(minutes=30)
+        assert (
+            timeline.data == IncidentTimeline.objects._build([incident.id])[incident.id]
+        )
+
+    def test_missing_milestones_from_the_snapshot(
+        self, django_assert_num_queries: Any
+    ) -> None:
+        incident = IncidentFactory.create(ignore=False)
+        for event_type in ("started", "detected", "declared"):
+            add_update(incident, T0, event_type=event_type)
+
+        # The snapshot, and the required milestone types
+        with django_assert_num_queries(2):
+            assert incident.missing_milestones() == ["recovered"]
+        assert set(incident.latest_updates_by_type) == {
+            "started",
+            "detected",
+            "declared",
+        }
+
+    def test_missing_snapshots_are_built_on_read_without_being_saved(self) -> None:
+        incidents = IncidentFactory.create_batch(2)
+        for incident in incidents:
+            add_update(incident, T0, event_type="declared")
+        IncidentTimeline.objects.filter(pk=incidents[0].id).delete()
+        IncidentTimeline.objects.filter(pk=incidents[1].id).update(data={})
+
+        timelines = IncidentTimeline.objects.get_for_incidents(
+            [incident.id for incident in incidents]
+        )
+
+        for incident in incidents:
+            assert timelines[incident.id].latest_milestones == {"declared": T0}
+        assert not IncidentTimeline.objects.filter(pk=incidents[0].id).exists()
+        assert IncidentTimeline.objects.get(pk=incidents[1].id).data == {}
+
+    def test_unsaved_incident(self) -> None:
+        incident = IncidentFactory.build(ignore=False)
+
+        assert IncidentTimeline.objects.get_for_incident(incident.id).data == (
+            build_timeline_data([], [])
+        )
+        assert "declared" in incident.missing_milestones()
+        assert not IncidentTimeline.objects.exists()
+
+    def test_updates_changed_in_bulk_rebuild_the_snapshots(self) -> None:
+        incidents = IncidentFactory.create_batch(2)
+        add_update(incidents[0], T0, event_type="detected")
+        IncidentTimeline.objects.filter(pk=incidents[0].id).update(data={})
+
+        IncidentUpdate.objects.bulk_create(
+            [
+                IncidentUpdate(
+                    incident=incident,
+                    created_by=incident.created_by,
+                    event_ts=T0,
+                    event_type="declared",
+                )
+                for incident in incidents
+            ]
+        )
+        for incident in incidents:
+            assert (
+                IncidentTimeline.objects.get(pk=incident.id).data
+                == (IncidentTimeline.objects._build([incident.id])[incident.id])
+            )
+
+        # Moved to the other incident
+        IncidentUpdate.objects.filter(event_type="detected").update(
+            incident=incidents[1]
+        )
+        assert set(
+            IncidentTimeline.objects.get(pk=incidents[0].id).latest_milestones
+        ) == {"declared"}
+        assert set(
+            IncidentTimeline.objects.get(pk=incidents[1].id).latest_milestones
+        ) == {"declared", "detected"}
+
+    def test_backfill_migration(self) -> None:
+        migration = import_module(
+            "firefighter.incidents.migrations.0039_backfill_incidenttimeline"
+        )
+        incident = IncidentFactory.create()
+        add_update(incident, T0, _status=IncidentStatus.OPEN, event_type="declared")
+        expected = IncidentTimeline.objects.get(pk=incident.id).data
+        IncidentTimeline.objects.all().delete()
+
+        migration.backfill_incident_timelines(apps, None)
+
+        assert IncidentTimeline.objects.get(pk=incident.id).data == expected
+
+    def test_role_holders(self) -> None:
+        incident = IncidentFactory.create()
+        add_update(incident, T0, _status=IncidentStatus.OPEN)
+        role_type, _ = IncidentRoleType.objects.get_or_create(
+            slug="commander",
+            defaults={"name": "Commander", "summary": "", "description": ""},
+        )
+
+        role = IncidentRole.objects.create(
+            incident=incident, user=incident.created_by, role_type=role_type
+        )
+        assert IncidentTimeline.objects.get(pk=incident.id).role_holders == {
+            "commander": [str(incident.created_by.id)]
+        }
+
+        role.delete()
+        assert IncidentTimeline.objects.get(pk=incident.id).role_holders == {}
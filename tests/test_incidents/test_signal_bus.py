@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pytest
+from django.dispatch import Signal
+from slack_sdk.errors import SlackApiError
+
+from firefighter.incidents.factories import IncidentFactory
+from firefighter.incidents.models import Incident
+from firefighter.incidents.signal_bus import (
+    deserialize_signal_kwargs,
+    lifecycle_receiver,
+    serialize_signal_kwargs,
+)
+from firefighter.incidents.signals import incident_created, incident_updated
+from firefighter.incidents.tasks.signal_bus import run_async_receiver
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+    from pytest_mock import MockerFixture
+
+SENDER = "test_signal_bus"
+ASYNC_RECEIVER = f"{__name__}.async_receiver"
+calls: list[dict[str, Any]] = []
+
+
+@lifecycle_receiver(incident_created, sender=SENDER)
+def sync_receiver(**kwargs: Any) -> None:
+    calls.append({"mode": "sync", **kwargs})
+    if kwargs.get("fail"):
+        raise RuntimeError("Receiver failed")
+
+
+@lifecycle_receiver(incident_updated, sender=SENDER, mode="async")
+def async_receiver(**kwargs: Any) -> None:
+    calls.append({"mode": "async", **kwargs})
+    if kwargs.get("fail"):
+        raise RuntimeError("Receiver failed")
+    if len(calls) <= kwargs.get("slack_errors", 0):
+        raise SlackApiError("ratelimited", response={"ok": False})
+
+
+@pytest.fixture(autouse=True)
+def _clear_calls() -> None:
+    calls.clear()
+
+
+@pytest.mark.django_db
+def test_sync_receiver(caplog: pytest.LogCaptureFixture) -> None:
+    incident = IncidentFactory.create()
+
+    with caplog.at_level(logging.DEBUG, logger="firefighter.observability"):
+        incident_created.send_robust(sender=SENDER, incident=incident)
+
+    assert [call["mode"] for call in calls] == ["sync"]
+    assert calls[0]["incident"] is incident
+    record = next(
+        record
+        for record in caplog.records
+        if getattr(record, "ff.receiver", None) == f"{__name__}.sync_receiver"
+    )
+    assert getattr(record, "ff.metric") == "signal.receiver"
+    assert getattr(record, "ff.receiver_mode") == "sync"
+    assert getattr(record, "ff.success") is True
+    assert getattr(record, "ff.duration_ms") >= 0
+
+
+@pytest.mark.django_db
+def test_sync_receiver_error_with_send_robust() -> None:
+    incident = IncidentFactory.create()
+
+    responses = incident_created.send_robust(
+        sender=SENDER, incident=incident, fail=True
+    )
+
+    assert [
+        str(response) for _, response in responses if isinstance(response, Exception)
+    ] == ["Receiver failed"]
+
+
+@pytest.mark.django_db
+def test_async_receiver_inline(caplog: pytest.LogCaptureFixture) -> None:
+    incident = IncidentFactory.create()
+
+    with caplog.at_level(logging.DEBUG, logger="firefighter.observability"):
+        # Errors are logged, and not raised to the sender
+        incident_updated.send(sender=SENDER, incident=incident, fail=True)
+
+    assert [call["mode"] for call in calls] == ["async"]
+    assert calls[0]["incident"] is incident
+    assert calls[0]["sender"] == SENDER
+    record = next(
+        record
+        for record in caplog.records
+        if getattr(record, "ff.success", True) is False
+    )
+    assert record.levelno == logging.ERROR
+    assert getattr(record, "ff.receiver_mode") == "async"
+
+
+@pytest.mark.django_db
+def test_async_receiver_on_commit(
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+    django_capture_on_commit_callbacks: Any,
+) -> None:
+    settings.FF_SIGNALS_ASYNC = True
+    delay: MagicMock = mocker.patch.object(run_async_receiver, "delay")
+    incident = IncidentFactory.create()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        incident_updated.send(
+            sender=SENDER, incident=incident, updated_fields=["title"]
+        )
+        # Nothing runs before commit
+        delay.assert_not_called()
+
+    assert calls == []
+    (call,) = [call for call in delay.call_args_list if call.args[0] == ASYNC_RECEIVER]
+    assert call.args == (
+        ASYNC_RECEIVER,
+        "incident_updated",
+        SENDER,
+        {
+            "incident": {"model": "incidents.incident", "pk": str(incident.pk)},
+            "updated_fields": ["title"],
+        },
+    )
+
+    run_async_receiver(*call.args)
+
+    assert calls[0]["incident"] == incident
+    assert calls[0]["updated_fields"] == ["title"]
+
+
+@pytest.mark.django_db
+def test_async_receiver_broker_unavailable(
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+    django_capture_on_commit_callbacks: Any,
+) -> None:
+    settings.FF_SIGNALS_ASYNC = True
+    mocker.patch.object(
+        run_async_receiver, "delay", side_effect=ConnectionError("No broker")
+    )
+    incident = IncidentFactory.create()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        incident_updated.send(sender=SENDER, incident=incident)
+
+    assert calls[0]["incident"] == incident
+
+
+@pytest.mark.django_db
+def test_async_receiver_retried_on_slack_error() -> None:
+    incident = IncidentFactory.create()
+    payload = serialize_signal_kwargs({"incident": incident, "slack_errors": 2})
+
+    run_async_receiver.apply(args=(ASYNC_RECEIVER, "incident_updated", SENDER, payload))
+
+    assert len(calls) == 3
+
+
+@pytest.mark.django_db
+def test_signal_kwargs_round_trip() -> None:
+    incident = IncidentFactory.create()
+
+    payload = serialize_signal_kwargs({"incident": incident, "fields": ["title"]})
+    kwargs = deserialize_signal_kwargs(payload)
+
+    assert kwargs["incident"] == incident
+    assert kwargs["fields"] == ["title"]
+
+    Incident.objects.filter(pk=incident.pk).delete()
+    run_async_receiver(
+        ASYNC_RECEIVER,
+        "incident_updated",
+        SENDER,
+        payload,
+    )
+    assert calls == []
+
+
+def test_lifecycle_receiver_unknown_signal() -> None:
+    with pytest.raises(ValueError, match="not an incident lifecycle signal"):
+        lifecycle_receiver(Signal())
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from django.contrib.admin.sites import site
+from django.core.cache import cache
+from django.test import Client, RequestFactory
+from django.urls import reverse
+
+from firefighter.incidents.factories import (
+    IncidentCategoryFactory,
+    IncidentFactory,
+    UserFactory,
+)
+from firefighter.incidents.models.incident_membership import IncidentRole
+from firefighter.incidents.models.incident_role_type import IncidentRoleType
+from firefighter.incidents.models.user import User
+from firefighter.incidents.user_stats import (
+    USER_STATS_CACHE_KEY,
+    get_user_incident_stats,
+)
+from firefighter.slack.factories import SlackConversationFactory
+from firefighter.slack.models.user_group import UserGroup
+
+
+@pytest.fixture
+def commander_role_type() -> IncidentRoleType:
+    role_type, _ = IncidentRoleType.objects.get_or_create(
+        slug="commander",
+        defaults={
+            "name": "Commander",
+            "summary": "cmd",
+            "description": "Commander role",
+        },
+    )
+    return role_type
+
+
+@pytest.fixture
+def user() -> User:
+    user = UserFactory.create()
+    cache.delete(USER_STATS_CACHE_KEY.format(user_id=user.id))
+    return user
+
+
+@pytest.mark.django_db
+def test_get_user_incident_stats(
+    user: User, commander_role_type: IncidentRoleType, django_assert_num_queries: Any
+) -> None:
+    incidents = IncidentFactory.create_batch(2, created_by=user)
+    IncidentRole.objects.create(
+        incident=incidents[0], user=user, role_type=commander_role_type
+    )
+
+    with django_assert_num_queries(1):
+        stats = get_user_incident_stats(user.id)
+    assert stats == {"incidents_opened": 2, "roles": {"commander": 1}}
+
+    with django_assert_num_queries(0):
+        assert get_user_incident_stats(user.id) == stats
+
+
+@pytest.mark.django_db
+def test_user_incident_stats_invalidation(
+    user: User, commander_role_type: IncidentRoleType
+) -> None:
+    other_user = UserFactory.create()
+    incident = IncidentFactory.create(created_by=user)
+    role = IncidentRole.objects.create(
+        incident=incident, user=user, role_type=commander_role_type
+    )
+    assert get_user_incident_stats(user.id)["roles"] == {"commander": 1}
+    assert get_user_incident_stats(other_user.id)["roles"] == {}
+
+    # The role is reassigned: both users are invalidated
+    role.user = other_user
+    role.save()
+    assert get_user_incident_stats(user.id)["roles"] == {}
+    assert get_user_incident_stats(other_user.id)["roles"] == {"commander": 1}
+
+    incident.delete()
+    assert get_user_incident_stats(user.id)["incidents_opened"] == 0
+    assert get_user_incident_stats(other_user.id)["roles"] == {}
+
+
+@pytest.mark.django_db
+def test_user_detail_view(
+    client: Client, admin_user: User, user: User, django_assert_max_num_queries: Any
+) -> None:
+    client.force_login(admin_user)
+    incident_category = IncidentCategoryFactory.create()
+    usergroup = UserGroup.objects.create(name="team", usergroup_id="S_TEAM")
+    usergroup.incident_categories.add(incident_category)
+    usergroup.members.add(user, *UserFactory.create_batch(2))
+    conversation = SlackConversationFactory.create(tag="team_channel")
+    conversation.incident_categories.add(incident_category)
+    conversation.members.add(user)
+    UserGroup.objects.create(name="other", usergroup_id="S_OTHER").members.add(user)
+
+    # The number of queries does not depend on the number of groups or members
+    with django_assert_max_num_queries(6):
+        response = client.get(reverse("incidents:user-detail", args=[user.id]))
+
+    assert response.status_code == 200
+    assert list(response.context["usergroups"]) == [usergroup]
+    assert response.context["usergroups"][0].members_count == 3
+    assert [c.channel_id for c in response.context["conversations"]] == [
+        conversation.channel_id
+    ]
+    assert response.context["conversations"][0].members_count == 1
+
+
+@pytest.mark.django_db
+def test_user_admin_counts(
+    user: User,
+    admin_user: User,
+    commander_role_type: IncidentRoleType,
+    django_assert_num_queries: Any,
+) -> None:
+    incidents = IncidentFactory.create_batch(2, created_by=user)
+    for incident in incidents:
+        IncidentRole.objects.create(
+            incident=incident, user=user, role_type=commander_role_type
+        )
+    request = RequestFactory().get("/")
+    request.user = admin_user
+    user_admin = site._registry[User]
+
+    # The counts of all the users are read from the same query
+    with django_assert_num_queries(1):
+        users = {obj.id: obj for obj in user_admin.get_queryset(request)}
+        assert user_admin.commander_count(users[user.id]) == 2
+        assert user_admin.communication_lead_count(users[user.id]) == 0
+        assert user_admin.incidents_opened_count(users[user.id]) == 2
+        assert user_admin.incidents_opened_count(users[admin_user.id]) == 0
@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import logging
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import pytest
+from django.utils import timezone
 
 from firefighter.incidents.views.date_filter import (
+    _parse_moment,
+    _parse_moment_natural,
     get_date_range_from_calendar_value,
     get_date_range_from_special_date,
     get_range_look_args,
     parse_date_natural,
+    parse_moment,
 )
 from firefighter.incidents.views.date_utils import (
     TZ,
@@ -206,3 +211,88 @@ def test_get_range_look_args(gte, lte, field_name, expected):
 def test_get_date_range_from_calendar_value(date_range, expected):
     result = get_date_range_from_calendar_value(date_range)
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("unparsed_date", "expected"),
+    [
+        (
+            "2022-Q1",
+            (
+                datetime(2022, 1, 3, tzinfo=TZ),
+                datetime(2022, 4, 3, 23, 59, 59, 999999, tzinfo=TZ),
+            ),
+        ),
+        (
+            "2022-W20",
+            (
+                datetime(2022, 5, 16, tzinfo=TZ),
+                datetime(2022, 5, 22, 23, 59, 59, 999999, tzinfo=TZ),
+            ),
+        ),
+        (
+            "2022-05-01",
+            (
+                datetime(2022, 5, 1, tzinfo=TZ),
+                datetime(2022, 5, 1, 23, 59, 59, 999999, tzinfo=TZ),
+            ),
+        ),
+        (
+            "2022-05",
+            (
+                datetime(2022, 5, 1, tzinfo=TZ),
+                datetime(2022, 5, 31, 23, 59, 59, 999999, tzinfo=TZ),
+            ),
+        ),
+        (
+            "2022-05-01 - 2022-Q3",
+            (
+                datetime(2022, 5, 1, tzinfo=TZ),
+                datetime(2022, 10, 2, 23, 59, 59, 999999, tzinfo=TZ),
+            ),
+        ),
+        ("2022-", (datetime(2022, 1, 1, tzinfo=TZ), None)),
+    ],
+)
+def test_parse_date_range_without_dateparser(unparsed_date, expected) -> None:
+    with patch(
+        "firefighter.incidents.views.date_filter.parse_date_natural",
+        side_effect=AssertionError("dateparser should not be used"),
+    ):
+        assert get_date_range_from_special_date(unparsed_date)[:2] == expected
+
+
+def test_parse_moment_relative_aliases() -> None:
+    assert parse_moment("Last  Week") == parse_moment("last_week")
+    assert parse_moment("this week") == parse_moment("current_week")
+
+
+def test_parse_moment_memoized() -> None:
+    _parse_moment.cache_clear()
+    _parse_moment_natural.cache_clear()
+    with patch(
+        "firefighter.incidents.views.date_filter.parse_date_natural",
+        wraps=parse_date_natural,
+    ) as parse_date_natural_mock:
+        assert parse_moment("1 may 2022") == parse_moment(" 1 May 2022")
+
+    parse_date_natural_mock.assert_called_once_with("1 may 2022")
+
+
+def test_parse_moment_natural_memoized_per_minute(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _parse_moment_natural.cache_clear()
+    now = datetime(2022, 5, 2, 0, 59, 30, tzinfo=UTC)
+    monkeypatch.setattr(timezone, "now", lambda: now)
+    with patch(
+        "firefighter.incidents.views.date_filter.parse_date_natural",
+        wraps=parse_date_natural,
+    ) as parse_date_natural_mock:
+        assert parse_moment("now") == parse_moment("Now")
+        assert parse_date_natural_mock.call_count == 1
+
+        # Values relative to the current time are parsed again the next minute
+        now += timedelta(minutes=1)
+        parse_moment("now")
+        assert parse_date_natural_mock.call_count == 2
@@ -18,7 +18,7 @@ def mock_jira_api():
 @pytest.fixture
 def jira_client(mock_jira_api):
     """Create a JiraClient with mocked JIRA API."""
-    with patch("firefighter.jira_app.client.JIRA", return_value=mock_jira_api):
+    with patch("jira.JIRA", return_value=mock_jira_api):
         client = JiraClient()
         client.jira = mock_jira_api
         return client
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from django.core.cache import cache
+
+from firefighter.incidents.factories import UserFactory
+from firefighter.jira_app import account_cache
+from firefighter.jira_app.models import JiraUser
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+    from firefighter.jira_app.client import JiraClient
+
+
+@pytest.fixture(autouse=True)
+def clear_account_cache() -> None:
+    """The accounts cached by another test (or run) may point to users that were rolled back."""
+    cache.clear()
+    account_cache._local_cache.clear()
+
+
+@pytest.mark.django_db
+def test_resolve_jira_accounts_in_bulk(
+    jira_client: JiraClient,
+    mock_jira_api: Mock,
+    django_assert_num_queries: Any,
+    django_capture_on_commit_callbacks: Any,
+) -> None:
+    mapped = JiraUser.objects.create(
+        id="acc-cache-mapped", user=UserFactory.create(email="mapped@example.com")
+    )
+    new_user = UserFactory.create(email="new@example.com")
+    mock_jira_api._get_json.return_value = {
+        "values": [
+            {
+                "accountId": "acc-cache-new",
+                "displayName": "New",
+                "emailAddress": "new@example.com",
+            },
+        ]
+    }
+    account_ids = ["acc-cache-mapped", "acc-cache-new", "acc-cache-unknown"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        jira_users = jira_client.get_jira_users_from_jira_ids(account_ids)
+
+    assert jira_users == {
+        "acc-cache-mapped": mapped,
+        "acc-cache-new": JiraUser.objects.get(user=new_user),
+    }
+    # The unknown accounts are fetched with one call
+    mock_jira_api._get_json.assert_called_once_with(
+        "user/bulk",
+        params={"accountId": ["acc-cache-new", "acc-cache-unknown"], "maxResults": 2},
+    )
+
+    # From the cache, including the account not found
+    account_cache._local_cache.clear()
+    with django_assert_num_queries(0):
+        jira_users = jira_client.get_jira_users_from_jira_ids(account_ids)
+    assert {
+        account_id: jira_user.user_id for account_id, jira_user in jira_users.items()
+    } == {"acc-cache-mapped": mapped.user_id, "acc-cache-new": new_user.id}
+    mock_jira_api._get_json.assert_called_once()
+    mock_jira_api.user.assert_not_called()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        mapped.delete()
+    assert (
+        jira_client.get_jira_users_from_jira_ids(
+            ["acc-cache-mapped"], fetch_missing=False
+        )
+        == {}
+    )
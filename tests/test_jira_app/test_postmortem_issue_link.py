@@ -13,7 +13,7 @@ class TestPostmortemIssueLink:
     """Test robust issue link creation between incident and post-mortem."""
 
     @staticmethod
-    @patch("firefighter.jira_app.client.JIRA")
+    @patch("jira.JIRA")
     def test_create_issue_link_success_first_try(mock_jira_class: MagicMock) -> None:
         """Test that issue link is created successfully on first try with 'Relates' type."""
         # Setup mock
@@ -46,7 +46,7 @@ class TestPostmortemIssueLink:
         )
 
     @staticmethod
-    @patch("firefighter.jira_app.client.JIRA")
+    @patch("jira.JIRA")
     def test_create_issue_link_fallback_to_blocks(mock_jira_class: MagicMock) -> None:
         """Test that issue link falls back to 'Blocks' type when 'Relates' fails."""
         # Setup mock
@@ -79,7 +79,7 @@ class TestPostmortemIssueLink:
         assert second_call.kwargs["type"] == "Blocks"
 
     @staticmethod
-    @patch("firefighter.jira_app.client.JIRA")
+    @patch("jira.JIRA")
     def test_create_issue_link_all_types_fail(mock_jira_class: MagicMock) -> None:
         """Test that method handles gracefully when all link types fail."""
         # Setup mock
@@ -105,7 +105,7 @@ class TestPostmortemIssueLink:
         assert mock_jira_instance.create_issue_link.call_count == 3
 
     @staticmethod
-    @patch("firefighter.jira_app.client.JIRA")
+    @patch("jira.JIRA")
     def test_create_issue_link_parent_not_found(mock_jira_class: MagicMock) -> None:
         """Test that method handles gracefully when parent issue doesn't exist."""
         # Setup mock
@@ -127,7 +127,7 @@ class TestPostmortemIssueLink:
         mock_jira_instance.create_issue_link.assert_not_called()
 
     @staticmethod
-    @patch("firefighter.jira_app.client.JIRA")
+    @patch("jira.JIRA")
     def test_create_postmortem_issue_with_link(mock_jira_class: MagicMock) -> None:
         """Test that post-mortem issue is created and linked successfully."""
         # Setup mock
@@ -164,7 +164,7 @@ class TestPostmortemIssueLink:
         mock_jira_instance.create_issue_link.assert_called_once()
 
     @staticmethod
-    @patch("firefighter.jira_app.client.JIRA")
+    @patch("jira.JIRA")
     def test_create_postmortem_issue_link_fails_but_issue_created(
         mock_jira_class: MagicMock,
     ) -> None:
@@ -3,24 +3,31 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 
 from firefighter.incidents.enums import IncidentStatus
 from firefighter.incidents.factories import IncidentFactory, UserFactory
+from firefighter.incidents.models.incident import Incident
 from firefighter.incidents.models.incident_membership import IncidentRole
 from firefighter.incidents.models.incident_role_type import IncidentRoleType
 from firefighter.incidents.models.incident_update import IncidentUpdate
 from firefighter.jira_app.client import JiraUser
 from firefighter.jira_app.models import JiraUser as JiraUserDB
-from firefighter.jira_app.service_postmortem import JiraPostMortemService
+from firefighter.jira_app.service_postmortem import (
+    JiraPostMortemService,
+    get_postmortem_timeline,
+    prerender_postmortem_timeline,
+)
 from firefighter.raid.models import JiraTicket
 
 if TYPE_CHECKING:
-    from firefighter.incidents.models.incident import Incident
+    from collections.abc import Iterator
+
     from firefighter.incidents.models.user import User
 
 
@@ -414,3 +421,96 @@ class TestJiraPostMortemService:
         # Verify platform prefix is removed
         assert "customfield_10201" in fields
         assert fields["customfield_10201"] == {"value": "DE"}
+
+
+@pytest.mark.django_db
+class TestPostMortemPipeline:
+    """Test the pre-rendered timeline and the steps after the creation."""
+
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def clear_timeline_cache() -> Iterator[None]:
+        cache.clear()
+        yield
+        cache.clear()
+
+    @staticmethod
+    def test_prerendered_timeline_until_update(
+        django_assert_num_queries: Any,
+    ) -> None:
+        user: User = UserFactory.create()
+        incident: Incident = IncidentFactory.create(
+            _status=IncidentStatus.OPEN, created_by=user
+        )
+        timeline = prerender_postmortem_timeline(incident.id)
+
+        incident = Incident.objects.select_related("priority").get(pk=incident.pk)
+        with django_assert_num_queries(0):
+            assert get_postmortem_timeline(incident) == timeline
+
+        IncidentUpdate.objects.create(
+            incident=incident,
+            status=IncidentStatus.MITIGATED,
+            event_ts=timezone.now(),
+            created_by=user,
+        )
+        assert "Status changed to: Mitigated" in get_postmortem_timeline(incident)
+
+    @staticmethod
+    def test_prerendered_timeline_with_update_before_version_read() -> None:
+        user: User = UserFactory.create()
+        incident: Incident = IncidentFactory.create(
+            _status=IncidentStatus.OPEN, created_by=user
+        )
+        add = cache.add
+
+        def add_after_update(*args: Any, **kwargs: Any) -> bool:
+            # Committed just before the version of the timeline is read
+            IncidentUpdate.objects.create(
+                incident=incident,
+                status=IncidentStatus.MITIGATED,
+                event_ts=timezone.now(),
+                created_by=user,
+            )
+            return add(*args, **kwargs)
+
+        with patch.object(cache, "add", side_effect=add_after_update):
+            timeline = prerender_postmortem_timeline(incident.id)
+
+        assert "Status changed to: Mitigated" in timeline
+        assert get_postmortem_timeline(incident) == timeline
+
+    @staticmethod
+    def test_links_and_assigns_after_creation() -> None:
+        service = JiraPostMortemService()
+        mock_client = MagicMock()
+        mock_client.create_postmortem_issue.return_value = {"id": "1", "key": "INC-1"}
+        service.client = mock_client
+
+        user: User = UserFactory.create()
+        incident: Incident = IncidentFactory.create(
+            _status=IncidentStatus.POST_MORTEM, created_by=user
+        )
+        jira_user = JiraUserDB.objects.create(id="acct-commander", user=user)
+        JiraTicket.objects.create(
+            id=12347, incident=incident, key="RAID-1", reporter=jira_user
+        )
+        role_type, _ = IncidentRoleType.objects.get_or_create(
+            slug="commander",
+            defaults={"name": "Commander", "summary": "cmd", "description": "cmd"},
+        )
+        IncidentRole.objects.create(incident=incident, user=user, role_type=role_type)
+
+        jira_pm = service.create_postmortem_for_incident(incident, created_by=user)
+
+        assert jira_pm.jira_issue_key == "INC-1"
+        assert "parent_issue_key" not in (
+            mock_client.create_postmortem_issue.call_args.kwargs
+        )
+        mock_client.link_postmortem_issue.assert_called_once_with(
+            parent_issue_key="RAID-1", postmortem_issue_key="INC-1"
+        )
+        mock_client.assign_issue.assert_called_once_with(
+            issue_key="INC-1", account_id="acct-commander"
+        )
+        mock_client.get_jira_user_from_user.assert_not_called()
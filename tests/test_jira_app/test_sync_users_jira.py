@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+
+from firefighter.incidents.factories import UserFactory
+from firefighter.jira_app import account_cache
+from firefighter.jira_app.client import JiraUserNotFoundError, is_jira_user_not_found
+from firefighter.jira_app.models import JiraUser
+from firefighter.jira_app.tasks import sync_users_jira
+
+if TYPE_CHECKING:
+    from firefighter.jira_app.client import JiraClient
+
+
+@pytest.fixture
+def directory(
+    jira_client: JiraClient, mock_jira_api: Mock, monkeypatch: pytest.MonkeyPatch
+) -> Mock:
+    monkeypatch.setattr(sync_users_jira, "client", jira_client)
+    monkeypatch.setattr("firefighter.jira_app.client.JIRA_DIRECTORY_PAGE_SIZE", 2)
+    mock_jira_api._get_json.side_effect = [
+        [
+            {
+                "accountId": "acc-john",
+                "accountType": "atlassian",
+                "active": True,
+                "emailAddress": "John.Doe@example.com",
+            },
+            {"accountId": "acc-bot", "accountType": "app", "active": True},
+        ],
+        [
+            {
+                "accountId": "acc-jane",
+                "accountType": "atlassian",
+                "active": True,
+                "emailAddress": "jane.doe@other.example.com",
+            },
+        ],
+        [],
+    ]
+    return mock_jira_api
+
+
+@pytest.mark.django_db
+def test_sync_jira_users_from_directory(directory: Mock) -> None:
+    john = UserFactory.create(email="john.doe@example.com", username="john.doe")
+    jane = UserFactory.create(email="jane.doe@example.com", username="jane.doe")
+    missing = UserFactory.create(email="missing@example.com", username="missing")
+    mapped = UserFactory.create(email="mapped@example.com", username="mapped")
+    JiraUser.objects.create(id="acc-mapped", user=mapped)
+    # Not matched in the directory, which hides their email address
+    hidden = UserFactory.create(email="hidden@example.com", username="hidden")
+    hidden_account = Mock(raw={"accountId": "acc-hidden"})
+    directory.search_users.side_effect = lambda query: (
+        [hidden_account] if query == "hidden" else []
+    )
+
+    # Resolved as not found by a webhook before the sync
+    account_cache.cache_accounts_not_found(["acc-john"])
+
+    assert sync_users_jira.sync_jira_users_from_directory() == 3
+
+    # One request per page, until an empty one
+    assert directory._get_json.call_count == 3
+    # Only the users not matched in the directory are searched
+    queries = {call.kwargs["query"] for call in directory.search_users.mock_calls}
+    assert {"hidden", "missing"} <= queries
+    assert not {"john.doe", "jane.doe", "mapped"} & queries
+    assert dict(JiraUser.objects.values_list("user_id", "id")) == {
+        john.id: "acc-john",
+        jane.id: "acc-jane",
+        mapped.id: "acc-mapped",
+        hidden.id: "acc-hidden",
+    }
+    assert account_cache.get_cached_accounts(["acc-john"]) == {}
+    assert is_jira_user_not_found(missing.id)
+    assert not is_jira_user_not_found(hidden.id)
+    assert not is_jira_user_not_found(john.id)
+
+    # The users not found by the search are not searched again
+    directory._get_json.side_effect = [[], []]
+    directory.search_users.reset_mock()
+    assert sync_users_jira.sync_jira_users_from_directory() == 0
+    directory.search_users.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_user_not_found_is_cached(jira_client: JiraClient, mock_jira_api: Mock) -> None:
+    user = UserFactory.create(email="nobody@example.com", username="nobody")
+    mock_jira_api.search_users.return_value = []
+
+    for _ in range(2):
+        with pytest.raises(JiraUserNotFoundError):
+            jira_client.get_jira_user_from_user(user)
+    mock_jira_api.search_users.assert_called_once_with(query="nobody")
@@ -0,0 +1,144 @@
+"""Tests for the current on-call snapshot of PagerDuty."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import pytest
+from django.apps import apps
+from django.core.cache import cache
+from django.utils import timezone
+
+from firefighter.incidents.factories import UserFactory
+
+if TYPE_CHECKING:
+    from firefighter.pagerduty.models import PagerDutyOncall
+
+pytestmark = pytest.mark.skipif(
+    not apps.is_installed("firefighter.pagerduty"),
+    reason="PagerDuty app not installed",
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_snapshot() -> None:
+    cache.clear()
+
+
+@pytest.fixture
+def oncalls() -> list[PagerDutyOncall]:
+    """Two on-call levels of a policy shared by two services, with another service in between, and one of another policy."""
+    from firefighter.pagerduty.models import (
+        PagerDutyEscalationPolicy,
+        PagerDutyOncall,
+        PagerDutyService,
+        PagerDutyUser,
+    )
+
+    shared = PagerDutyEscalationPolicy.objects.create(pagerduty_id="EP1", name="Shared")
+    other = PagerDutyEscalationPolicy.objects.create(pagerduty_id="EP2", name="Other")
+    # The on-calls are ordered by service
+    for number, policy in enumerate((shared, other, shared), start=1):
+        PagerDutyService.objects.create(
+            id=UUID(int=number),
+            name=f"S{number}",
+            status="active",
+            summary=f"S{number}",
+            api_url=f"https://api.pagerduty.com/services/S{number}",
+            web_url=f"https://example.pagerduty.com/services/S{number}",
+            pagerduty_id=f"S{number}",
+            escalation_policy=policy,
+        )
+    now = timezone.now()
+    return [
+        PagerDutyOncall.objects.create(
+            escalation_policy=policy,
+            pagerduty_user=PagerDutyUser.objects.create(
+                user=UserFactory.create(), pagerduty_id=f"U{hours}"
+            ),
+            escalation_level=level,
+            start=now - timedelta(hours=1),
+            end=now + timedelta(hours=hours),
+        )
+        for policy, level, hours in ((shared, 1, 1), (shared, 2, 2), (other, 1, 3))
+    ]
+
+
+def as_ids(oncalls_grouped: list[tuple[Any, list[PagerDutyOncall]]]) -> list[Any]:
+    return [
+        (policy.id, [oncall.id for oncall in group])
+        for policy, group in oncalls_grouped
+    ]
+
+
+@pytest.mark.django_db
+def test_snapshot_matches_the_current_oncalls(
+    oncalls: list[PagerDutyOncall], django_assert_num_queries: Any
+) -> None:
+    from firefighter.pagerduty.models import PagerDutyOncall
+
+    expected = as_ids(
+        PagerDutyOncall.objects._compute_current_oncalls_per_escalation_policy()
+    )
+    # One group per service: the shared policy appears twice
+    assert [policy_id for policy_id, _ in expected] == [
+        oncalls[0].escalation_policy_id,
+        oncalls[2].escalation_policy_id,
+        oncalls[0].escalation_policy_id,
+    ]
+    assert (
+        as_ids(PagerDutyOncall.objects.get_current_oncalls_per_escalation_policy())
+        == expected
+    )
+
+    # From the snapshot: a single primary key query
+    with django_assert_num_queries(1):
+        oncalls_grouped = (
+            PagerDutyOncall.objects.get_current_oncalls_per_escalation_policy()
+        )
+    assert as_ids(oncalls_grouped) == expected
+
+
+@pytest.mark.django_db
+def test_snapshot_expires_at_the_next_shift_boundary(
+    oncalls: list[PagerDutyOncall], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from firefighter.pagerduty.models import PagerDutyOncall
+
+    snapshot = PagerDutyOncall.objects.get_current_oncalls_snapshot()
+    assert snapshot["valid_until"] == oncalls[0].end.timestamp()
+
+    # After the end of the first shift
+    now = oncalls[0].end + timedelta(minutes=1)
+    monkeypatch.setattr(timezone, "now", lambda: now)
+    assert oncalls[0].id not in {
+        oncall.id
+        for _, group in PagerDutyOncall.objects.get_current_oncalls_per_escalation_policy()
+        for oncall in group
+    }
+    assert PagerDutyOncall.objects.get_current_oncalls_snapshot()["valid_until"] == (
+        oncalls[1].end.timestamp()
+    )
+
+
+@pytest.mark.django_db
+def test_snapshot_with_a_deleted_oncall_is_rebuilt(
+    oncalls: list[PagerDutyOncall],
+) -> None:
+    from firefighter.pagerduty.models import PagerDutyOncall
+
+    PagerDutyOncall.objects.refresh_current_oncalls_snapshot()
+    oncalls[0].delete()
+
+    assert as_ids(
+        PagerDutyOncall.objects.get_current_oncalls_per_escalation_policy()
+    ) == as_ids(
+        PagerDutyOncall.objects._compute_current_oncalls_per_escalation_policy()
+    )
+    assert str(oncalls[0].id) not in {
+        oncall_id
+        for group in PagerDutyOncall.objects.get_current_oncalls_snapshot()["groups"]
+        for oncall_id in group
+    }
@@ -395,7 +395,9 @@ class TestSendMessageToWatchers:
             {"accountId": "jira-watcher", "accountType": "atlassian"}
         ]
         mock_jira_client.get_watchers_from_jira_ticket.return_value = watchers
-        mock_jira_client.get_jira_user_from_jira_id.return_value = jira_user
+        mock_jira_client.get_jira_users_from_jira_ids.return_value = {
+            "jira-watcher": jira_user
+        }
         mock_message = Mock()
 
         # When
@@ -419,7 +421,9 @@ class TestSendMessageToWatchers:
             {"accountId": "jira-watcher", "accountType": "atlassian"}
         ]
         mock_jira_client.get_watchers_from_jira_ticket.return_value = watchers
-        mock_jira_client.get_jira_user_from_jira_id.return_value = jira_user
+        mock_jira_client.get_jira_users_from_jira_ids.return_value = {
+            "jira-watcher": jira_user
+        }
         mock_message = Mock()
 
         # When
@@ -440,7 +444,9 @@ class TestSendMessageToWatchers:
             {"accountId": "jira-watcher", "accountType": "atlassian"}
         ]
         mock_jira_client.get_watchers_from_jira_ticket.return_value = watchers
-        mock_jira_client.get_jira_user_from_jira_id.return_value = jira_user
+        mock_jira_client.get_jira_users_from_jira_ids.return_value = {
+            "jira-watcher": jira_user
+        }
         mock_message = Mock()
 
         # When
@@ -473,7 +479,7 @@ class TestSendMessageToWatchers:
 
         # Then
         assert result is True
-        mock_jira_client.get_jira_user_from_jira_id.assert_not_called()
+        mock_jira_client.get_jira_users_from_jira_ids.assert_not_called()
 
 
 @pytest.mark.django_db
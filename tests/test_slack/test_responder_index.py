@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from firefighter.incidents.factories import (
+    IncidentCategoryFactory,
+    IncidentFactory,
+    UserFactory,
+)
+from firefighter.incidents.models import IncidentCategory, Priority, User
+from firefighter.slack.factories import SlackConversationFactory, SlackUserFactory
+from firefighter.slack.models.user_group import UserGroup
+from firefighter.slack.responder_index import (
+    ALL_PUBLIC_P1_TAG,
+    get_responder_ids,
+)
+from firefighter.slack.signals.get_users import get_invites_from_slack
+
+
+def _slack_user(**kwargs: Any) -> User:
+    return SlackUserFactory.create(user=UserFactory.create(**kwargs)).user
+
+
+@pytest.fixture
+def incident_category() -> IncidentCategory:
+    return IncidentCategoryFactory.create()
+
+
+@pytest.fixture
+def usergroup(incident_category: IncidentCategory) -> UserGroup:
+    usergroup = UserGroup.objects.create(name="team", usergroup_id="S_TEAM")
+    usergroup.incident_categories.add(incident_category)
+    return usergroup
+
+
+@pytest.mark.django_db
+def test_get_invites_from_slack(
+    incident_category: IncidentCategory, usergroup: UserGroup
+) -> None:
+    member = _slack_user()
+    inactive_member = _slack_user(is_active=False)
+    member_without_slack = UserFactory.create()
+    usergroup.members.add(member, inactive_member, member_without_slack)
+    conversation = SlackConversationFactory.create()
+    conversation.incident_categories.add(incident_category)
+    conversation_member = _slack_user()
+    conversation.members.add(conversation_member)
+    p1_usergroup = UserGroup.objects.create(
+        name="leadership", usergroup_id="S_P1", tag=ALL_PUBLIC_P1_TAG
+    )
+    p1_member = _slack_user()
+    p1_usergroup.members.add(p1_member)
+
+    incident = IncidentFactory.create(
+        incident_category=incident_category,
+        priority=Priority.objects.get(value=2),
+    )
+    assert get_invites_from_slack(incident) == {member, conversation_member}
+
+    incident.priority = Priority.objects.get(value=1)
+    incident.private = False
+    assert get_invites_from_slack(incident) == {
+        member,
+        conversation_member,
+        p1_member,
+    }
+
+    incident.private = True
+    assert p1_member not in get_invites_from_slack(incident)
+
+
+@pytest.mark.django_db
+def test_get_invites_from_slack_cached(
+    incident_category: IncidentCategory,
+    usergroup: UserGroup,
+    django_assert_num_queries: Any,
+) -> None:
+    member = _slack_user()
+    usergroup.members.add(member)
+    incident = IncidentFactory.create(
+        incident_category=incident_category,
+        priority=Priority.objects.get(value=1),
+        private=False,
+    )
+    get_invites_from_slack(incident)
+
+    # Only the users are loaded, the responders are read from the cache
+    with django_assert_num_queries(1):
+        assert member in get_invites_from_slack(incident)
+
+
+@pytest.mark.django_db
+def test_responder_index_invalidation(
+    incident_category: IncidentCategory, usergroup: UserGroup
+) -> None:
+    member = _slack_user()
+    usergroup.members.add(member)
+    assert get_responder_ids(incident_category.id) == {str(member.id)}
+
+    # Members synced from Slack
+    new_member = _slack_user()
+    usergroup.members.set([new_member])
+    assert get_responder_ids(incident_category.id) == {str(new_member.id)}
+
+    # Membership changed from the user side
+    member.usergroup_set.add(usergroup)
+    assert get_responder_ids(incident_category.id) == {
+        str(member.id),
+        str(new_member.id),
+    }
+
+    # Usergroup unlinked from the incident category
+    incident_category.usergroups.clear()
+    assert get_responder_ids(incident_category.id) == set()
+
+    usergroup.incident_categories.add(incident_category)
+    assert get_responder_ids(incident_category.id) == {
+        str(member.id),
+        str(new_member.id),
+    }
+
+    usergroup.delete()
+    assert get_responder_ids(incident_category.id) == set()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+from slack_sdk.errors import SlackApiError
+
+from firefighter.slack.slack_app import get_slack_app_details
+
+AUTH_TEST = {
+    "ok": True,
+    "url": "https://example.slack.com/",
+    "team": "Example",
+    "user": "firefighter",
+    "team_id": "T123",
+    "user_id": "U123",
+    "bot_id": "B123",
+    "is_enterprise_install": False,
+}
+
+
+@pytest.fixture
+def _slack_checks(settings: SettingsWrapper) -> None:
+    settings.FF_SLACK_SKIP_CHECKS = False
+    # Fresh cache entry, as the key depends on the token
+    settings.SLACK_BOT_TOKEN = f"xoxb-{id(settings)}"
+
+
+@pytest.mark.usefixtures("_slack_checks")
+def test_get_slack_app_details_cached() -> None:
+    client = MagicMock()
+    client.auth_test.return_value = AUTH_TEST
+
+    assert get_slack_app_details(client)["user_id"] == "U123"
+    assert get_slack_app_details(client)["team_id"] == "T123"
+    client.auth_test.assert_called_once()
+
+
+@pytest.mark.usefixtures("_slack_checks")
+def test_get_slack_app_details_invalid_token() -> None:
+    client = MagicMock()
+    client.auth_test.side_effect = SlackApiError(
+        "invalid_auth", response={"ok": False, "error": "invalid_auth"}
+    )
+
+    with pytest.raises(RuntimeError, match="Could not verify Slack credentials"):
+        get_slack_app_details(client)